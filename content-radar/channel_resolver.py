@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Channel Resolver - YouTube channel URL / @handle -> channel ID, cached in channel_ids.json
+Reads the channel ID from the page <head> (first few KB only), falls back to a
+single-item yt-dlp extract, and re-checks entries older than STALE_AFTER_DAYS
+Usage:
+  python channel_resolver.py              # Resolve every competitor not cached yet
+  python channel_resolver.py --refresh    # Also re-resolve stale entries
+"""
+
+import json
+import os
+import re
+import subprocess
+import sys
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add venv packages to path
+VENV_PATH = Path(__file__).parent / "venv" / "lib"
+for p in VENV_PATH.glob("python*/site-packages"):
+    sys.path.insert(0, str(p))
+
+import fetch_engine
+
+# Paths
+BASE_DIR = Path(__file__).parent
+CHANNEL_IDS_PATH = BASE_DIR / "channel_ids.json"
+COMPETITORS_PATH = BASE_DIR.parent / "competitors.json"
+
+# Channel IDs practically never change; re-check now and then for renamed handles
+STALE_AFTER_DAYS = 30
+
+# A URL that no resolver could handle is retried after 1h, 2h, 4h, ... up to a week
+FAILED_RETRY_HOURS = 1
+FAILED_RETRY_MAX_HOURS = 7 * 24
+
+# Stop reading a channel page after this much if </head> hasn't shown up
+HEAD_MAX_BYTES = 512 * 1024
+
+CHANNEL_ID_PATTERN = re.compile(r"channel/(UC[\w-]{22})")
+HEAD_PATTERNS = [
+    re.compile(r'<meta itemprop="(?:channelId|identifier)" content="(UC[\w-]{22})"'),
+    re.compile(r'<link rel="canonical" href="https://www\.youtube\.com/channel/(UC[\w-]{22})"'),
+    re.compile(r'<meta property="og:url" content="https://www\.youtube\.com/channel/(UC[\w-]{22})"'),
+]
+
+# Skips the EU consent interstitial, which has no channel meta
+CONSENT_COOKIES = {"CONSENT": "YES+1"}
+
+_lock = threading.Lock()
+_refreshing = set()
+
+
+def load_cache():
+    """{"channels": {url: channel ID}, "resolved": {url: ISO time},
+        "failed": {url: {"at": ISO time, "attempts": n}}}"""
+    if CHANNEL_IDS_PATH.exists():
+        cache = json.loads(CHANNEL_IDS_PATH.read_text())
+    else:
+        cache = {}
+    cache.setdefault("channels", {})
+    cache.setdefault("resolved", {})
+    cache.setdefault("failed", {})
+    return cache
+
+
+def _store(new_ids, failed=()):
+    """Merge freshly resolved {url: channel ID} and failed URLs into channel_ids.json"""
+    now = datetime.now().isoformat()
+    with _lock:
+        cache = load_cache()
+        cache["channels"].update(new_ids)
+        cache["resolved"].update({url: now for url in new_ids})
+        for url in new_ids:
+            cache["failed"].pop(url, None)
+        for url in failed:
+            attempts = cache["failed"].get(url, {}).get("attempts", 0) + 1
+            cache["failed"][url] = {"at": now, "attempts": attempts}
+        tmp_path = CHANNEL_IDS_PATH.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(cache, indent=2))
+        os.replace(tmp_path, CHANNEL_IDS_PATH)
+
+
+def is_stale(cache, url):
+    """Entries without a resolve time (e.g. from extract_channel_ids.sh) count as stale"""
+    resolved = cache["resolved"].get(url)
+    if not resolved:
+        return True
+    return datetime.fromisoformat(resolved) < datetime.now() - timedelta(days=STALE_AFTER_DAYS)
+
+
+def is_backing_off(cache, url):
+    """True while a URL that failed to resolve is waiting for its next retry"""
+    failure = cache["failed"].get(url)
+    if not failure:
+        return False
+    hours = min(FAILED_RETRY_HOURS * 2 ** (failure["attempts"] - 1), FAILED_RETRY_MAX_HOURS)
+    return datetime.fromisoformat(failure["at"]) > datetime.now() - timedelta(hours=hours)
+
+
+def channel_page_url(url):
+    """Channel root page; /videos, /shorts etc. carry the same head meta"""
+    match = re.match(r"(https?://(?:www\.)?youtube\.com/(?:@[^/?#]+|c/[^/?#]+|user/[^/?#]+))", url)
+    return match.group(1) if match else url
+
+
+def id_from_head(url):
+    """Channel ID from the page head meta, reading only until </head>"""
+    resp = fetch_engine.get(channel_page_url(url), timeout=10, stream=True, cookies=CONSENT_COOKIES)
+    try:
+        if resp.status_code != 200:
+            return None
+
+        head = b""
+        for chunk in resp.iter_content(16 * 1024):
+            head += chunk
+            if b"</head>" in head or len(head) >= HEAD_MAX_BYTES:
+                break
+    finally:
+        resp.close()
+
+    text = head.decode("utf-8", errors="ignore")
+    for pattern in HEAD_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            return match.group(1)
+    return None
+
+
+def id_from_ytdlp(url):
+    """Channel ID from a single-item yt-dlp extract"""
+    result = subprocess.run(
+        ["yt-dlp", "-J", "--flat-playlist", "--playlist-items", "1", url],
+        capture_output=True, text=True, timeout=30
+    )
+    if result.returncode == 0:
+        channel_id = json.loads(result.stdout).get("channel_id") or ""
+        if channel_id.startswith("UC"):
+            return channel_id
+    return None
+
+
+# Tried in order until one returns an ID
+RESOLVERS = [id_from_head, id_from_ytdlp]
+
+
+def resolve(url):
+    """Look up a channel's ID without the cache; None if nothing worked"""
+    match = CHANNEL_ID_PATTERN.search(url)
+    if match:
+        return match.group(1)
+
+    for resolver in RESOLVERS:
+        try:
+            channel_id = resolver(url)
+            if channel_id:
+                return channel_id
+        except Exception as e:
+            print(f"Channel ID {resolver.__name__} failed for {url}: {e}")
+    return None
+
+
+def resolve_many(urls):
+    """Resolve URLs at once and cache what was found (and what failed); returns {url: channel ID}"""
+    urls = list(dict.fromkeys(urls))
+    found = {url: channel_id
+             for url, channel_id in zip(urls, fetch_engine.map_concurrent(resolve, urls))
+             if channel_id}
+    failed = [url for url in urls if url not in found]
+    if found or failed:
+        _store(found, failed)
+    return found
+
+
+def refresh_stale(urls=None):
+    """Re-resolve stale entries (all cached URLs by default)"""
+    cache = load_cache()
+    urls = cache["channels"] if urls is None else urls
+    stale = [url for url in urls
+             if url in cache["channels"] and is_stale(cache, url) and not is_backing_off(cache, url)]
+    if stale:
+        print(f"🔄 Refreshing {len(stale)} stale channel ID(s)...")
+        resolve_many(stale)
+    return stale
+
+
+def refresh_in_background(urls):
+    """Refresh stale entries on a daemon thread; a scan keeps using the cached IDs meanwhile"""
+    cache = load_cache()
+    with _lock:
+        stale = [url for url in urls
+                 if url in cache["channels"] and url not in _refreshing
+                 and is_stale(cache, url) and not is_backing_off(cache, url)]
+        _refreshing.update(stale)
+    if not stale:
+        return
+
+    def run():
+        try:
+            resolve_many(stale)
+        finally:
+            with _lock:
+                _refreshing.difference_update(stale)
+
+    threading.Thread(target=run, name="channel-refresh", daemon=True).start()
+
+
+def channel_ids_for(urls):
+    """{url: channel ID} for the given URLs
+
+    Cached IDs are returned straight away; unknown URLs are resolved now (unless
+    they failed recently and are backing off) and stale ones are refreshed in the background.
+    """
+    cache = load_cache()
+    channel_ids = cache["channels"]
+    missing = [url for url in dict.fromkeys(urls)
+               if url not in channel_ids and not is_backing_off(cache, url)]
+
+    if missing:
+        print(f"🔎 Resolving {len(missing)} new channel(s)...")
+        channel_ids.update(resolve_many(missing))
+    refresh_in_background([url for url in urls if url not in missing])
+
+    return {url: channel_ids[url] for url in urls if url in channel_ids}
+
+
+def refresh_detached():
+    """Run `--refresh` in its own process, for short-lived callers like manage.py"""
+    subprocess.Popen(
+        [sys.executable, str(Path(__file__).resolve()), "--refresh"],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True
+    )
+
+
+def all_competitor_urls():
+    competitors = json.loads(COMPETITORS_PATH.read_text()) if COMPETITORS_PATH.exists() else {}
+    return [url for data in competitors.values() for url in data.get("competitors", [])]
+
+
+if __name__ == "__main__":
+    urls = all_competitor_urls()
+    cached = load_cache()["channels"]
+    missing = [url for url in urls if url not in cached]
+    if missing:
+        print(f"🔎 Resolving {len(missing)} new channel(s)...")
+        resolve_many(missing)
+    if "--refresh" in sys.argv:
+        refresh_stale(urls)
+
+    cached = load_cache()["channels"]
+    print(f"✅ {sum(url in cached for url in urls)}/{len(urls)} competitor channel IDs cached in {CHANNEL_IDS_PATH.name}")
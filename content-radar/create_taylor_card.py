@@ -1,6 +1,5 @@
 #!/usr/bin/env python3
 
-import json
 import subprocess
 from datetime import datetime
 from pathlib import Path
@@ -13,13 +12,9 @@ VENV_PATH = BASE_DIR / "venv" / "lib"
 for p in VENV_PATH.glob("python*/site-packages"):
     sys.path.insert(0, str(p))
 
-import requests
-from urllib.parse import quote_plus
 
-# Load Trello config
-config = json.loads(Path('/Users/malikano/clawdbot_system/config.json').read_text())
-API_KEY = config['trello_api_key']
-TOKEN = config['trello_api_token']
+from radar_core import sources, trello_request
+from urllib.parse import quote_plus
 
 LIST_ID = '697b21ceab07192676734906'  # Taylor Swift list
 
@@ -44,27 +39,10 @@ def search_taylor_swift_youtube():
     return videos[:3]
 
 def search_google_news():
-    try:
-        import feedparser
-        url = f"https://news.google.com/rss/search?q=Taylor+Swift+when:1d&hl=en-US&gl=US&ceid=US:en"
-        headers = {'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'}
-        
-        response = requests.get(url, headers=headers, timeout=15)
-        if response.status_code == 200:
-            feed = feedparser.parse(response.content)
-            articles = []
-            
-            for entry in feed.entries[:3]:
-                articles.append({
-                    'title': entry.title,
-                    'source': entry.source.title if hasattr(entry, 'source') else 'Google News',
-                    'url': entry.link,
-                    'date': entry.published
-                })
-            return articles
-    except Exception as e:
-        print(f'Google News error: {e}')
-    return []
+    return [
+        {'title': a['title'], 'source': a['source'], 'url': a['url'], 'date': a.get('published', '')}
+        for a in sources.google_news('Taylor Swift', 3)
+    ]
 
 # Search for content
 print("🔍 Searching for Taylor Swift content...")
@@ -103,11 +81,7 @@ card_data = {
     'pos': 'top'
 }
 
-response = requests.post(
-    'https://api.trello.com/1/cards',
-    params={'key': API_KEY, 'token': TOKEN},
-    json=card_data
-)
+response = trello_request('POST', 'cards', json=card_data)
 
 if response.status_code == 200:
     card = response.json()
@@ -14,6 +14,8 @@ VENV_PATH = Path(__file__).parent / "venv" / "lib"
 for p in VENV_PATH.glob("python*/site-packages"):
     sys.path.insert(0, str(p))
 
+import dedup_index
+
 BASE_DIR = Path(__file__).parent
 DATA_PATH = BASE_DIR / "dashboard_data.json"
 
@@ -31,6 +33,16 @@ def save_data(data):
     DATA_PATH.write_text(json.dumps(data, indent=2))
 
 
+def card_index(data):
+    """Seen dashboard URLs/stories; seeded from the existing cards the first time"""
+    index = dedup_index.get_index("dashboard")
+    if not len(index):
+        for card in data["cards"]:
+            created = datetime.fromisoformat(card["createdAt"]).timestamp()
+            index.add(url=card.get("url"), title=card.get("title"), seen_at=created)
+    return index
+
+
 def demote_high_priority():
     """Demote all HIGH priority cards to MEDIUM"""
     data = load_data()
@@ -47,7 +59,8 @@ def demote_high_priority():
 
 def add_card(title, content_type, source, url, priority="high", 
              views=None, subscribers=None, posted_at=None, 
-             channel=None, summary=None, tags=None):
+             channel=None, summary=None, tags=None,
+             views_per_hour=None, outlier_score=None):
     """
     Add a new card to the dashboard
     
@@ -63,13 +76,15 @@ def add_card(title, content_type, source, url, priority="high",
         channel: YouTube channel name (for videos)
         summary: Brief description
         tags: List of tags
+        views_per_hour: Current view velocity (for videos)
+        outlier_score: How far the velocity stands out from other competitor videos
     """
     data = load_data()
     
-    # Check for duplicate URLs
-    existing_urls = [c.get("url") for c in data["cards"]]
-    if url in existing_urls:
-        print(f"Card with URL already exists: {url}")
+    # Check for duplicates (same URL or same story from another outlet)
+    seen = card_index(data)
+    if seen.seen(url=url, title=title):
+        print(f"Card already exists: {title[:60]}")
         return None
     
     # If new card is HIGH priority, demote existing HIGH cards to MEDIUM
@@ -86,6 +101,8 @@ def add_card(title, content_type, source, url, priority="high",
         "priority": priority,
         "createdAt": datetime.now().isoformat(),
         "views": views,
+        "viewsPerHour": views_per_hour,
+        "outlierScore": outlier_score,
         "subscribers": subscribers,
         "postedAt": posted_at,
         "channel": channel,
@@ -97,6 +114,8 @@ def add_card(title, content_type, source, url, priority="high",
     # Insert at beginning (newest first)
     data["cards"].insert(0, card)
     save_data(data)
+    seen.add(url=url, title=title)
+    seen.save()
     
     print(f"✅ Added card: [{priority.upper()}] {title}")
     return card
@@ -184,7 +203,8 @@ def add_news(title, source, url, priority="high", summary=None, tags=None):
 
 
 def add_video(title, channel, url, views, subscribers=None, 
-              posted_at=None, priority="high", tags=None):
+              posted_at=None, priority="high", tags=None,
+              views_per_hour=None, outlier_score=None):
     """Shortcut to add a video card"""
     return add_card(
         title=title,
@@ -196,7 +216,9 @@ def add_video(title, channel, url, views, subscribers=None,
         subscribers=subscribers,
         posted_at=posted_at,
         channel=channel,
-        tags=tags
+        tags=tags,
+        views_per_hour=views_per_hour,
+        outlier_score=outlier_score
     )
 
 
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Dedup Index - One "seen before?" check for every scanner and writer
+Items are keyed by normalized URL and a 64-bit SimHash of the title, so the same
+story from Google News, Reddit and GDELT collapses into one. Entries expire after
+a per-namespace window; lookups are dict hits (SimHash via 8 x 8-bit bands)
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Paths
+BASE_DIR = Path(__file__).parent
+DEDUP_PATH = BASE_DIR / "dedup_index.json"
+
+# How long each namespace remembers an item ("trello:<list>" uses "trello")
+WINDOWS_HOURS = {
+    "alerts": 48,
+    "videos": 24 * 30,     # RSS feeds keep the last 15 uploads around for weeks
+    "dashboard": 24 * 7,
+    "trello": 24,
+}
+DEFAULT_WINDOW_HOURS = 72
+
+# Titles whose fingerprints differ in at most this many bits are the same story
+MAX_DISTANCE = 6
+BANDS = 8  # 8-bit bands: any two fingerprints within 7 bits share one exactly
+
+# Titles shorter than this (in words) only dedup by URL
+MIN_TITLE_WORDS = 4
+
+TRACKING_PARAMS = {"fbclid", "gclid", "ref", "ref_src", "si", "feature", "igshid", "cmpid", "ocid"}
+STOP_WORDS = {
+    "a", "an", "the", "and", "or", "of", "to", "in", "on", "at", "for", "by", "with",
+    "is", "are", "was", "were", "be", "as", "from", "after", "new", "says", "s"
+}
+
+_file_lock = threading.Lock()
+_indexes = {}
+
+
+def normalize_url(url):
+    """Canonical form of a URL: no scheme, www, tracking params or fragment; videos by ID"""
+    if not url:
+        return ""
+    parts = urlsplit(url.strip())
+    host = (parts.hostname or "").lower()
+    for prefix in ("www.", "m.", "mobile.", "old."):
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+    query = dict(parse_qsl(parts.query))
+
+    # The same YouTube video has several URL shapes
+    if host in ("youtube.com", "youtu.be"):
+        video_id = query.get("v") if parts.path == "/watch" else None
+        if host == "youtu.be":
+            video_id = parts.path.strip("/")
+        elif parts.path.startswith("/shorts/"):
+            video_id = parts.path.split("/")[2]
+        if video_id:
+            return f"youtube:{video_id}"
+
+    query = {k: v for k, v in query.items() if not k.startswith("utm_") and k not in TRACKING_PARAMS}
+    return urlunsplit(("", host, parts.path.rstrip("/").lower(), urlencode(sorted(query.items())), ""))
+
+
+def title_tokens(title):
+    # "Headline - Reuters" / "Headline | TMZ": the outlet isn't part of the story
+    parts = re.split(r"\s+[-|–—]\s+", title or "")
+    if len(parts) > 1 and len(parts[-1].split()) <= 4:
+        parts = parts[:-1]
+    words = re.findall(r"[a-z0-9]+", " ".join(parts).lower())
+    return [w for w in words if w not in STOP_WORDS]
+
+
+def simhash(title):
+    """64-bit SimHash of a title's words and word pairs; None for short titles"""
+    tokens = title_tokens(title)
+    if len(tokens) < MIN_TITLE_WORDS:
+        return None
+
+    features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+    weights = [0] * 64
+    for feature in features:
+        h = int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), "big")
+        for bit in range(64):
+            weights[bit] += 1 if h >> bit & 1 else -1
+    return sum(1 << bit for bit in range(64) if weights[bit] > 0)
+
+
+def _bands(fingerprint):
+    width = 64 // BANDS
+    return [(i, fingerprint >> (i * width) & ((1 << width) - 1)) for i in range(BANDS)]
+
+
+def _item_fields(item, url_key, title_key, id_key):
+    return item.get(url_key), item.get(title_key) if title_key else None, item.get(id_key) if id_key else None
+
+
+class DedupIndex:
+    """Seen URLs / ids / title fingerprints for one namespace, with time-based expiry"""
+
+    def __init__(self, namespace, window_hours=None, path=DEDUP_PATH):
+        self.namespace = namespace
+        kind = namespace.split(":")[0]
+        self.window = (window_hours or WINDOWS_HOURS.get(kind, DEFAULT_WINDOW_HOURS)) * 3600
+        self.path = path
+        self._lock = threading.Lock()
+        self._keys = {}          # normalized URL or "id:<item id>" -> last seen (epoch)
+        self._titles = {}        # fingerprint -> last seen
+        self._bands = {}         # (band, value) -> set of fingerprints
+        self._dirty = False      # anything added since the last save
+        self._load()
+
+    def _load(self):
+        data = self._read().get(self.namespace, {})
+        self._keys = data.get("keys", {})
+        self._titles = {}
+        self._bands = {}
+        for fingerprint, seen_at in data.get("titles", {}).items():
+            self._add_title(int(fingerprint, 16), seen_at)
+        self.evict()
+
+    def _read(self):
+        if self.path and self.path.exists():
+            return json.loads(self.path.read_text())
+        return {}
+
+    def _add_title(self, fingerprint, seen_at):
+        self._titles[fingerprint] = seen_at
+        for band in _bands(fingerprint):
+            self._bands.setdefault(band, set()).add(fingerprint)
+
+    def _similar_title(self, fingerprint, cutoff):
+        """A fingerprint seen since cutoff within MAX_DISTANCE bits, if any"""
+        for band in _bands(fingerprint):
+            for candidate in self._bands.get(band, ()):
+                if self._titles[candidate] >= cutoff and bin(candidate ^ fingerprint).count("1") <= MAX_DISTANCE:
+                    return candidate
+        return None
+
+    def _item_keys(self, url=None, item_id=None):
+        keys = []
+        if url:
+            keys.append(normalize_url(url))
+        if item_id:
+            keys.append(f"id:{item_id}")
+        return keys
+
+    def seen(self, url=None, title=None, item_id=None):
+        """True if the URL, id or a near-identical title was seen inside the window"""
+        cutoff = time.time() - self.window
+        with self._lock:
+            if any(self._keys.get(key, 0) >= cutoff for key in self._item_keys(url, item_id)):
+                return True
+            fingerprint = simhash(title)
+            if fingerprint is not None:
+                return self._similar_title(fingerprint, cutoff) is not None
+        return False
+
+    def add(self, url=None, title=None, item_id=None, seen_at=None):
+        seen_at = seen_at or time.time()
+        with self._lock:
+            for key in self._item_keys(url, item_id):
+                self._keys[key] = seen_at
+            fingerprint = simhash(title)
+            if fingerprint is not None:
+                self._add_title(fingerprint, seen_at)
+            self._dirty = True
+
+    def check_and_add(self, url=None, title=None, item_id=None):
+        """True (and remembered) if the item is new"""
+        if self.seen(url, title, item_id):
+            return False
+        self.add(url, title, item_id)
+        return True
+
+    def filter_new(self, items, url_key="url", title_key="title", id_key=None, remember=True):
+        """Items not seen before, in order; duplicates within the batch are dropped too
+
+        With remember=False nothing is marked as seen; call add_items() once the items
+        were actually used (e.g. the Trello card exists).
+        """
+        batch = self if remember else DedupIndex(self.namespace, self.window / 3600, path=None)
+        fresh = []
+        for item in items:
+            fields = _item_fields(item, url_key, title_key, id_key)
+            if self.seen(*fields) or (batch is not self and batch.seen(*fields)):
+                continue
+            batch.add(*fields)
+            fresh.append(item)
+        return fresh
+
+    def add_items(self, items, url_key="url", title_key="title", id_key=None):
+        """Mark every item as seen"""
+        for item in items:
+            self.add(*_item_fields(item, url_key, title_key, id_key))
+
+    def evict(self):
+        """Drop entries older than the window"""
+        cutoff = time.time() - self.window
+        with self._lock:
+            self._keys = {key: t for key, t in self._keys.items() if t >= cutoff}
+            for fingerprint in [f for f, t in self._titles.items() if t < cutoff]:
+                del self._titles[fingerprint]
+                for band in _bands(fingerprint):
+                    self._bands[band].discard(fingerprint)
+
+    def save(self):
+        """Merge into the file (other namespaces / processes keep their entries)
+
+        A no-op when nothing was added since the last save.
+        """
+        if not self._dirty:
+            return
+        self.evict()
+        with _file_lock:
+            data = self._read()
+            stored = data.get(self.namespace, {})
+            with self._lock:
+                keys = {**stored.get("keys", {}), **self._keys}
+                titles = {**stored.get("titles", {}),
+                          **{f"{f:016x}": t for f, t in self._titles.items()}}
+                self._dirty = False
+            cutoff = time.time() - self.window
+            data[self.namespace] = {
+                "keys": {k: t for k, t in keys.items() if t >= cutoff},
+                "titles": {f: t for f, t in titles.items() if t >= cutoff},
+            }
+            tmp_path = self.path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(data))
+            os.replace(tmp_path, self.path)
+
+    def __len__(self):
+        return len(self._keys) + len(self._titles)
+
+
+def get_index(namespace):
+    """Shared index per namespace for this process"""
+    with _file_lock:
+        if namespace not in _indexes:
+            _indexes[namespace] = DedupIndex(namespace)
+        return _indexes[namespace]
@@ -6,11 +6,9 @@ Uses: YouTube RSS, Google Trends, Celebrity News RSS, USGS, NOAA
 
 import json
 import os
-import re
 import sys
 from datetime import datetime, timedelta
 from pathlib import Path
-import subprocess
 
 # Add venv packages to path
 VENV_PATH = Path(__file__).parent / "venv" / "lib"
@@ -21,6 +19,12 @@ import feedparser
 import requests
 from bs4 import BeautifulSoup
 
+import channel_resolver
+import dedup_index
+import view_velocity
+import youtube_feeds
+from radar_core import sources
+
 try:
     from pytrends.request import TrendReq
     PYTRENDS_AVAILABLE = True
@@ -65,7 +69,6 @@ def load_state():
     if STATE_PATH.exists():
         return json.loads(STATE_PATH.read_text())
     return {
-        "seen_videos": {},
         "seen_articles": {},
         "last_trends_check": None,
         "last_check": {}
@@ -77,6 +80,16 @@ def save_state(state):
     STATE_PATH.write_text(json.dumps(state, indent=2, default=str))
 
 
+def video_index(state):
+    """Seen competitor videos, moving any legacy state["seen_videos"] into the dedup index"""
+    index = dedup_index.get_index("videos")
+    for video_id, info in state.pop("seen_videos", {}).items():
+        first_seen = datetime.fromisoformat(info["first_seen"]).timestamp()
+        index.add(url=f"https://www.youtube.com/watch?v={video_id}", seen_at=first_seen)
+    index.evict()
+    return index
+
+
 def load_config():
     """Load config file"""
     return json.loads(CONFIG_PATH.read_text())
@@ -88,66 +101,13 @@ def load_competitors():
 
 
 def get_channel_id_from_url(url):
-    """Extract channel ID from YouTube URL using yt-dlp"""
-    try:
-        # Handle different URL formats
-        if "@" in url:
-            # Modern @handle format
-            result = subprocess.run(
-                ["yt-dlp", "--flat-playlist", "-J", url],
-                capture_output=True, text=True, timeout=30
-            )
-            if result.returncode == 0:
-                data = json.loads(result.stdout)
-                return data.get("channel_id") or data.get("uploader_id")
-        elif "channel/" in url:
-            # Direct channel ID
-            match = re.search(r"channel/([^/?\s]+)", url)
-            if match:
-                return match.group(1)
-    except Exception as e:
-        print(f"Error getting channel ID for {url}: {e}")
-    return None
+    """Channel ID for a YouTube URL (resolved once, then read from channel_ids.json)"""
+    return channel_resolver.channel_ids_for([url]).get(url)
 
 
 def get_youtube_rss_videos(channel_url, limit=5):
     """Get recent videos from YouTube channel via RSS feed"""
-    videos = []
-    
-    # Try to get channel ID
-    channel_id = get_channel_id_from_url(channel_url)
-    if not channel_id:
-        # Fallback: try to scrape channel page for ID
-        try:
-            resp = requests.get(channel_url, timeout=10)
-            match = re.search(r'"channelId":"([^"]+)"', resp.text)
-            if match:
-                channel_id = match.group(1)
-        except:
-            pass
-    
-    if not channel_id:
-        return videos
-    
-    # YouTube RSS feed URL
-    rss_url = f"https://www.youtube.com/feeds/videos.xml?channel_id={channel_id}"
-    
-    try:
-        feed = feedparser.parse(rss_url)
-        for entry in feed.entries[:limit]:
-            videos.append({
-                "title": entry.get("title", ""),
-                "url": entry.get("link", ""),
-                "published": entry.get("published", ""),
-                "channel": feed.feed.get("title", "Unknown"),
-                "channel_id": channel_id,
-                "video_id": entry.get("yt_videoid", ""),
-                "views": entry.get("media_statistics", {}).get("views", 0) if hasattr(entry, "media_statistics") else 0
-            })
-    except Exception as e:
-        print(f"Error fetching RSS for {channel_url}: {e}")
-    
-    return videos
+    return youtube_feeds.poll_channels([channel_url]).get(channel_url, [])[:limit]
 
 
 def get_celebrity_news(keywords=None, limit=10):
@@ -223,58 +183,43 @@ def get_google_trends(keywords=None):
 
 def check_usgs_earthquakes(min_magnitude=5.5):
     """Check USGS for recent significant earthquakes"""
-    alerts = []
     try:
-        url = "https://earthquake.usgs.gov/earthquakes/feed/v1.0/summary/4.5_day.geojson"
-        resp = requests.get(url, timeout=10)
-        data = resp.json()
-        
-        for feature in data.get("features", []):
-            props = feature.get("properties", {})
-            mag = props.get("mag", 0)
-            
-            if mag >= min_magnitude:
-                alerts.append({
-                    "type": "earthquake",
-                    "magnitude": mag,
-                    "place": props.get("place", "Unknown"),
-                    "time": datetime.fromtimestamp(props.get("time", 0) / 1000).isoformat(),
-                    "url": props.get("url", ""),
-                    "tsunami": props.get("tsunami", 0) == 1
-                })
+        return [
+            {
+                "type": "earthquake",
+                "magnitude": quake["magnitude"],
+                "place": quake["place"],
+                "time": quake.get("published"),
+                "url": quake["url"],
+                "tsunami": quake["tsunami"]
+            }
+            for quake in sources.usgs_earthquakes(min_magnitude, hours=None)
+        ]
     except Exception as e:
         print(f"USGS error: {e}")
-    
-    return alerts
+        return []
+
 
 
 def check_noaa_weather(severity=["Extreme", "Severe"]):
     """Check NOAA for severe weather alerts"""
-    alerts = []
     try:
-        url = "https://api.weather.gov/alerts/active"
-        headers = {"User-Agent": "ContentRadar/1.0"}
-        resp = requests.get(url, headers=headers, timeout=10)
-        data = resp.json()
-        
-        for feature in data.get("features", []):
-            props = feature.get("properties", {})
-            sev = props.get("severity", "")
-            
-            if sev in severity:
-                alerts.append({
-                    "type": "weather",
-                    "severity": sev,
-                    "event": props.get("event", ""),
-                    "headline": props.get("headline", ""),
-                    "areas": props.get("areaDesc", ""),
-                    "effective": props.get("effective", ""),
-                    "expires": props.get("expires", "")
-                })
+        return [
+            {
+                "type": "weather",
+                "severity": alert["severity"],
+                "event": alert["event"],
+                "headline": alert["headline"],
+                "areas": alert["areas"],
+                "effective": alert.get("published", ""),
+                "expires": alert.get("expires", "")
+            }
+            for alert in sources.noaa_alerts(severity, limit=None)
+        ]
     except Exception as e:
         print(f"NOAA error: {e}")
-    
-    return alerts
+        return []
+
 
 
 def scan_competitors(channel_key, limit_per_channel=3):
@@ -285,17 +230,13 @@ def scan_competitors(channel_key, limit_per_channel=3):
     new_videos = []
     channel_data = competitors.get(channel_key, {})
     
-    for url in channel_data.get("competitors", []):
-        videos = get_youtube_rss_videos(url, limit=limit_per_channel)
-        for video in videos:
-            video_id = video.get("video_id")
-            if video_id and video_id not in state.get("seen_videos", {}):
-                new_videos.append(video)
-                state.setdefault("seen_videos", {})[video_id] = {
-                    "first_seen": datetime.now().isoformat(),
-                    "channel_key": channel_key
-                }
+    seen_videos = video_index(state)
     
+    feeds = youtube_feeds.poll_channels(channel_data.get("competitors", []))
+    for videos in feeds.values():
+        new_videos.extend(seen_videos.filter_new(videos[:limit_per_channel], title_key=None))
+    
+    seen_videos.save()
     save_state(state)
     return new_videos
 
@@ -398,11 +339,12 @@ def format_summary(results):
 
 # Dashboard integration
 def add_to_dashboard(item_type, title, source, url, priority="high", 
-                     views=None, subscribers=None, posted_at=None, tags=None):
+                     views=None, subscribers=None, posted_at=None, tags=None,
+                     views_per_hour=None, outlier_score=None):
     """Add an item to the dashboard"""
     try:
         from dashboard_manager import add_card
-        add_card(
+        return add_card(
             title=title,
             content_type=item_type,
             source=source,
@@ -411,9 +353,10 @@ def add_to_dashboard(item_type, title, source, url, priority="high",
             views=views,
             subscribers=subscribers,
             posted_at=posted_at,
-            tags=tags
-        )
-        return True
+            tags=tags,
+            views_per_hour=views_per_hour,
+            outlier_score=outlier_score
+        ) is not None
     except Exception as e:
         print(f"Dashboard error: {e}")
         return False
@@ -452,33 +395,32 @@ def scan_and_add_to_dashboard(channel_key=None, add_dashboard=True):
         channel_data = competitors.get(channel_key, {})
         state = load_state()
         
-        for url in channel_data.get("competitors", [])[:10]:
-            videos = get_youtube_rss_videos(url, limit=3)
-            for video in videos:
-                video_id = video.get("video_id")
-                if video_id and video_id not in state.get("seen_videos", {}):
-                    results["videos"].append(video)
-                    
-                    # Mark as seen
-                    state.setdefault("seen_videos", {})[video_id] = {
-                        "first_seen": datetime.now().isoformat()
-                    }
-                    
-                    if add_dashboard:
-                        # First video is HIGH, rest are MEDIUM
-                        priority = "high" if results["videos_added"] == 0 else "medium"
-                        if add_to_dashboard(
-                            "video",
-                            video["title"],
-                            video.get("channel", "Unknown"),
-                            video["url"],
-                            priority=priority,
-                            views=video.get("views"),
-                            posted_at=video.get("published"),
-                            tags=[channel_key.split("_")[0].lower()]
-                        ):
-                            results["videos_added"] += 1
+        seen_videos = video_index(state)
+        
+        feeds = youtube_feeds.poll_channels(channel_data.get("competitors", []))
+        for videos in feeds.values():
+            for video in seen_videos.filter_new(videos[:3], title_key=None):
+                results["videos"].append(video)
+                
+                if add_dashboard:
+                    # Breakouts and the first video are HIGH, rest are MEDIUM
+                    breaking = view_velocity.is_breaking(video)
+                    priority = "high" if breaking or results["videos_added"] == 0 else "medium"
+                    if add_to_dashboard(
+                        "video",
+                        video["title"],
+                        video.get("channel", "Unknown"),
+                        video["url"],
+                        priority=priority,
+                        views=video.get("views"),
+                        posted_at=video.get("published"),
+                        tags=[channel_key.split("_")[0].lower()],
+                        views_per_hour=video.get("views_per_hour"),
+                        outlier_score=video.get("outlier_score")
+                    ):
+                        results["videos_added"] += 1
         
+        seen_videos.save()
         save_state(state)
     
     return results
@@ -4,9 +4,7 @@ Enhanced Trello ContentRadar v5 - Now with ALL FREE APIs
 Includes: EMSC, NASA FIRMS, GDACS, Congress, Federal Register, Supreme Court, Reddit Enhanced
 """
 
-import json
 import subprocess
-import requests
 import feedparser
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -19,22 +17,21 @@ VENV_PATH = Path(__file__).parent / "venv" / "lib"
 for p in VENV_PATH.glob("python*/site-packages"):
     sys.path.insert(0, str(p))
 
+import dedup_index
+import radar_core
+from radar_core import sources, trello_request
+
 # Import our viral APIs
 from viral_apis import (
     get_emsc_earthquakes, get_nasa_fires, get_gdacs_alerts,
     get_congress_bills, get_federal_register, get_supreme_court_cases,
     get_reddit_trending
 )
+import view_velocity
 
 BASE_DIR = Path(__file__).parent
 
-# Load Trello credentials
-config = json.loads(Path('/Users/malikano/clawdbot_system/config.json').read_text())
-API_KEY = config['trello_api_key']
-TOKEN = config['trello_api_token']
-
-LIST_IDS = json.loads((BASE_DIR / 'trello_lists.json').read_text())
-COMPETITORS = json.loads((BASE_DIR.parent / 'competitors.json').read_text())
+LIST_IDS = radar_core.trello_lists()
 
 RSS_HEADERS = {'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'}
 
@@ -43,18 +40,19 @@ NOW = datetime.now()
 YESTERDAY = (NOW - timedelta(hours=24)).strftime("%Y%m%d")
 CUTOFF_TIMESTAMP = (NOW - timedelta(hours=24)).timestamp()
 
-def trello_request(method, endpoint, **kwargs):
-    url = f"https://api.trello.com/1/{endpoint}"
-    params = kwargs.pop('params', {})
-    params.update({"key": API_KEY, "token": TOKEN})
-    return requests.request(method, url, params=params, **kwargs)
-
 def create_enhanced_card(list_name, title, findings):
     """Create ONE card with ALL findings including new APIs"""
     list_id = LIST_IDS.get(list_name)
     if not list_id:
         return None
     
+    # Drop anything this list already got (same URL or same story) inside the window
+    seen = dedup_index.get_index(f"trello:{list_name}")
+    findings = seen.filter_new(findings, remember=False)
+    if not findings:
+        print(f"  ⚠️ Nothing new for {list_name}")
+        return None
+    
     desc_lines = [
         f"📅 Scan: {NOW.strftime('%Y-%m-%d %H:%M')}",
         "🆕 ENHANCED with FREE APIs",
@@ -89,6 +87,8 @@ def create_enhanced_card(list_name, title, findings):
             extra = f" • {item['engagement_rate']:.1f} rate"
         elif item.get('score'):
             extra = f" • {item['score']} score"
+        elif item.get('views_per_hour'):
+            extra = f" • {item['views_per_hour']:,} views/h"
         
         return f"{emoji} [{source}] {title}{extra}\n🔗 {url}\n"
     
@@ -132,7 +132,10 @@ def create_enhanced_card(list_name, title, findings):
             }
             desc_lines.append(f"{type_emojis.get(source_type, '📌')} **{source_type.upper().replace('_', ' ')}:**")
             
-            items = findings_by_type[source_type][:6]
+            items = findings_by_type[source_type]
+            if source_type == 'youtube':
+                items = sorted(items, key=lambda x: x.get('outlier_score', 0), reverse=True)
+            items = items[:6]
             for item in items:
                 desc_lines.append(format_item(item))
             desc_lines.append("")
@@ -167,6 +170,8 @@ def create_enhanced_card(list_name, title, findings):
         if response.status_code == 200:
             card_id = response.json().get("id")
             print(f"✅ Created enhanced card: {title}")
+            seen.add_items(findings)
+            seen.save()
             return card_id
         else:
             print(f"❌ Trello error: {response.text}")
@@ -227,7 +232,7 @@ def run_enhanced_h1h3_scan():
     for video in competitor_videos:
         video['source_type'] = 'youtube'
         video['priority'] = 'MEDIUM'
-        if video.get('views_int', 0) > 100000:
+        if video.get('views', 0) > 100000 or view_velocity.is_breaking(video):
             video['priority'] = 'HIGH'
     
     findings.extend(competitor_videos)
@@ -385,10 +390,8 @@ def run_full_enhanced_scan():
 
 # Import existing functions from original trello_radar.py
 def scan_competitor_channels_strict_24h(channel_key, max_per_competitor=2):
-    """Keep existing competitor scanning function"""
-    # This would be imported/copied from the original trello_radar.py
-    # For now, return empty list as placeholder
-    return []
+    """Competitor uploads from the last 24h (every competitor's RSS feed, polled at once)"""
+    return sources.competitor_videos(channel_key, max_per_competitor)
 
 if __name__ == "__main__":
     import argparse
@@ -411,10 +414,10 @@ if __name__ == "__main__":
         results = run_all_free_apis()
         
         print(f"\n📊 API Test Results:")
-        for category, sources in results.items():
-            if isinstance(sources, dict) and category != "timestamp":
+        for category, category_results in results.items():
+            if isinstance(category_results, dict) and category != "timestamp":
                 print(f"{category.replace('_', ' ').title()}:")
-                for source, items in sources.items():
+                for source, items in category_results.items():
                     if isinstance(items, list):
                         print(f"  {source}: {len(items)} items")
     
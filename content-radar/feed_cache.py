@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Feed Cache - Conditional GETs with the parsed result cached per URL
+Stores ETag / Last-Modified next to what the parser made of the response; a 304 serves
+that result without downloading or parsing anything. Counts bytes and parse time saved.
+
+    items = feed_cache.get(url, parse_feed)    # parse(resp) -> JSON-serializable result
+"""
+
+import copy
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add venv packages to path
+VENV_PATH = Path(__file__).parent / "venv" / "lib"
+for p in VENV_PATH.glob("python*/site-packages"):
+    sys.path.insert(0, str(p))
+
+import requests
+
+import fetch_engine
+
+# Paths
+BASE_DIR = Path(__file__).parent
+CACHE_DIR = BASE_DIR / "http_cache"
+
+_lock = threading.Lock()
+_memo = {}  # cache key -> entry, so a long-running process reads each file once
+_stats = {
+    "requests": 0,
+    "not_modified": 0,
+    "bytes_downloaded": 0,
+    "bytes_saved": 0,
+    "parse_seconds": 0.0,
+    "parse_seconds_saved": 0.0,
+}
+
+
+def _parser_name(parse):
+    return f"{parse.__module__}.{parse.__qualname__}"
+
+
+def _cache_path(key):
+    return CACHE_DIR / f"{hashlib.sha1(key.encode()).hexdigest()}.json"
+
+
+def _load(key):
+    with _lock:
+        if key in _memo:
+            return _memo[key]
+    path = _cache_path(key)
+    entry = json.loads(path.read_text()) if path.exists() else None
+    with _lock:
+        _memo[key] = entry
+    return entry
+
+
+def _store(key, entry):
+    """One file per URL, so an update rewrites only that feed"""
+    CACHE_DIR.mkdir(exist_ok=True)
+    path = _cache_path(key)
+    tmp_path = path.with_name(f"{path.stem}.{threading.get_ident()}.tmp")
+    tmp_path.write_text(json.dumps(entry))
+    os.replace(tmp_path, path)
+    with _lock:
+        _memo[key] = entry
+
+
+def _count(**deltas):
+    with _lock:
+        for name, value in deltas.items():
+            _stats[name] += value
+
+
+def fetch(url, parse, timeout=15, **kwargs):
+    """(parsed result, status) for url
+
+    status is "updated" (downloaded and parsed), "unchanged" (304, cached result) or
+    "http N" / "error" (the last good result, None if there is none). A request error
+    with nothing cached is raised.
+    """
+    # Keyed by parser too: two parsers of one URL keep separate results
+    key = f"{_parser_name(parse)} {url}"
+    cached = _load(key)
+
+    headers = dict(kwargs.pop("headers", None) or {})
+    if cached and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached and cached.get("last_modified"):
+        headers["If-Modified-Since"] = cached["last_modified"]
+
+    try:
+        resp = fetch_engine.get(url, timeout=timeout, headers=headers, **kwargs)
+    except requests.RequestException:
+        if cached is None:
+            raise
+        return copy.deepcopy(cached["value"]), "error"
+
+    if resp.status_code == 304 and cached:
+        _count(requests=1, not_modified=1, bytes_saved=cached["bytes"],
+               parse_seconds_saved=cached["parse_seconds"])
+        return copy.deepcopy(cached["value"]), "unchanged"
+
+    _count(requests=1, bytes_downloaded=len(resp.content))
+    if resp.status_code != 200:
+        # Keep serving the last good copy
+        return (copy.deepcopy(cached["value"]) if cached else None), f"http {resp.status_code}"
+
+    started = time.perf_counter()
+    value = parse(resp)
+    parse_seconds = time.perf_counter() - started
+    _count(parse_seconds=parse_seconds)
+
+    if resp.headers.get("ETag") or resp.headers.get("Last-Modified"):
+        _store(key, {
+            "url": url,
+            "etag": resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified"),
+            "bytes": len(resp.content),
+            "parse_seconds": round(parse_seconds, 4),
+            "fetched_at": time.time(),
+            "value": value
+        })
+    return copy.deepcopy(value), "updated"
+
+
+def get(url, parse, timeout=15, **kwargs):
+    """Parsed result for url (cached on 304); None if it failed and nothing is cached"""
+    return fetch(url, parse, timeout, **kwargs)[0]
+
+
+def stats():
+    """Counters since the process started"""
+    with _lock:
+        return dict(_stats)
+
+
+def summary(since=None):
+    """One line of cache savings, optionally only since an earlier stats() snapshot"""
+    current = stats()
+    if since:
+        current = {name: value - since.get(name, 0) for name, value in current.items()}
+    if not current["requests"]:
+        return "💾 HTTP cache: no feed requests"
+    return (f"💾 HTTP cache: {current['not_modified']}/{current['requests']} unchanged, "
+            f"{current['bytes_downloaded'] / 1024:.0f} KB downloaded, "
+            f"{current['bytes_saved'] / 1024:.0f} KB and {current['parse_seconds_saved']:.2f}s parsing saved")
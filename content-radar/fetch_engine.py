@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Fetch Engine - Concurrent source scans over one pooled HTTP session
+Runs every source at once with its own deadline, a global cap on in-flight requests
+and a minimum spacing per host, so a scan takes about as long as the slowest source
+"""
+
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from pathlib import Path
+from urllib.parse import urlsplit
+
+# Add venv packages to path
+VENV_PATH = Path(__file__).parent / "venv" / "lib"
+for p in VENV_PATH.glob("python*/site-packages"):
+    sys.path.insert(0, str(p))
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# HTTP headers
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+# Requests in flight across all sources
+MAX_CONCURRENCY = 16
+
+# Minimum seconds between requests to the same host (replaces the old sleeps)
+HOST_INTERVALS = {
+    "www.reddit.com": 0.2,
+    "hacker-news.firebaseio.com": 0.0,
+    "api.gdeltproject.org": 0.5,
+    "newsapi.org": 0.2,
+    "gnews.io": 0.2,
+    "news.google.com": 0.2,
+}
+DEFAULT_HOST_INTERVAL = 0.05
+
+# Seconds a whole source may take before the scan moves on without it
+DEFAULT_SOURCE_TIMEOUT = 30
+
+_session = None
+_session_lock = threading.Lock()
+_slots = threading.BoundedSemaphore(MAX_CONCURRENCY)
+_host_lock = threading.Lock()
+_host_next = {}  # host -> earliest time the next request may start
+
+
+def get_session():
+    """Shared session: keep-alive connections are reused across sources and scans"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            _session.headers.update(HEADERS)
+            adapter = HTTPAdapter(pool_connections=32, pool_maxsize=MAX_CONCURRENCY)
+            _session.mount("https://", adapter)
+            _session.mount("http://", adapter)
+        return _session
+
+
+def _wait_for_host(host):
+    """Reserve the host's next request slot and sleep until it comes up"""
+    interval = HOST_INTERVALS.get(host, DEFAULT_HOST_INTERVAL)
+    with _host_lock:
+        now = time.monotonic()
+        start = max(now, _host_next.get(host, 0))
+        _host_next[host] = start + interval
+    if start > now:
+        time.sleep(start - now)
+
+
+def get(url, timeout=15, **kwargs):
+    """Drop-in for requests.get: pooled, rate limited per host, capped globally"""
+    _wait_for_host(urlsplit(url).hostname)
+    with _slots:
+        return get_session().get(url, timeout=timeout, **kwargs)
+
+
+def map_concurrent(func, items):
+    """func(item) for every item at once, results in order (for per-item requests)"""
+    items = list(items)
+    if not items:
+        return []
+    with ThreadPoolExecutor(max_workers=min(len(items), MAX_CONCURRENCY)) as pool:
+        return list(pool.map(func, items))
+
+
+def get_many(urls, timeout=15, **kwargs):
+    """Fetch several URLs at once; responses in order, None where a request failed"""
+    def fetch(url):
+        try:
+            return get(url, timeout=timeout, **kwargs)
+        except requests.RequestException as e:
+            print(f"Fetch error {url}: {e}")
+            return None
+
+    return map_concurrent(fetch, urls)
+
+
+def run_sources(sources, default=list):
+    """Run {name: (function, timeout_seconds)} concurrently
+
+    Returns ({name: result}, {name: seconds}). A source that raises or misses its
+    deadline gets `default()` and a warning; the scan doesn't wait for it.
+    """
+    results = {}
+    timings = {}
+    finished_at = {}
+    started = time.monotonic()
+
+    pool = ThreadPoolExecutor(max_workers=len(sources) or 1, thread_name_prefix="source")
+    futures = {name: pool.submit(func) for name, (func, _) in sources.items()}
+    for name, future in futures.items():
+        future.add_done_callback(lambda f, name=name: finished_at.setdefault(name, time.monotonic()))
+
+    # Collect in deadline order so a slow source never delays reading a fast one
+    for name, (_, timeout) in sorted(sources.items(), key=lambda s: s[1][1] or DEFAULT_SOURCE_TIMEOUT):
+        future = futures[name]
+        remaining = started + (timeout or DEFAULT_SOURCE_TIMEOUT) - time.monotonic()
+        wait([future], timeout=max(remaining, 0))
+        if not future.done():
+            print(f"⏱️  {name} timed out after {timeout or DEFAULT_SOURCE_TIMEOUT}s, skipping")
+            timings[name] = None
+            results[name] = default()
+            continue
+
+        timings[name] = round(finished_at.get(name, time.monotonic()) - started, 2)
+        if future.exception():
+            print(f"{name} error: {future.exception()}")
+            results[name] = default()
+        else:
+            results[name] = future.result()
+
+    # Late sources finish in the background; their results are dropped
+    pool.shutdown(wait=False, cancel_futures=True)
+    return results, timings
+
+
+def timing_summary(timings):
+    """One line: how long the scan took and which source was slowest"""
+    finished = {name: t for name, t in timings.items() if t is not None}
+    timed_out = [name for name, t in timings.items() if t is None]
+    if not finished:
+        return f"⏱️  No source finished ({len(timed_out)} timed out)"
+
+    slowest = max(finished, key=finished.get)
+    line = f"⏱️  {len(finished)} sources in {finished[slowest]:.1f}s (slowest: {slowest})"
+    if timed_out:
+        line += f", timed out: {', '.join(timed_out)}"
+    return line
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Fire Clusters - NASA FIRMS hotspots streamed, gridded and clustered
+The 24h VIIRS CSV is read row by row (never held in memory) into a grid of ~4 km cells;
+touching occupied cells are joined into clusters (DBSCAN with eps of one cell), and each
+cluster is named with the offline county lookup in us_geocoder.
+Memory grows with the number of occupied cells, not with the size of the file.
+"""
+
+import csv
+import math
+import sys
+from pathlib import Path
+
+# Add venv packages to path
+VENV_PATH = Path(__file__).parent / "venv" / "lib"
+for p in VENV_PATH.glob("python*/site-packages"):
+    sys.path.insert(0, str(p))
+
+import fetch_engine
+import us_geocoder
+
+FIRMS_CSV = "https://firms.modaps.eosdis.nasa.gov/data/active_fire/viirs/csv/VNP14IMGTDL_NRT_USA_contiguous_and_Hawaii_24h.csv"
+
+# Grid cell edge; hotspots in the same or a touching cell end up in one cluster
+CELL_KM = 4.0
+KM_PER_DEG_LAT = 111.32
+# Column width is fixed at this latitude (middle of the contiguous US) for every row, so
+# column numbers line up across rows; cells are ~15% wider or narrower at the edges
+REFERENCE_LAT = 39.0
+# Hotspots a cluster needs before it's reported
+MIN_HOTSPOTS = 5
+
+# VIIRS reports confidence as a letter, MODIS as 0-100
+CONFIDENCE_LEVELS = {"l": 30, "n": 60, "h": 90}
+MIN_CONFIDENCE = 50
+
+
+def _confidence(value):
+    value = (value or "").strip().lower()
+    if value in CONFIDENCE_LEVELS:
+        return CONFIDENCE_LEVELS[value]
+    try:
+        return float(value)
+    except ValueError:
+        return 0
+
+
+def read_hotspots(lines, min_confidence=MIN_CONFIDENCE):
+    """Hotspot dicts from FIRMS CSV lines (header first), skipping low-confidence and bad rows"""
+    for row in csv.DictReader(lines):
+        try:
+            lat = float(row["latitude"])
+            lon = float(row["longitude"])
+        except (KeyError, TypeError, ValueError):
+            continue
+        confidence = _confidence(row.get("confidence"))
+        if confidence < min_confidence:
+            continue
+        try:
+            frp = float(row.get("frp") or 0)
+        except ValueError:
+            frp = 0
+        yield {
+            "lat": lat,
+            "lon": lon,
+            "confidence": confidence,
+            "frp": frp,
+            "acquired": f"{row.get('acq_date', '')} {(row.get('acq_time') or '').zfill(4)}".strip()
+        }
+
+
+def _cell_key(lat, lon, cell_km):
+    """(row, col) of a ~cell_km cell; one longitude scale for all rows keeps neighbours touching"""
+    cell_deg = cell_km / KM_PER_DEG_LAT
+    lon_scale = math.cos(math.radians(REFERENCE_LAT))
+    return math.floor(lat / cell_deg), math.floor(lon * lon_scale / cell_deg)
+
+
+def grid_cells(hotspots, cell_km=CELL_KM):
+    """Aggregate a hotspot stream into {(row, col): cell totals}"""
+    cells = {}
+    for spot in hotspots:
+        key = _cell_key(spot["lat"], spot["lon"], cell_km)
+        cell = cells.get(key)
+        if cell is None:
+            cell = cells[key] = {"count": 0, "lat_sum": 0.0, "lon_sum": 0.0, "frp": 0.0,
+                                 "max_frp": 0.0, "max_confidence": 0, "latest": ""}
+        cell["count"] += 1
+        cell["lat_sum"] += spot["lat"]
+        cell["lon_sum"] += spot["lon"]
+        cell["frp"] += spot["frp"]
+        cell["max_frp"] = max(cell["max_frp"], spot["frp"])
+        cell["max_confidence"] = max(cell["max_confidence"], spot["confidence"])
+        cell["latest"] = max(cell["latest"], spot["acquired"])
+    return cells
+
+
+def cluster_cells(cells, min_hotspots=MIN_HOTSPOTS):
+    """Connected groups of occupied cells (8-neighbour), largest first"""
+    clusters = []
+    unvisited = set(cells)
+
+    while unvisited:
+        stack = [unvisited.pop()]
+        members = []
+        while stack:
+            row, col = stack.pop()
+            members.append(cells[(row, col)])
+            for d_row in (-1, 0, 1):
+                for d_col in (-1, 0, 1):
+                    neighbour = (row + d_row, col + d_col)
+                    if neighbour in unvisited:
+                        unvisited.remove(neighbour)
+                        stack.append(neighbour)
+
+        count = sum(cell["count"] for cell in members)
+        if count < min_hotspots:
+            continue
+        clusters.append({
+            "count": count,
+            "lat": round(sum(cell["lat_sum"] for cell in members) / count, 4),
+            "lon": round(sum(cell["lon_sum"] for cell in members) / count, 4),
+            "frp": round(sum(cell["frp"] for cell in members), 1),
+            "max_frp": max(cell["max_frp"] for cell in members),
+            "max_confidence": max(cell["max_confidence"] for cell in members),
+            "latest": max(cell["latest"] for cell in members),
+            "area_km2": round(len(members) * CELL_KM ** 2),
+        })
+
+    return sorted(clusters, key=lambda c: (c["count"], c["frp"]), reverse=True)
+
+
+def stream_lines(url, timeout=30, **kwargs):
+    """Decoded lines of a remote text file, read as they arrive"""
+    resp = fetch_engine.get(url, timeout=timeout, stream=True, **kwargs)
+    with resp:
+        resp.raise_for_status()
+        resp.encoding = resp.encoding or "utf-8"
+        for line in resp.iter_lines(decode_unicode=True):
+            if line:
+                yield line
+
+
+def fire_clusters(url=FIRMS_CSV, min_hotspots=MIN_HOTSPOTS, cell_km=CELL_KM, **kwargs):
+    """Clusters from the whole FIRMS file, each with county/state when known"""
+    cells = grid_cells(read_hotspots(stream_lines(url, **kwargs)), cell_km)
+    clusters = cluster_cells(cells, min_hotspots)
+    for cluster in clusters:
+        cluster.update(us_geocoder.locate(cluster["lat"], cluster["lon"]) or {"county": None, "state": None})
+    return clusters
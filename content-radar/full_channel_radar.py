@@ -4,7 +4,6 @@ Full Channel Radar - All channels including new N1 - TECH
 H1/H3: Disasters, H2: Gun Rights, R1: Taylor Swift, R2: Legal/Crime, N1: Tech
 """
 
-import json
 import subprocess
 import requests
 import feedparser
@@ -19,6 +18,10 @@ VENV_PATH = Path(__file__).parent / "venv" / "lib"
 for p in VENV_PATH.glob("python*/site-packages"):
     sys.path.insert(0, str(p))
 
+import dedup_index
+import radar_core
+from radar_core import trello_request
+
 # Import our APIs
 from mega_viral_apis import (
     get_newsapi_headlines, get_gnews_api, get_hackernews_trending,
@@ -32,12 +35,7 @@ from viral_apis import (
 
 BASE_DIR = Path(__file__).parent
 
-# Load Trello credentials
-config = json.loads(Path('/Users/malikano/clawdbot_system/config.json').read_text())
-API_KEY = config['trello_api_key']
-TOKEN = config['trello_api_token']
-
-LIST_IDS = json.loads((BASE_DIR / 'trello_lists.json').read_text())
+LIST_IDS = radar_core.trello_lists()
 
 # Time filters
 NOW = datetime.now()
@@ -45,12 +43,6 @@ CUTOFF_24H = NOW - timedelta(hours=24)
 
 RSS_HEADERS = {'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'}
 
-def trello_request(method, endpoint, **kwargs):
-    url = f"https://api.trello.com/1/{endpoint}"
-    params = kwargs.pop('params', {})
-    params.update({"key": API_KEY, "token": TOKEN})
-    return requests.request(method, url, params=params, **kwargs)
-
 def get_tech_news_content():
     """Get tech-focused content for N1 channel"""
     tech_content = []
@@ -161,6 +153,13 @@ def create_channel_card(list_name, title, findings):
         print(f"❌ List '{list_name}' not found in Trello")
         return None
     
+    # Drop anything this list already got (same URL or same story) inside the window
+    seen = dedup_index.get_index(f"trello:{list_name}")
+    findings = seen.filter_new(findings, remember=False)
+    if not findings:
+        print(f"  ⚠️ Nothing new for {list_name}")
+        return None
+    
     desc_lines = [
         f"📅 Full Radar Scan: {NOW.strftime('%Y-%m-%d %H:%M')}",
         f"🎯 Channel: {list_name}",
@@ -263,6 +262,8 @@ def create_channel_card(list_name, title, findings):
         if response.status_code == 200:
             card_id = response.json().get("id")
             print(f"✅ Created card: {title}")
+            seen.add_items(findings)
+            seen.save()
             return card_id
         else:
             print(f"❌ Trello error: {response.text}")
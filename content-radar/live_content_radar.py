@@ -5,19 +5,19 @@ Live Content Radar - Find latest news/videos for all channels (last 24hrs)
 
 import json
 import subprocess
-import requests
-import feedparser
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 import sys
 import re
-from urllib.parse import quote_plus
 
 # Add venv packages
 VENV_PATH = Path(__file__).parent / "venv" / "lib"
 for p in VENV_PATH.glob("python*/site-packages"):
     sys.path.insert(0, str(p))
 
+from radar_core import sources
+from radar_core.items import age_hours
+
 # Import APIs
 from mega_viral_apis import get_hackernews_trending
 from simple_google_trends import get_simple_trends
@@ -89,31 +89,18 @@ def search_youtube_videos(query, max_results=5):
 
 def get_google_news(query, max_results=5):
     """Get Google News results for query"""
-    articles = []
-    
-    try:
-        url = f"https://news.google.com/rss/search?q={quote_plus(query)}+when:1d&hl=en-US&gl=US&ceid=US:en"
-        resp = requests.get(url, headers=RSS_HEADERS, timeout=15)
-        
-        if resp.status_code == 200:
-            feed = feedparser.parse(resp.content)
-            
-            for entry in feed.entries[:max_results]:
-                pub_date = datetime(*entry.published_parsed[:6])
-                if pub_date > CUTOFF_24H:
-                    articles.append({
-                        "title": entry.title,
-                        "url": entry.link,
-                        "published": pub_date.strftime("%Y-%m-%d %H:%M"),
-                        "source": "Google News",
-                        "age_hours": (NOW - pub_date).total_seconds() / 3600,
-                        "query": query
-                    })
-    
-    except Exception as e:
-        print(f"Google News error for '{query}': {e}")
-    
-    return articles
+    return [
+        {
+            "title": a["title"],
+            "url": a["url"],
+            "published": a["published"][:16].replace("T", " ") if a.get("published") else "",
+            "source": "Google News",
+            "age_hours": age_hours(a),
+            "query": query
+        }
+        for a in sources.google_news(query, max_results)
+    ]
+
 
 def scan_disasters():
     """Scan H1/H3 - Disasters"""
@@ -56,9 +56,21 @@ def add_competitor(channel, handle):
         data[channel]['competitors'].append(handle)
         save_competitors(data)
         print(f"✅ Added {handle} to {channel}")
+        resolve_channel(handle)
     else:
         print(f"⚠️ Already exists in {channel}")
 
+def resolve_channel(url):
+    """Cache the new competitor's channel ID, then refresh stale IDs in the background"""
+    import channel_resolver
+
+    channel_id = channel_resolver.resolve_many([url]).get(url)
+    if channel_id:
+        print(f"🔎 Channel ID: {channel_id}")
+    else:
+        print("⚠️ Couldn't resolve channel ID (will retry on the next scan)")
+    channel_resolver.refresh_detached()
+
 def remove_competitor(channel, handle):
     data = load_competitors()
     
@@ -11,6 +11,7 @@ import sys
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 import subprocess
+import threading
 import time
 
 # Add venv packages to path
@@ -18,16 +19,14 @@ VENV_PATH = Path(__file__).parent / "venv" / "lib"
 for p in VENV_PATH.glob("python*/site-packages"):
     sys.path.insert(0, str(p))
 
-import requests
 import feedparser
 from bs4 import BeautifulSoup
 
+import feed_cache
+import fetch_engine
+
 # Import our previous viral APIs
-from viral_apis import (
-    get_emsc_earthquakes, get_nasa_fires, get_gdacs_alerts,
-    get_congress_bills, get_federal_register, get_supreme_court_cases,
-    get_reddit_trending
-)
+from viral_apis import SOURCES as PREVIOUS_SOURCES
 
 # Import Google Trends (simple version)
 from simple_google_trends import get_channel_trends
@@ -58,8 +57,21 @@ def load_state():
     return {"last_checks": {}, "used_quotas": {}}
 
 def save_state(state):
-    """Save current timestamps and quota usage"""
-    STATE_FILE.write_text(json.dumps(state, indent=2))
+    """Save current timestamps and quota usage (atomically, sources read it concurrently)"""
+    tmp_file = STATE_FILE.with_suffix(".tmp")
+    tmp_file.write_text(json.dumps(state, indent=2))
+    os.replace(tmp_file, STATE_FILE)
+
+# Sources run concurrently: quota updates must not overwrite each other
+_STATE_LOCK = threading.Lock()
+
+def record_quota_use(api, day, units=1):
+    """Add to today's usage of a quota-limited API"""
+    with _STATE_LOCK:
+        state = load_state()
+        usage = state["used_quotas"].setdefault(api, {})
+        usage[day] = usage.get(day, 0) + units
+        save_state(state)
 
 # =============================================================================
 # NEWS APIs (All Channels)
@@ -92,15 +104,13 @@ def get_newsapi_headlines(categories=["general"], countries=["us"], page_size=20
                 'sortBy': 'publishedAt'
             }
             
-            resp = requests.get(url, params=params, headers=HEADERS, timeout=15)
+            resp = fetch_engine.get(url, params=params, headers=HEADERS, timeout=15)
             
             if resp.status_code == 200:
                 data = resp.json()
                 
                 # Update quota usage
-                state["used_quotas"]["newsapi"] = state["used_quotas"].get("newsapi", {})
-                state["used_quotas"]["newsapi"][today] = daily_usage.get(today, 0) + 1
-                save_state(state)
+                record_quota_use("newsapi", today)
                 
                 for article in data.get('articles', []):
                     pub_date_str = article.get('publishedAt', '')
@@ -154,15 +164,13 @@ def get_gnews_api(queries=["breaking news", "emergency", "disaster"], max_per_qu
                 'sortby': 'publishedAt'
             }
             
-            resp = requests.get(url, params=params, headers=HEADERS, timeout=15)
+            resp = fetch_engine.get(url, params=params, headers=HEADERS, timeout=15)
             
             if resp.status_code == 200:
                 data = resp.json()
                 
                 # Update quota usage
-                state["used_quotas"]["gnews"] = state["used_quotas"].get("gnews", {})
-                state["used_quotas"]["gnews"][today] = daily_usage.get(today, 0) + 1
-                save_state(state)
+                record_quota_use("gnews", today)
                 
                 for article in data.get('articles', []):
                     pub_date_str = article.get('publishedAt', '')
@@ -188,46 +196,70 @@ def get_gnews_api(queries=["breaking news", "emergency", "disaster"], max_per_qu
     
     return articles
 
-def get_hackernews_trending():
+# HackerNews items by ID. Title/url/time never change, score and comments do,
+# so cached items are reused for a few minutes only
+HN_API = "https://hacker-news.firebaseio.com/v0"
+HN_ITEM_TTL = 300
+_hn_items = {}  # item id -> (fetched at, item)
+_hn_lock = threading.Lock()
+
+def get_hackernews_items(item_ids, max_age=HN_ITEM_TTL):
+    """HackerNews items in the given order, fetched concurrently; cached ones reused"""
+    now = time.monotonic()
+    with _hn_lock:
+        # Forget expired items so the cache stays about one front page big
+        for item_id in [i for i, (fetched_at, _) in _hn_items.items() if now - fetched_at >= max_age]:
+            del _hn_items[item_id]
+        items = {i: _hn_items[i][1] for i in item_ids if i in _hn_items}
+    
+    missing = [i for i in item_ids if i not in items]
+    urls = [f"{HN_API}/item/{item_id}.json" for item_id in missing]
+    for item_id, resp in zip(missing, fetch_engine.get_many(urls, headers=HEADERS, timeout=10)):
+        if resp is not None and resp.status_code == 200:
+            item = resp.json()
+            if item:
+                items[item_id] = item
+    
+    with _hn_lock:
+        for item_id in missing:
+            if item_id in items:
+                _hn_items[item_id] = (now, items[item_id])
+    
+    return [items[i] for i in item_ids if i in items]
+
+def get_hackernews_trending(limit=30):
     """HackerNews API - Completely free, no limits"""
     stories = []
     
     try:
         # Get top stories
-        top_stories_url = "https://hacker-news.firebaseio.com/v0/topstories.json"
-        resp = requests.get(top_stories_url, headers=HEADERS, timeout=15)
+        resp = fetch_engine.get(f"{HN_API}/topstories.json", headers=HEADERS, timeout=15)
         
         if resp.status_code == 200:
-            story_ids = resp.json()[:30]  # Top 30 stories
+            story_ids = resp.json()[:limit]  # Top 30 stories, all fetched at once
             
-            for story_id in story_ids[:15]:  # Check first 15 for speed
-                story_url = f"https://hacker-news.firebaseio.com/v0/item/{story_id}.json"
-                story_resp = requests.get(story_url, headers=HEADERS, timeout=10)
+            for story in get_hackernews_items(story_ids):
+                story_id = story.get('id')
                 
-                if story_resp.status_code == 200:
-                    story = story_resp.json()
+                # Check if story is recent (last 24h)
+                story_time = datetime.fromtimestamp(story.get('time', 0))
+                if story_time > CUTOFF_24H:
                     
-                    # Check if story is recent (last 24h)
-                    story_time = datetime.fromtimestamp(story.get('time', 0))
-                    if story_time > CUTOFF_24H:
-                        
-                        # Tech/startup stories often predict mainstream trends
-                        title = story.get('title', '')
-                        score = story.get('score', 0)
-                        comments = story.get('descendants', 0)
-                        
-                        stories.append({
-                            "title": title,
-                            "url": story.get('url', f"https://news.ycombinator.com/item?id={story_id}"),
-                            "score": score,
-                            "comments": comments,
-                            "published": story_time.strftime("%Y-%m-%d %H:%M"),
-                            "source": "HackerNews",
-                            "source_type": "tech_news",
-                            "priority": "HIGH" if score > 200 else "MEDIUM"
-                        })
-                        
-                time.sleep(0.1)  # Be nice to their API
+                    # Tech/startup stories often predict mainstream trends
+                    title = story.get('title', '')
+                    score = story.get('score', 0)
+                    comments = story.get('descendants', 0)
+                    
+                    stories.append({
+                        "title": title,
+                        "url": story.get('url', f"https://news.ycombinator.com/item?id={story_id}"),
+                        "score": score,
+                        "comments": comments,
+                        "published": story_time.strftime("%Y-%m-%d %H:%M"),
+                        "source": "HackerNews",
+                        "source_type": "tech_news",
+                        "priority": "HIGH" if score > 200 else "MEDIUM"
+                    })
                 
     except Exception as e:
         print(f"HackerNews API error: {e}")
@@ -250,7 +282,7 @@ def get_gdelt_events(themes=["DISASTER", "CRISIS", "PROTEST"]):
                 'maxrecords': 20
             }
             
-            resp = requests.get(url, params=params, headers=HEADERS, timeout=20)
+            resp = fetch_engine.get(url, params=params, headers=HEADERS, timeout=20)
             
             if resp.status_code == 200:
                 data = resp.json()
@@ -300,15 +332,13 @@ def get_youtube_trending_videos(channel_ids=[], region_code='US'):
             'key': YOUTUBE_API_KEY
         }
         
-        resp = requests.get(url, params=params, headers=HEADERS, timeout=15)
+        resp = fetch_engine.get(url, params=params, headers=HEADERS, timeout=15)
         
         if resp.status_code == 200:
             data = resp.json()
             
             # Update quota usage (trending videos = 1 unit)
-            state["used_quotas"]["youtube"] = state["used_quotas"].get("youtube", {})
-            state["used_quotas"]["youtube"][today] = daily_usage.get(today, 0) + 1
-            save_state(state)
+            record_quota_use("youtube", today)
             
             for video in data.get('items', []):
                 snippet = video.get('snippet', {})
@@ -357,15 +387,19 @@ def get_enhanced_reddit_all_channels():
     
     all_results = {}
     
+    # Fetch every channel's subreddits at once; the fetch engine spaces out requests to reddit
+    wanted = sorted({subreddit for subreddits in channel_subreddits.values() for subreddit in subreddits[:3]})
+    urls = [f"https://www.reddit.com/r/{subreddit}/hot.json?limit=15" for subreddit in wanted]
+    responses = dict(zip(wanted, fetch_engine.get_many(urls, headers=HEADERS, timeout=15)))
+    
     for channel, subreddits in channel_subreddits.items():
         channel_posts = []
         
         for subreddit in subreddits[:3]:  # Limit to 3 subreddits per channel
             try:
-                url = f"https://www.reddit.com/r/{subreddit}/hot.json?limit=15"
-                resp = requests.get(url, headers=HEADERS, timeout=15)
+                resp = responses[subreddit]
                 
-                if resp.status_code == 200:
+                if resp is not None and resp.status_code == 200:
                     data = resp.json()
                     
                     for child in data.get('data', {}).get('children', []):
@@ -394,8 +428,6 @@ def get_enhanced_reddit_all_channels():
                                 "channel": channel,
                                 "priority": "HIGH" if engagement_rate > 50 else "MEDIUM"
                             })
-                            
-                time.sleep(0.2)  # Rate limiting
                 
             except Exception as e:
                 print(f"Reddit r/{subreddit} error: {e}")
@@ -410,39 +442,46 @@ def get_enhanced_reddit_all_channels():
 # MEGA SCAN FUNCTIONS
 # =============================================================================
 
+# Source registry: name -> (function, seconds before the scan gives up on it)
+MEGA_SOURCES = {
+    **{name: source for name, source in PREVIOUS_SOURCES.items() if name != "reddit_posts"},
+    "newsapi_headlines": (get_newsapi_headlines, 20),
+    "gnews_breaking": (get_gnews_api, 20),
+    "hackernews_trending": (get_hackernews_trending, 20),
+    "gdelt_events": (get_gdelt_events, 25),
+    "youtube_trending": (get_youtube_trending_videos, 20),
+    "reddit_by_channel": (get_enhanced_reddit_all_channels, 30),
+    "google_trends": (get_channel_trends, 60),
+}
+
+MEGA_SOURCE_GROUPS = {
+    "previous_apis": ["emsc_earthquakes", "nasa_fires", "gdacs_alerts",
+                      "congress_bills", "federal_register", "supreme_court"],
+    "new_apis": ["newsapi_headlines", "gnews_breaking", "hackernews_trending",
+                 "gdelt_events", "youtube_trending"],
+}
+
 def run_mega_free_apis():
     """Run ALL free APIs including new ones"""
     print("🚀 MEGA API SCAN - All Free Sources")
     print("=" * 50)
     
-    all_results = {
-        "timestamp": NOW.strftime("%Y-%m-%d %H:%M:%S"),
-        "previous_apis": {
-            "emsc_earthquakes": get_emsc_earthquakes(),
-            "nasa_fires": get_nasa_fires(),
-            "gdacs_alerts": get_gdacs_alerts(),
-            "congress_bills": get_congress_bills(),
-            "federal_register": get_federal_register(),
-            "supreme_court": get_supreme_court_cases()
-        },
-        "new_apis": {
-            "newsapi_headlines": get_newsapi_headlines(),
-            "gnews_breaking": get_gnews_api(),
-            "hackernews_trending": get_hackernews_trending(),
-            "gdelt_events": get_gdelt_events(),
-            "youtube_trending": get_youtube_trending_videos()
-        },
-        "enhanced_social": {}
-    }
+    # Every source at once: the scan takes about as long as the slowest one
+    before = feed_cache.stats()
+    results, timings = fetch_engine.run_sources(MEGA_SOURCES)
+    print(fetch_engine.timing_summary(timings))
+    print(feed_cache.summary(since=before))
+    
+    all_results = {"timestamp": NOW.strftime("%Y-%m-%d %H:%M:%S")}
+    for category, names in MEGA_SOURCE_GROUPS.items():
+        all_results[category] = {name: results[name] for name in names}
     
     # Enhanced Reddit by channel
-    reddit_posts, reddit_by_channel = get_enhanced_reddit_all_channels()
-    all_results["enhanced_social"]["reddit_by_channel"] = reddit_by_channel
+    reddit_posts, reddit_by_channel = results["reddit_by_channel"] or ([], {})
+    all_results["enhanced_social"] = {"reddit_by_channel": reddit_by_channel}
     
     # Google Trends analysis (simplified)
-    print("📈 Running Google Trends analysis...")
-    google_trends_data = get_channel_trends()
-    all_results["google_trends"] = google_trends_data
+    all_results["google_trends"] = results["google_trends"] or {}
     
     # Count results
     total_items = 0
@@ -3,9 +3,7 @@
 Quick Full Radar - Fast execution for all channels including N1 - TECH
 """
 
-import json
 import subprocess
-import requests
 from datetime import datetime, timedelta
 from pathlib import Path
 import sys
@@ -15,24 +13,16 @@ VENV_PATH = Path(__file__).parent / "venv" / "lib"
 for p in VENV_PATH.glob("python*/site-packages"):
     sys.path.insert(0, str(p))
 
-BASE_DIR = Path(__file__).parent
+import radar_core
+from radar_core import trello_request
 
-# Load Trello credentials
-config = json.loads(Path('/Users/malikano/clawdbot_system/config.json').read_text())
-API_KEY = config['trello_api_key']
-TOKEN = config['trello_api_token']
+BASE_DIR = Path(__file__).parent
 
-LIST_IDS = json.loads((BASE_DIR / 'trello_lists.json').read_text())
+LIST_IDS = radar_core.trello_lists()
 
 NOW = datetime.now()
 CUTOFF_24H = NOW - timedelta(hours=24)
 
-def trello_request(method, endpoint, **kwargs):
-    url = f"https://api.trello.com/1/{endpoint}"
-    params = kwargs.pop('params', {})
-    params.update({"key": API_KEY, "token": TOKEN})
-    return requests.request(method, url, params=params, **kwargs)
-
 def create_quick_card(list_name, title, content_summary):
     """Create a quick Trello card with summary"""
     list_id = LIST_IDS.get(list_name)
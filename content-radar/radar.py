@@ -6,11 +6,21 @@ Monitors alerts, competitors, and trending topics
 
 import json
 import os
+import sys
 import time
 import requests
 from datetime import datetime, timedelta
 from pathlib import Path
 
+# Add venv packages
+VENV_PATH = Path(__file__).parent / "venv" / "lib"
+for p in VENV_PATH.glob("python*/site-packages"):
+    sys.path.insert(0, str(p))
+
+import dedup_index
+import view_velocity
+from radar_core import sources
+
 # Paths
 BASE_DIR = Path(__file__).parent
 CONFIG_FILE = BASE_DIR / "config.json"
@@ -43,66 +53,48 @@ def check_usgs_earthquakes(config):
     """Check USGS for significant earthquakes"""
     alerts = []
     try:
-        url = config['alert_sources']['usgs']['url']
-        min_mag = config['alert_sources']['usgs']['min_magnitude']
-        
-        resp = requests.get(url, timeout=10)
-        data = resp.json()
-        
-        for feature in data.get('features', []):
-            props = feature['properties']
-            mag = props.get('mag', 0)
-            place = props.get('place', 'Unknown')
-            event_time = props.get('time', 0)
-            
-            if mag >= min_mag:
-                alerts.append({
-                    'type': 'earthquake',
-                    'source': 'usgs',
-                    'magnitude': mag,
-                    'location': place,
-                    'timestamp': event_time,
-                    'priority': 'HIGH' if mag >= 6.5 else 'MEDIUM',
-                    'channels': ['H1', 'H3'],
-                    'message': f"🚨 M{mag} EARTHQUAKE - {place}"
-                })
+        usgs = config['alert_sources']['usgs']
+        for quake in sources.usgs_earthquakes(usgs['min_magnitude'], hours=None, feed_url=usgs['url']):
+            mag = quake['magnitude']
+            alerts.append({
+                'type': 'earthquake',
+                'source': 'usgs',
+                'magnitude': mag,
+                'location': quake['place'],
+                'timestamp': quake.get('time_ms', 0),
+                'priority': 'HIGH' if mag >= 6.5 else 'MEDIUM',
+                'channels': ['H1', 'H3'],
+                'message': f"🚨 M{mag} EARTHQUAKE - {quake['place']}"
+            })
     except Exception as e:
         print(f"USGS check failed: {e}")
     
     return alerts
 
+
 def check_noaa_alerts(config):
     """Check NOAA for severe weather alerts"""
     alerts = []
     try:
-        url = config['alert_sources']['noaa']['url']
-        severities = config['alert_sources']['noaa']['severity']
-        
-        resp = requests.get(url, timeout=10, headers={'User-Agent': 'ContentRadar/1.0'})
-        data = resp.json()
-        
-        for feature in data.get('features', []):
-            props = feature['properties']
-            severity = props.get('severity', '')
-            event = props.get('event', '')
-            headline = props.get('headline', '')
-            
-            if severity in severities:
-                alerts.append({
-                    'type': 'weather',
-                    'source': 'noaa',
-                    'event': event,
-                    'severity': severity,
-                    'headline': headline,
-                    'priority': 'HIGH' if severity == 'Extreme' else 'MEDIUM',
-                    'channels': ['H1', 'H3'],
-                    'message': f"⛈️ {severity.upper()} WEATHER - {event}: {headline[:100]}"
-                })
+        noaa = config['alert_sources']['noaa']
+        for alert in sources.noaa_alerts(noaa['severity'], limit=None, url=noaa['url']):
+            severity = alert['severity']
+            alerts.append({
+                'type': 'weather',
+                'source': 'noaa',
+                'event': alert['event'],
+                'severity': severity,
+                'headline': alert['headline'],
+                'priority': 'HIGH' if severity == 'Extreme' else 'MEDIUM',
+                'channels': ['H1', 'H3'],
+                'message': f"⛈️ {severity.upper()} WEATHER - {alert['event']}: {alert['headline'][:100]}"
+            })
     except Exception as e:
         print(f"NOAA check failed: {e}")
     
     return alerts
 
+
 def check_supreme_court(config):
     """Check for Supreme Court decisions (placeholder - needs proper RSS)"""
     alerts = []
@@ -190,26 +182,19 @@ def analyze_competitors(config, competitors_data):
 
 def find_trending_videos(competitor_results, threshold=5000):
     """Find videos that are trending (high view velocity)"""
-    trending = []
+    videos = [video for channel_videos in competitor_results.values() for video in channel_videos]
     
-    for channel_key, videos in competitor_results.items():
-        for video in videos:
-            # Parse view count
-            views_str = video.get('views', '0')
-            try:
-                views = int(''.join(filter(str.isdigit, views_str.split()[0])))
-            except:
-                views = 0
-            
-            video['views_int'] = views
-            
-            # Simple trending detection: videos with high views
-            # In production, we'd track view velocity over time
-            if views >= threshold:
-                trending.append(video)
+    # Record this scan's counts; views/hour comes from the previous scan's sample
+    view_velocity.record_views(videos)
+    
+    trending = []
+    for video in videos:
+        video['views_int'] = view_velocity.parse_views(video.get('views'))
+        if (video.get('views_per_hour') or 0) >= threshold or view_velocity.is_breaking(video):
+            trending.append(video)
     
-    # Sort by views
-    trending.sort(key=lambda x: x.get('views_int', 0), reverse=True)
+    # Breakouts first, then by raw speed
+    trending.sort(key=lambda x: (x['outlier_score'], x.get('views_per_hour') or 0), reverse=True)
     return trending[:10]
 
 # ============== NOTIFICATION ==============
@@ -228,7 +213,8 @@ def format_alert_message(alerts, trending):
         lines.append("📈 *TRENDING FROM COMPETITORS*")
         for video in trending[:5]:
             lines.append(f"• {video['title'][:50]}...")
-            lines.append(f"  {video['views']} - {video['channel']}")
+            speed = f" ({video['views_per_hour']:,}/h)" if video.get('views_per_hour') else ""
+            lines.append(f"  {video['views']}{speed} - {video['channel']}")
         lines.append("")
     
     if not alerts and not trending:
@@ -251,14 +237,11 @@ def run_radar():
     print("Checking alerts...")
     alerts = check_all_alerts(config)
     
-    # Filter out already-seen alerts
-    seen_alerts = set(state.get('seen_alerts', []))
-    new_alerts = [a for a in alerts if a.get('message') not in seen_alerts]
-    
-    # Update seen alerts
-    for alert in new_alerts:
-        seen_alerts.add(alert['message'])
-    state['seen_alerts'] = list(seen_alerts)[-100:]  # Keep last 100
+    # Filter out already-seen alerts (same message within the alerts window)
+    seen_alerts = dedup_index.get_index('alerts')
+    new_alerts = seen_alerts.filter_new(alerts, title_key=None, id_key='message')
+    seen_alerts.save()
+    state.pop('seen_alerts', None)
     
     # Check competitors (less frequently)
     last_competitor_check = state.get('last_competitor_check', 0)
@@ -268,7 +251,9 @@ def run_radar():
     if time.time() - last_competitor_check > 3600:  # Every hour
         print("Analyzing competitors...")
         competitor_results = analyze_competitors(config, competitors)
-        trending = find_trending_videos(competitor_results)
+        trending = find_trending_videos(
+            competitor_results, config.get('trending_threshold_views_per_hour', 5000)
+        )
         state['last_competitor_check'] = time.time()
         state['last_trending'] = trending
     else:
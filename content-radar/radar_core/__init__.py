@@ -0,0 +1,15 @@
+"""
+Radar core - shared pieces of every content-radar scanner
+  sources  - one registry of feeds (Google News, Trends, Reddit, USGS, NOAA, X, competitors)
+  items    - the normalized item dict all of them return
+  sinks    - Trello card, dashboard and WhatsApp report writers
+  presets  - a scan as data: sources + sinks
+  config   - credentials and lists, loaded lazily
+HTTP goes through fetch_engine (pooled, concurrent, rate limited per host)
+"""
+
+from .config import competitors, radar_config, trello_lists
+from .items import make_item
+from .presets import run_preset, run_presets
+from .sinks import SINKS, create_card, publish, trello_request
+from .sources import SOURCES, collect
@@ -0,0 +1,54 @@
+"""
+Radar config - loaded on first use, never at import
+Scripts that only read public feeds run without the Trello credentials file
+"""
+
+import json
+import os
+from functools import lru_cache
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+# Shared with the rest of clawdbot; CLAWDBOT_CONFIG points somewhere else (e.g. on a server)
+CLAWDBOT_CONFIG_PATH = Path(os.environ.get("CLAWDBOT_CONFIG", "/Users/malikano/clawdbot_system/config.json"))
+RADAR_CONFIG_PATH = BASE_DIR / "config.json"
+TRELLO_LISTS_PATH = BASE_DIR / "trello_lists.json"
+COMPETITORS_PATH = BASE_DIR.parent / "competitors.json"
+
+
+def _load(path):
+    if path.exists():
+        return json.loads(path.read_text())
+    return {}
+
+
+@lru_cache(maxsize=None)
+def clawdbot_config():
+    return _load(CLAWDBOT_CONFIG_PATH)
+
+
+@lru_cache(maxsize=None)
+def radar_config():
+    """content-radar/config.json: channels, alert sources, intervals"""
+    return _load(RADAR_CONFIG_PATH)
+
+
+def trello_credentials():
+    """(api_key, token); KeyError names what's missing"""
+    config = clawdbot_config()
+    for key in ("trello_api_key", "trello_api_token"):
+        if key not in config:
+            raise KeyError(f"{key} missing from {CLAWDBOT_CONFIG_PATH}")
+    return config["trello_api_key"], config["trello_api_token"]
+
+
+@lru_cache(maxsize=None)
+def trello_lists():
+    """Trello list name -> list ID"""
+    return _load(TRELLO_LISTS_PATH)
+
+
+def competitors():
+    """Channel key -> {niche, competitors: [channel URLs]} (re-read: manage.py edits it)"""
+    return _load(COMPETITORS_PATH)
@@ -0,0 +1,40 @@
+"""
+Radar items - the one shape every source returns and every sink accepts
+A plain dict: title, url, source, source_type, plus whatever the source knows
+(published, views, magnitude, priority, ...)
+"""
+
+from datetime import datetime, timezone
+
+# source_type values sinks group by
+SOURCE_TYPES = ("earthquake", "weather", "google_news", "trends", "twitter", "reddit", "youtube")
+
+
+def make_item(title, url, source, source_type, **extra):
+    """Normalized radar item; None-valued extras are left out"""
+    item = {
+        "title": (title or "").strip()[:100],
+        "url": url or "",
+        "source": source or "",
+        "source_type": source_type,
+    }
+    item.update({key: value for key, value in extra.items() if value is not None})
+    return item
+
+
+def iso_time(value):
+    """ISO-8601 UTC from epoch seconds/ms or a feedparser time tuple; None if unknown"""
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        seconds = value / 1000 if value > 1e11 else value
+        return datetime.fromtimestamp(seconds, timezone.utc).isoformat()
+    return datetime(*value[:6], tzinfo=timezone.utc).isoformat()
+
+
+def age_hours(item, now=None):
+    """Hours since the item was published, None if it has no time"""
+    if not item.get("published"):
+        return None
+    published = datetime.fromisoformat(item["published"])
+    return ((now or datetime.now(timezone.utc)) - published).total_seconds() / 3600
@@ -0,0 +1,36 @@
+"""
+Radar presets - a scan is data: which sources to pull and which sinks get the result
+  {"name": ..., "sources": [(source name, kwargs), ...], "sinks": {sink name: options}}
+String sink options may use {time} for the scan time
+"""
+
+from datetime import datetime
+
+from . import sinks, sources
+
+
+def run_preset(preset, targets=None):
+    """Collect a preset's sources concurrently and publish to its sinks (or `targets`)"""
+    now = datetime.now()
+    print(f"\n{'='*55}")
+    print(preset["name"])
+    print(f"{'='*55}")
+
+    items = sources.collect(preset["sources"])
+    print(f"  📦 {len(items)} items")
+    if not items:
+        print("  ⚠️ No results found in last 24 hours")
+        return {}
+
+    targets = targets if targets is not None else preset.get("sinks", {})
+    stamp = now.strftime("%b %d %H:%M")
+    targets = {
+        name: {key: value.format(time=stamp) if isinstance(value, str) else value
+               for key, value in options.items()}
+        for name, options in targets.items()
+    }
+    return sinks.publish(items, targets)
+
+
+def run_presets(presets, targets=None):
+    return {name: run_preset(preset, targets) for name, preset in presets.items()}
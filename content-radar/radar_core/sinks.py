@@ -0,0 +1,201 @@
+"""
+Radar sinks - where a scan's items end up: Trello card, dashboard, WhatsApp report
+Every sink takes a list of radar items plus its own options; publish() fans out to several
+"""
+
+import json
+from datetime import datetime
+
+import dedup_index
+import fetch_engine
+import view_velocity
+
+from . import config
+
+TRELLO_API = "https://api.trello.com/1/{}"
+REPORT_PATH = config.BASE_DIR / "latest_report.json"
+
+# Flagged on cards: risky topics for YouTube monetization
+SENSITIVE_KEYWORDS = [
+    "shooting", "killed", "murder", "death", "dead", "dies",
+    "suicide", "assault", "rape", "abuse", "racist", "racism",
+    "terrorist", "terrorism", "massacre", "slaughter", "gun violence"
+]
+
+# Card sections: (source_type, heading, max items)
+CARD_SECTIONS = [
+    ("earthquake", "🌋 **EARTHQUAKES:**", 6),
+    ("weather", "⛈️ **SEVERE WEATHER:**", 6),
+    ("google_news", "📰 **GOOGLE NEWS:**", 6),
+    ("trends", "📈 **GOOGLE TRENDS:**", 5),
+    ("twitter", "🐦 **X/TWITTER:**", 6),
+    ("reddit", "💬 **REDDIT:**", 5),
+    ("youtube", "🎬 **YOUTUBE (Competitors - 24h only):**", 8),
+]
+
+
+def is_sensitive_for_youtube(title):
+    title_lower = title.lower()
+    return any(kw in title_lower for kw in SENSITIVE_KEYWORDS)
+
+
+# ============ TRELLO ============
+
+def trello_request(method, endpoint, **kwargs):
+    """Trello REST call; credentials are read on first use"""
+    api_key, token = config.trello_credentials()
+    params = kwargs.pop("params", {})
+    params.update({"key": api_key, "token": token})
+    kwargs.setdefault("timeout", 30)
+    return fetch_engine.get_session().request(method, TRELLO_API.format(endpoint), params=params, **kwargs)
+
+
+def format_item(item):
+    """One card line: sensitive flag, source, title, views / velocity, link"""
+    flag = "⚠️ " if is_sensitive_for_youtube(item.get("title", "")) else ""
+    source = f"[{item['source']}] " if item.get("source") else ""
+    stats = f" • {item['views']:,} views" if item.get("views") else ""
+    if item.get("views_per_hour"):
+        rocket = "🚀 " if view_velocity.is_breaking(item) else ""
+        stats += f" • {rocket}{item['views_per_hour']:,}/h"
+    return f"{flag}{source}{item['title'][:65]}{stats}\n  🔗 {item['url']}"
+
+
+def render_card(items, scan_time=None):
+    """Card description: items grouped by source type, sensitive ones flagged"""
+    scan_time = scan_time or datetime.now()
+    lines = [
+        f"📅 Scan: {scan_time.strftime('%Y-%m-%d %H:%M')}",
+        "⏰ STRICT Last 24 hours only",
+        ""
+    ]
+
+    for source_type, heading, limit in CARD_SECTIONS:
+        section = [item for item in items if item.get("source_type") == source_type]
+        if source_type == "youtube":
+            # Fastest-rising first, so a breakout beats an older video with more total views
+            section.sort(key=lambda x: (x.get("outlier_score", 0), x.get("views", 0)), reverse=True)
+        if section:
+            lines.append(heading)
+            lines.extend(f"▸ {format_item(item)}\n" for item in section[:limit])
+
+    sensitive = sum(is_sensitive_for_youtube(item.get("title", "")) for item in items)
+    if sensitive:
+        lines[2:2] = [f"⚠️ {sensitive} items flagged as potentially sensitive for YouTube", ""]
+    return "\n".join(lines)
+
+
+def create_card(list_name, name, desc):
+    """POST a card at the top of a list; the card JSON, or None"""
+    list_id = config.trello_lists().get(list_name)
+    if not list_id:
+        print(f"❌ List '{list_name}' not found")
+        return None
+
+    resp = trello_request("POST", "cards", params={
+        "idList": list_id,
+        "name": name[:200],
+        "desc": desc[:16384],
+        "pos": "top"
+    })
+    if resp.status_code == 200:
+        return resp.json()
+    print(f"❌ Trello error: {resp.text[:200]}")
+    return None
+
+
+def trello(items, list_name, title, render=render_card):
+    """ONE card with every item new to this list"""
+    seen = dedup_index.get_index(f"trello:{list_name}")
+    items = seen.filter_new(items, remember=False)
+    if not items:
+        print(f"  ⚠️ Nothing new for {list_name}")
+        return None
+
+    sensitive = sum(is_sensitive_for_youtube(item.get("title", "")) for item in items)
+    name = f"{title} ({len(items)} results)"
+    if sensitive:
+        name += f" ⚠️{sensitive} sensitive"
+
+    card = create_card(list_name, name, render(items))
+    if card:
+        seen.add_items(items)
+        seen.save()
+        print(f"  ✅ Created: {name[:60]}...")
+        if sensitive:
+            print(f"  ⚠️  {sensitive} items flagged as sensitive")
+    return card
+
+
+# ============ DASHBOARD ============
+
+def dashboard(items, tags=None):
+    """Add items as dashboard cards; breakouts and HIGH items go in as high priority"""
+    from dashboard_manager import add_card
+
+    added = 0
+    for item in items:
+        is_video = item.get("source_type") == "youtube"
+        high = item.get("priority") == "HIGH" or view_velocity.is_breaking(item)
+        if add_card(
+            title=item["title"],
+            content_type="video" if is_video else "news",
+            source=item.get("source", ""),
+            url=item["url"],
+            priority="high" if high else "medium",
+            views=item.get("views"),
+            posted_at=item.get("published"),
+            channel=item.get("channel") if is_video else None,
+            tags=tags,
+            views_per_hour=item.get("views_per_hour"),
+            outlier_score=item.get("outlier_score")
+        ):
+            added += 1
+    return added
+
+
+# ============ WHATSAPP ============
+
+def format_report(items, heading="📡 *CONTENT RADAR*", limit=8):
+    """WhatsApp message text for the top items"""
+    if not items:
+        return None
+    lines = [heading]
+    for item in items[:limit]:
+        lines.append(f"• {item['title'][:60]}")
+        lines.append(f"  {item.get('source', '')} {item['url']}")
+    lines.append("")
+    lines.append(f"_Updated: {datetime.now().strftime('%H:%M')}_")
+    return "\n".join(lines)
+
+
+def whatsapp(items, heading="📡 *CONTENT RADAR*", path=REPORT_PATH):
+    """Write latest_report.json for the WhatsApp sender; returns the message"""
+    message = format_report(items, heading)
+    if message:
+        path.write_text(json.dumps({
+            "timestamp": datetime.now().isoformat(),
+            "items": items,
+            "message": message
+        }, indent=2, default=str))
+    return message
+
+
+# name -> sink(items, **options)
+SINKS = {
+    "trello": trello,
+    "dashboard": dashboard,
+    "whatsapp": whatsapp,
+}
+
+
+def publish(items, targets):
+    """Send items to {sink name: options}; returns {sink name: result}"""
+    results = {}
+    for name, options in targets.items():
+        try:
+            results[name] = SINKS[name](items, **options)
+        except Exception as e:
+            print(f"❌ {name} sink error: {e}")
+            results[name] = None
+    return results
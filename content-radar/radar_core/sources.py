@@ -0,0 +1,202 @@
+"""
+Radar sources - every feed the scanners pull from, in one registry
+Each source returns a list of radar items; collect() runs a scan's sources concurrently
+"""
+
+import re
+import subprocess
+from functools import partial
+from urllib.parse import quote_plus, urlencode
+
+import feedparser
+
+import feed_cache
+import fetch_engine
+import youtube_feeds
+
+from . import config
+from .items import age_hours, iso_time, make_item
+
+USGS_FEED = "https://earthquake.usgs.gov/earthquakes/feed/v1.0/summary/{}.geojson"
+NOAA_ALERTS = "https://api.weather.gov/alerts/active"
+GOOGLE_NEWS_SEARCH = "https://news.google.com/rss/search?q={}+when:1d&hl=en-US&gl=US&ceid=US:en"
+GOOGLE_TRENDS_RSS = "https://trends.google.com/trending/rss?geo=US"
+REDDIT_SEARCH = "https://www.reddit.com/search.json?q={}&sort=new&t=day&limit={}"
+
+BOT_HEADERS = {"User-Agent": "ContentRadar/1.0"}
+
+
+def _recent(items, hours):
+    """Items published in the last `hours` (all of them if hours is None); undated ones stay"""
+    if not hours:
+        return items
+    return [item for item in items if (age_hours(item) or 0) <= hours]
+
+
+def _parse_google_news(resp):
+    articles = []
+    for entry in feedparser.parse(resp.content).entries:
+        # Google News titles end in " - Publisher"
+        title, _, publisher = entry.get("title", "").rpartition(" - ")
+        articles.append(make_item(
+            title or publisher, entry.get("link", ""), publisher if title else "News", "google_news",
+            published=iso_time(entry.get("published_parsed"))
+        ))
+    return articles
+
+
+def google_news(query, max_results=6, hours=24):
+    """Google News search, newest stories only"""
+    articles = feed_cache.get(GOOGLE_NEWS_SEARCH.format(quote_plus(query)), _parse_google_news) or []
+    return [dict(article, query=query) for article in _recent(articles[:max_results], hours)]
+
+
+def _parse_google_trends(resp):
+    return [{"title": entry.get("title", ""), "traffic": entry.get("ht_approx_traffic", "")}
+            for entry in feedparser.parse(resp.content).entries]
+
+
+def google_trends(keywords=None, limit=8):
+    """Google Trends daily trending searches (RSS, no rate limits), optionally keyword-filtered"""
+    trends = []
+
+    for entry in (feed_cache.get(GOOGLE_TRENDS_RSS, _parse_google_trends, timeout=10) or [])[:limit]:
+        title = entry["title"]
+        if keywords and not any(kw in title.lower() for kw in keywords):
+            continue
+        trends.append(make_item(
+            f"🔥 {title} ({entry['traffic']})",
+            f"https://trends.google.com/trends/explore?q={quote_plus(title)}&geo=US",
+            "Google Trends", "trends"
+        ))
+    return trends
+
+
+def reddit_search(query, max_results=5, hours=24):
+    """Reddit search, newest posts"""
+    resp = fetch_engine.get(REDDIT_SEARCH.format(quote_plus(query), max_results),
+                            headers=BOT_HEADERS, timeout=15)
+    posts = []
+
+    for child in resp.json().get("data", {}).get("children", []):
+        post = child.get("data", {})
+        posts.append(make_item(
+            post.get("title", ""), f"https://reddit.com{post.get('permalink', '')}",
+            f"r/{post.get('subreddit', 'reddit')}", "reddit",
+            published=iso_time(post.get("created_utc")), score=post.get("score")
+        ))
+    return _recent(posts, hours)
+
+
+def _parse_usgs(resp):
+    quakes = []
+    for feature in resp.json().get("features", []):
+        props = feature.get("properties", {})
+        mag = props.get("mag") or 0
+        place = props.get("place", "Unknown")
+        quakes.append(make_item(
+            f"M{mag} Earthquake - {place}", props.get("url", ""), "USGS", "earthquake",
+            published=iso_time(props.get("time")), time_ms=props.get("time"), magnitude=mag, place=place,
+            tsunami=props.get("tsunami", 0) == 1
+        ))
+    return quakes
+
+
+def usgs_earthquakes(min_magnitude=5.0, hours=24, feed="4.5_day", feed_url=None):
+    """USGS earthquakes at or above min_magnitude (hours=None keeps the whole feed)"""
+    quakes = feed_cache.get(feed_url or USGS_FEED.format(feed), _parse_usgs, timeout=10) or []
+    return _recent([quake for quake in quakes if quake["magnitude"] >= min_magnitude], hours)
+
+
+def _parse_noaa(resp):
+    alerts = []
+    for feature in resp.json().get("features", []):
+        props = feature.get("properties", {})
+        alerts.append(make_item(
+            f"{props.get('event', '')} - {props.get('areaDesc', '')[:50]}",
+            # Per-alert link, so dedup doesn't fold every alert into one
+            feature.get("id") or "https://www.weather.gov/alerts", f"NOAA {props.get('severity', '')}", "weather",
+            published=props.get("effective"), event=props.get("event", ""),
+            severity=props.get("severity", ""), headline=props.get("headline", ""),
+            areas=props.get("areaDesc", ""), expires=props.get("expires")
+        ))
+    return alerts
+
+
+def noaa_alerts(severities=("Extreme", "Severe"), limit=8, url=NOAA_ALERTS):
+    """NOAA active severe weather alerts"""
+    query = urlencode({"status": "actual", "severity": ",".join(severities)})
+    alerts = feed_cache.get(f"{url}?{query}", _parse_noaa, headers=BOT_HEADERS, timeout=10) or []
+    return [alert for alert in alerts if alert["severity"] in severities][:limit]
+
+
+def _parse_bird(output, account=None):
+    """Tweets from `bird --plain` output"""
+    tweets = []
+    current = {}
+    for line in output.split("\n"):
+        if line.startswith("@"):
+            match = re.match(r"@(\w+)\s*\(([^)]+)\):", line)
+            handle = account or (match.group(1) if match else None)
+            current = {"source": f"@{handle}"} if handle else {}
+            tweets.append(current)
+        elif line.startswith("url: "):
+            current["url"] = line[5:].strip()
+        elif not line.startswith(("date:", ">", "PHOTO:", "─", "[")) and line.strip() and "title" not in current:
+            current["title"] = line.strip()[:100]
+
+    return [make_item(t["title"], t["url"], t["source"], "twitter")
+            for t in tweets if t.get("title") and t.get("url") and t.get("source")]
+
+
+def twitter_search(query, max_results=6):
+    """Twitter/X search via the bird CLI"""
+    result = subprocess.run(["bird", "search", query, "-n", str(max_results), "--plain"],
+                            capture_output=True, text=True, timeout=30)
+    return _parse_bird(result.stdout)[:max_results] if result.returncode == 0 else []
+
+
+def twitter_accounts(accounts, max_per=2):
+    """Latest tweets of specific accounts via the bird CLI"""
+    def fetch(account):
+        result = subprocess.run(["bird", "user-tweets", f"@{account}", "-n", str(max_per), "--plain"],
+                                capture_output=True, text=True, timeout=30)
+        return _parse_bird(result.stdout, account) if result.returncode == 0 else []
+
+    return [tweet for tweets in fetch_engine.map_concurrent(fetch, accounts[:4]) for tweet in tweets]
+
+
+def competitor_videos(channel_key, max_per_competitor=2, hours=24):
+    """Uploads from a channel's competitors (RSS feeds, with view velocity)"""
+    urls = config.competitors().get(channel_key, {}).get("competitors", [])
+    return youtube_feeds.competitor_findings(urls, max_per_competitor, hours)
+
+
+# name -> (function, seconds the scan waits for it)
+SOURCES = {
+    "google_news": (google_news, 20),
+    "google_trends": (google_trends, 15),
+    "reddit": (reddit_search, 20),
+    "usgs": (usgs_earthquakes, 15),
+    "noaa": (noaa_alerts, 15),
+    "twitter": (twitter_search, 40),
+    "twitter_accounts": (twitter_accounts, 45),
+    "competitors": (competitor_videos, 60),
+}
+
+
+def collect(specs):
+    """Run [(source name, kwargs), ...] concurrently; items in spec order
+
+    A source that fails or misses its deadline contributes nothing.
+    """
+    tasks = {}
+    for i, (name, kwargs) in enumerate(specs):
+        func, timeout = SOURCES[name]
+        tasks[f"{name}#{i}"] = (partial(func, **kwargs), timeout)
+
+    before = feed_cache.stats()
+    results, timings = fetch_engine.run_sources(tasks)
+    print(f"  {fetch_engine.timing_summary(timings)}")
+    print(f"  {feed_cache.summary(since=before)}")
+    return [item for key in tasks for item in results[key]]
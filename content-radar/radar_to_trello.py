@@ -3,45 +3,34 @@
 Radar to Trello - Create cards with all found links/videos for each channel
 """
 
-import json
 import subprocess
-import requests
-import feedparser
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 import sys
 import re
-from urllib.parse import quote_plus
 
 # Add venv packages
 VENV_PATH = Path(__file__).parent / "venv" / "lib"
 for p in VENV_PATH.glob("python*/site-packages"):
     sys.path.insert(0, str(p))
 
+import dedup_index
+import radar_core
+from radar_core import sources, trello_request
+
 # Import APIs
 from mega_viral_apis import get_hackernews_trending
 from viral_apis import get_emsc_earthquakes, get_gdacs_alerts
 
 BASE_DIR = Path(__file__).parent
 
-# Load Trello credentials
-config = json.loads(Path('/Users/malikano/clawdbot_system/config.json').read_text())
-API_KEY = config['trello_api_key']
-TOKEN = config['trello_api_token']
-
-LIST_IDS = json.loads((BASE_DIR / 'trello_lists.json').read_text())
+LIST_IDS = radar_core.trello_lists()
 
 NOW = datetime.now()
 CUTOFF_24H = NOW - timedelta(hours=24)
 
 RSS_HEADERS = {'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'}
 
-def trello_request(method, endpoint, **kwargs):
-    url = f"https://api.trello.com/1/{endpoint}"
-    params = kwargs.pop('params', {})
-    params.update({"key": API_KEY, "token": TOKEN})
-    return requests.request(method, url, params=params, **kwargs)
-
 def search_youtube_videos(query, max_results=5):
     """Search for recent YouTube videos using yt-dlp"""
     videos = []
@@ -85,30 +74,17 @@ def search_youtube_videos(query, max_results=5):
 
 def get_google_news(query, max_results=5):
     """Get Google News results for query"""
-    articles = []
-    
-    try:
-        url = f"https://news.google.com/rss/search?q={quote_plus(query)}+when:1d&hl=en-US&gl=US&ceid=US:en"
-        resp = requests.get(url, headers=RSS_HEADERS, timeout=15)
-        
-        if resp.status_code == 200:
-            feed = feedparser.parse(resp.content)
-            
-            for entry in feed.entries[:max_results]:
-                pub_date = datetime(*entry.published_parsed[:6])
-                if pub_date > CUTOFF_24H:
-                    articles.append({
-                        "title": entry.title,
-                        "url": entry.link,
-                        "published": pub_date.strftime("%Y-%m-%d %H:%M"),
-                        "source": "Google News",
-                        "type": "news"
-                    })
-    
-    except Exception as e:
-        print(f"Google News error for '{query}': {e}")
-    
-    return articles
+    return [
+        {
+            "title": a["title"],
+            "url": a["url"],
+            "published": a["published"][:16].replace("T", " ") if a.get("published") else "",
+            "source": "Google News",
+            "type": "news"
+        }
+        for a in sources.google_news(query, max_results)
+    ]
+
 
 def create_channel_trello_card(list_name, channel_name, findings):
     """Create Trello card with all findings for a channel"""
@@ -117,6 +93,13 @@ def create_channel_trello_card(list_name, channel_name, findings):
         print(f"❌ List '{list_name}' not found")
         return None
     
+    # Drop anything this list already got (same URL or same story) inside the window
+    seen = dedup_index.get_index(f"trello:{list_name}")
+    findings = seen.filter_new(findings, remember=False)
+    if not findings:
+        print(f"  ⚠️ Nothing new for {list_name}")
+        return None
+    
     # Card title with timestamp and count
     title = f"{channel_name} Radar - {len(findings)} items - {NOW.strftime('%m/%d %H:%M')}"
     
@@ -219,6 +202,8 @@ def create_channel_trello_card(list_name, channel_name, findings):
         if response.status_code == 200:
             card_id = response.json().get("id")
             print(f"✅ Created Trello card: {title}")
+            seen.add_items(findings)
+            seen.save()
             return card_id
         else:
             print(f"❌ Trello error: {response.text}")
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Radar Scheduler - One long-running process instead of a cron job per scan
+Each source runs on its own cadence from config.json (check_interval_minutes), with jitter.
+Imports, the pooled HTTP session, feed ETags and dedup indexes stay warm between runs.
+Only new items are written out. GET /status on the local port shows every job.
+
+Usage:
+    python scheduler.py              # run forever
+    python scheduler.py --once       # run every job once and exit
+    python scheduler.py --port 8787
+"""
+
+import json
+import os
+import random
+import signal
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add venv packages
+VENV_PATH = Path(__file__).parent / "venv" / "lib"
+for p in VENV_PATH.glob("python*/site-packages"):
+    sys.path.insert(0, str(p))
+
+import channel_resolver
+import dedup_index
+import feed_cache
+import radar
+import view_velocity
+import youtube_feeds
+
+# Paths
+BASE_DIR = Path(__file__).parent
+STATE_PATH = BASE_DIR / "scheduler_state.json"
+REPORT_PATH = BASE_DIR / "latest_report.json"
+
+STATUS_PORT = int(os.environ.get("RADAR_STATUS_PORT", 8787))
+
+# Each run is rescheduled interval * (1 ± JITTER), so sources don't fire in lockstep
+JITTER = 0.1
+# On a cold start, jobs that are due start within this many seconds of each other
+STARTUP_SPREAD_SECONDS = 30
+# Longest the loop sleeps before rechecking
+MAX_SLEEP_SECONDS = 5
+MAX_WORKERS = 4
+
+
+# ============ JOBS ============
+
+def competitor_job(config):
+    """Trending competitor uploads (RSS feeds, view velocity)"""
+    threshold = config.get("trending_threshold_views_per_hour", 5000)
+    feeds = youtube_feeds.poll_channels(channel_resolver.all_competitor_urls())
+    videos = [video for channel_videos in feeds.values() for video in channel_videos]
+    trending = [video for video in videos
+                if (video.get("views_per_hour") or 0) >= threshold or view_velocity.is_breaking(video)]
+    trending.sort(key=lambda x: (x.get("outlier_score", 0), x.get("views_per_hour") or 0), reverse=True)
+    return trending[:10]
+
+
+# config.json source name -> (check function, kind of item it returns)
+JOBS = {
+    "usgs": (radar.check_usgs_earthquakes, "alerts"),
+    "noaa": (radar.check_noaa_alerts, "alerts"),
+    "supreme_court": (radar.check_supreme_court, "alerts"),
+    "competitors": (competitor_job, "trending"),
+}
+
+
+def job_intervals(config):
+    """Job name -> minutes, for every job config.json gives a cadence"""
+    intervals = {}
+    for name, source in config.get("alert_sources", {}).items():
+        if name in JOBS and source.get("check_interval_minutes"):
+            intervals[name] = source["check_interval_minutes"]
+    if config.get("competitor_check_interval_minutes"):
+        intervals["competitors"] = config["competitor_check_interval_minutes"]
+    return intervals
+
+
+def jittered(seconds):
+    return seconds * random.uniform(1 - JITTER, 1 + JITTER)
+
+
+# ============ SCHEDULER ============
+
+class Scheduler:
+    """Runs every job on its own interval in a small worker pool"""
+
+    def __init__(self, config, state_path=STATE_PATH, report_path=REPORT_PATH):
+        self.config = config
+        self.state_path = state_path
+        self.report_path = report_path
+        self.started = time.time()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._wake = threading.Event()  # set when a job finishes, so its next run is picked up
+        self._pool = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="radar-job")
+        self._seen = dedup_index.get_index("alerts")
+
+        last_runs = self._load_state()
+        now = time.time()
+        self.jobs = {}
+        for name, minutes in job_intervals(config).items():
+            interval = minutes * 60
+            last_run = last_runs.get(name)
+            # Keep the cadence across restarts; overdue jobs are spread over the first seconds
+            if last_run and last_run + interval > now:
+                next_run = last_run + jittered(interval)
+            else:
+                next_run = now + random.uniform(0, STARTUP_SPREAD_SECONDS)
+            self.jobs[name] = {
+                "interval_minutes": minutes,
+                "next_run": next_run,
+                "last_run": last_run,
+                "last_duration": None,
+                "last_new": 0,
+                "last_error": None,
+                "runs": 0,
+                "running": False,
+            }
+
+    def _load_state(self):
+        if self.state_path.exists():
+            return json.loads(self.state_path.read_text()).get("last_run", {})
+        return {}
+
+    def _save_state(self):
+        with self._lock:
+            data = {"last_run": {name: job["last_run"] for name, job in self.jobs.items() if job["last_run"]}}
+        tmp_path = self.state_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(data, indent=2))
+        os.replace(tmp_path, self.state_path)
+
+    def _publish(self, name, kind, items):
+        """Write latest_report.json for the WhatsApp sender if the run found anything new"""
+        if kind == "alerts":
+            new = self._seen.filter_new(items, title_key=None, id_key="message")
+            alerts, trending = new, []
+        else:
+            new = self._seen.filter_new(items, title_key=None)
+            alerts, trending = [], new
+        if not new:
+            return 0
+
+        self._seen.save()
+        message = radar.format_alert_message(alerts, trending)
+        report = {
+            "timestamp": datetime.now().isoformat(),
+            "source": name,
+            "alerts": alerts,
+            "trending": trending,
+            "message": message
+        }
+        tmp_path = self.report_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(report, indent=2, default=str))
+        os.replace(tmp_path, self.report_path)
+        print(f"\n{message}")
+        return len(new)
+
+    def run_job(self, name):
+        func, kind = JOBS[name]
+        job = self.jobs[name]
+        started = time.time()
+        before = feed_cache.stats()
+        error = None
+        new = 0
+        try:
+            new = self._publish(name, kind, func(self.config))
+        except Exception as e:
+            error = str(e)
+            print(f"❌ {name} job error: {e}")
+
+        finished = time.time()
+        with self._lock:
+            job.update({
+                "last_run": started,
+                "last_duration": round(finished - started, 2),
+                "last_new": new,
+                "last_error": error,
+                "runs": job["runs"] + 1,
+                "running": False,
+                "next_run": started + jittered(job["interval_minutes"] * 60),
+            })
+        self._save_state()
+        self._wake.set()
+        print(f"⏱️  {name}: {new} new in {finished - started:.1f}s | {feed_cache.summary(since=before)}")
+
+    def _due(self, now):
+        with self._lock:
+            due = [name for name, job in self.jobs.items() if not job["running"] and job["next_run"] <= now]
+            for name in due:
+                self.jobs[name]["running"] = True
+        return due
+
+    def run_forever(self):
+        print(f"🛰️ Scheduler running {len(self.jobs)} jobs: " +
+              ", ".join(f"{name} every {job['interval_minutes']}m" for name, job in self.jobs.items()))
+        while not self._stop.is_set():
+            for name in self._due(time.time()):
+                self._pool.submit(self.run_job, name)
+            with self._lock:
+                pending = [job["next_run"] for job in self.jobs.values() if not job["running"]]
+            wait = min(pending, default=time.time() + MAX_SLEEP_SECONDS) - time.time()
+            self._wake.wait(max(0.1, min(wait, MAX_SLEEP_SECONDS)))
+            self._wake.clear()
+        self._pool.shutdown(wait=True)
+        print("🛑 Scheduler stopped")
+
+    def run_once(self):
+        for name in self._due(float("inf")):
+            self.run_job(name)
+
+    def stop(self, *_):
+        self._stop.set()
+        self._wake.set()
+
+    def status(self):
+        def iso(ts):
+            return datetime.fromtimestamp(ts).isoformat(timespec="seconds") if ts else None
+
+        with self._lock:
+            jobs = {
+                name: {**job, "last_run": iso(job["last_run"]), "next_run": iso(job["next_run"])}
+                for name, job in self.jobs.items()
+            }
+        return {
+            "pid": os.getpid(),
+            "started": iso(self.started),
+            "uptime_seconds": round(time.time() - self.started),
+            "jobs": jobs,
+            "http_cache": feed_cache.stats(),
+        }
+
+
+# ============ STATUS ENDPOINT ============
+
+def serve_status(scheduler, port=STATUS_PORT):
+    """GET /status -> scheduler status JSON (localhost only), in a daemon thread"""
+    class StatusHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.rstrip("/") not in ("", "/status"):
+                self.send_error(404)
+                return
+            body = json.dumps(scheduler.status(), indent=2).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", port), StatusHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"📊 Status: http://127.0.0.1:{server.server_port}/status")
+    return server
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--once", action="store_true", help="Run every job once and exit")
+    parser.add_argument("--port", type=int, default=STATUS_PORT, help="Status endpoint port")
+    args = parser.parse_args()
+
+    scheduler = Scheduler(radar.load_config())
+    if args.once:
+        scheduler.run_once()
+    else:
+        signal.signal(signal.SIGTERM, scheduler.stop)
+        signal.signal(signal.SIGINT, scheduler.stop)
+        serve_status(scheduler, args.port)
+        scheduler.run_forever()
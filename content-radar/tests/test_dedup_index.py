@@ -0,0 +1,32 @@
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import dedup_index
+
+TITLE = "Massive wildfire forces evacuation of northern California town overnight"
+
+
+def test_expired_near_duplicate_does_not_hide_a_fresh_one(tmp_path):
+    index = dedup_index.DedupIndex("trello:test", window_hours=1, path=tmp_path / "dedup.json")
+    index.add(title=TITLE, seen_at=time.time() - 7200)
+    assert not index.seen(title=TITLE)
+
+    index.add(title=TITLE.replace(" overnight", ""))
+    assert index.seen(title=TITLE)
+
+
+def test_filter_new_without_remember_marks_nothing(tmp_path):
+    index = dedup_index.DedupIndex("trello:test", path=tmp_path / "dedup.json")
+    items = [{"url": "https://example.com/a", "title": TITLE},
+             {"url": "https://www.example.com/a/", "title": "Duplicate"},
+             {"url": "https://example.com/b", "title": "Something else entirely happened today"}]
+
+    fresh = index.filter_new(items, remember=False)
+    assert [item["url"] for item in fresh] == ["https://example.com/a", "https://example.com/b"]
+    assert index.filter_new(items, remember=False) == fresh
+
+    index.add_items(fresh)
+    assert index.filter_new(items) == []
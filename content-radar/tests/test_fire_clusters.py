@@ -0,0 +1,30 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import fire_clusters
+
+
+def _spot(lat, lon):
+    return {"lat": lat, "lon": lon, "confidence": 90, "frp": 10.0, "acquired": "2026-08-01 1200"}
+
+
+def test_hotspots_across_a_row_boundary_form_one_cluster():
+    cell_deg = fire_clusters.CELL_KM / fire_clusters.KM_PER_DEG_LAT
+    boundary = 1309 * cell_deg  # row edge near 47.04°N, where per-row scaling used to split fires
+    spots = [_spot(boundary + d_lat, -120.5 + d_lon)
+             for d_lat in (-0.001, 0.001) for d_lon in (-0.002, 0.0, 0.002)]
+
+    cells = fire_clusters.grid_cells(spots)
+    assert {row for row, _ in cells} == {1308, 1309}
+
+    clusters = fire_clusters.cluster_cells(cells, min_hotspots=5)
+    assert len(clusters) == 1
+    assert clusters[0]["count"] == 6
+
+
+def test_distant_hotspots_stay_separate():
+    spots = [_spot(40.0, -120.0)] * 5 + [_spot(40.5, -120.0)] * 5
+    clusters = fire_clusters.cluster_cells(fire_clusters.grid_cells(spots), min_hotspots=5)
+    assert len(clusters) == 2
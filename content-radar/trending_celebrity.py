@@ -1,6 +1,5 @@
 #!/usr/bin/env python3
 
-import json
 import subprocess
 from datetime import datetime
 from pathlib import Path
@@ -14,12 +13,9 @@ for p in VENV_PATH.glob("python*/site-packages"):
     sys.path.insert(0, str(p))
 
 import requests
-import feedparser
 
-# Load Trello config
-config = json.loads(Path('/Users/malikano/clawdbot_system/config.json').read_text())
-API_KEY = config['trello_api_key']
-TOKEN = config['trello_api_token']
+from radar_core import trello_request
+import feedparser
 
 HIGH_PRIORITY_LIST = '697b21cc2f0009bca194f59b'  # High Priority list
 
@@ -178,11 +174,7 @@ card_data = {
     'pos': 'top'
 }
 
-response = requests.post(
-    'https://api.trello.com/1/cards',
-    params={'key': API_KEY, 'token': TOKEN},
-    json=card_data
-)
+response = trello_request('POST', 'cards', json=card_data)
 
 if response.status_code == 200:
     card = response.json()
@@ -4,9 +4,7 @@ Ultimate Trello ContentRadar v6 - Maximum Intelligence
 Includes ALL free APIs: Original 7 + NewsAPI + GNews + HackerNews + GDELT + YouTube + Enhanced Reddit
 """
 
-import json
 import subprocess
-import requests
 import feedparser
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -19,6 +17,10 @@ VENV_PATH = Path(__file__).parent / "venv" / "lib"
 for p in VENV_PATH.glob("python*/site-packages"):
     sys.path.insert(0, str(p))
 
+import dedup_index
+import radar_core
+from radar_core import trello_request
+
 # Import our mega viral APIs
 from mega_viral_apis import (
     run_mega_free_apis, get_mega_high_priority,
@@ -28,29 +30,25 @@ from mega_viral_apis import (
 
 BASE_DIR = Path(__file__).parent
 
-# Load Trello credentials
-config = json.loads(Path('/Users/malikano/clawdbot_system/config.json').read_text())
-API_KEY = config['trello_api_key']
-TOKEN = config['trello_api_token']
-
-LIST_IDS = json.loads((BASE_DIR / 'trello_lists.json').read_text())
+LIST_IDS = radar_core.trello_lists()
 
 # Time filters
 NOW = datetime.now()
 CUTOFF_24H = NOW - timedelta(hours=24)
 
-def trello_request(method, endpoint, **kwargs):
-    url = f"https://api.trello.com/1/{endpoint}"
-    params = kwargs.pop('params', {})
-    params.update({"key": API_KEY, "token": TOKEN})
-    return requests.request(method, url, params=params, **kwargs)
-
 def create_ultimate_card(list_name, title, findings, channel_focus=None):
     """Create ULTIMATE card with ALL API sources"""
     list_id = LIST_IDS.get(list_name)
     if not list_id:
         return None
     
+    # Drop anything this list already got (same URL or same story) inside the window
+    seen = dedup_index.get_index(f"trello:{list_name}")
+    findings = seen.filter_new(findings, remember=False)
+    if not findings:
+        print(f"  ⚠️ Nothing new for {list_name}")
+        return None
+    
     desc_lines = [
         f"📅 Ultimate Scan: {NOW.strftime('%Y-%m-%d %H:%M')}",
         "🚀 MAXIMUM INTELLIGENCE - All Free APIs",
@@ -235,6 +233,8 @@ def create_ultimate_card(list_name, title, findings, channel_focus=None):
         if response.status_code == 200:
             card_id = response.json().get("id")
             print(f"✅ Created ultimate card: {title}")
+            seen.add_items(findings)
+            seen.save()
             return card_id
         else:
             print(f"❌ Trello error: {response.text}")
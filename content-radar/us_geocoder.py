@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+US Geocoder - Offline reverse geocoding of a lat/lon to county and state
+Point-in-polygon against simplified county boundaries bundled in us_counties.json.gz,
+loaded on first use and indexed by 1° cells so a lookup only tests a handful of counties.
+
+The shipped bundle is built from the Census cb_2016_us_county_500k boundaries. To rebuild
+from a newer cartographic boundary file (GeoJSON):
+    python us_geocoder.py --build cb_2023_us_county_500k.geojson
+"""
+
+import gzip
+import json
+import math
+import threading
+from pathlib import Path
+
+# Paths
+BASE_DIR = Path(__file__).parent
+DATA_PATH = BASE_DIR / "us_counties.json.gz"
+
+# Degrees per index cell
+INDEX_DEG = 1.0
+# Decimal places kept when building (3 ≈ 100 m, plenty for naming a county)
+PRECISION = 3
+
+STATE_FIPS = {
+    "01": "AL", "02": "AK", "04": "AZ", "05": "AR", "06": "CA", "08": "CO", "09": "CT",
+    "10": "DE", "11": "DC", "12": "FL", "13": "GA", "15": "HI", "16": "ID", "17": "IL",
+    "18": "IN", "19": "IA", "20": "KS", "21": "KY", "22": "LA", "23": "ME", "24": "MD",
+    "25": "MA", "26": "MI", "27": "MN", "28": "MS", "29": "MO", "30": "MT", "31": "NE",
+    "32": "NV", "33": "NH", "34": "NJ", "35": "NM", "36": "NY", "37": "NC", "38": "ND",
+    "39": "OH", "40": "OK", "41": "OR", "42": "PA", "44": "RI", "45": "SC", "46": "SD",
+    "47": "TN", "48": "TX", "49": "UT", "50": "VT", "51": "VA", "53": "WA", "54": "WV",
+    "55": "WI", "56": "WY", "60": "AS", "66": "GU", "69": "MP", "72": "PR", "78": "VI",
+}
+
+# Census LSAD codes -> the word after the name ("Orleans Parish", "Juneau City and Borough")
+LSAD_NAMES = {
+    "00": "", "03": "City and Borough", "04": "Borough", "05": "Census Area", "06": "County",
+    "07": "District", "12": "Municipality", "13": "Municipio", "15": "Parish", "25": "city",
+}
+
+_lock = threading.Lock()
+_data = None  # (counties, {(lat cell, lon cell): [county index]}), or () if there is no bundle
+
+
+def _cell(lat, lon):
+    return math.floor(lat / INDEX_DEG), math.floor(lon / INDEX_DEG)
+
+
+def _load():
+    global _data
+    with _lock:
+        if _data is None:
+            if not DATA_PATH.exists():
+                print(f"⚠️ {DATA_PATH.name} missing - fire clusters will show coordinates only")
+                _data = ()
+                return _data
+
+            counties = json.loads(gzip.decompress(DATA_PATH.read_bytes()))["counties"]
+            index = {}
+            for i, county in enumerate(counties):
+                min_lon, min_lat, max_lon, max_lat = county["bbox"]
+                lat0, lon0 = _cell(min_lat, min_lon)
+                lat1, lon1 = _cell(max_lat, max_lon)
+                for row in range(lat0, lat1 + 1):
+                    for col in range(lon0, lon1 + 1):
+                        index.setdefault((row, col), []).append(i)
+            _data = (counties, index)
+        return _data
+
+
+def _contains(rings, lon, lat):
+    """Even-odd rule over every ring, so holes and multi-part counties both work"""
+    inside = False
+    for ring in rings:
+        j = len(ring) - 1
+        for i in range(len(ring)):
+            xi, yi = ring[i]
+            xj, yj = ring[j]
+            if (yi > lat) != (yj > lat) and lon < (xj - xi) * (lat - yi) / (yj - yi) + xi:
+                inside = not inside
+            j = i
+    return inside
+
+
+def locate(lat, lon):
+    """{"county", "state"} for a point, None if it's outside every county (or no bundle)"""
+    data = _load()
+    if not data:
+        return None
+    counties, index = data
+
+    for i in index.get(_cell(lat, lon), []):
+        county = counties[i]
+        min_lon, min_lat, max_lon, max_lat = county["bbox"]
+        if min_lon <= lon <= max_lon and min_lat <= lat <= max_lat and _contains(county["rings"], lon, lat):
+            return {"county": county["name"], "state": county["state"]}
+    return None
+
+
+def describe(lat, lon):
+    """'Shasta County, CA', or None"""
+    place = locate(lat, lon)
+    return f"{place['county']}, {place['state']}" if place else None
+
+
+# =============================================================================
+# BUILD
+# =============================================================================
+
+def _simplify(ring):
+    """Round to PRECISION and drop points that collapse onto the previous one"""
+    points = []
+    for lon, lat in (point[:2] for point in ring):
+        point = [round(lon, PRECISION), round(lat, PRECISION)]
+        if not points or point != points[-1]:
+            points.append(point)
+    return points if len(points) >= 4 else None
+
+
+def build(geojson_path, out_path=DATA_PATH):
+    """Compact county bundle from a Census county GeoJSON (cb_*_us_county_*)"""
+    features = json.loads(Path(geojson_path).read_text())["features"]
+    counties = []
+
+    for feature in features:
+        props = feature["properties"]
+        geometry = feature["geometry"]
+        polygons = geometry["coordinates"] if geometry["type"] == "MultiPolygon" else [geometry["coordinates"]]
+        rings = [r for r in (_simplify(ring) for polygon in polygons for ring in polygon) if r]
+        if not rings:
+            continue
+
+        lons = [lon for ring in rings for lon, _ in ring]
+        lats = [lat for ring in rings for _, lat in ring]
+        counties.append({
+            "name": props.get("NAMELSAD") or f"{props['NAME']} {LSAD_NAMES.get(props.get('LSAD'), 'County')}".strip(),
+            "state": props.get("STUSPS") or STATE_FIPS.get(props.get("STATEFP") or props.get("STATE"), ""),
+            "bbox": [min(lons), min(lats), max(lons), max(lats)],
+            "rings": rings
+        })
+
+    out_path.write_bytes(gzip.compress(json.dumps({"counties": counties}, separators=(",", ":")).encode()))
+    print(f"✅ {len(counties)} counties -> {out_path.name} ({out_path.stat().st_size / 1024:.0f} KB)")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--build", metavar="GEOJSON", help="Census county GeoJSON to bundle")
+    parser.add_argument("point", nargs="*", type=float, help="lat lon to look up")
+    args = parser.parse_args()
+
+    if args.build:
+        build(args.build)
+    if len(args.point) == 2:
+        print(describe(*args.point) or "Not in any US county")
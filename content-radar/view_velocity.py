@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+View Velocity - Time series of competitor video views (SQLite)
+Every scan appends (video_id, timestamp, views); views/hour and acceleration are
+updated from the previous sample only, and an outlier score ranks each video
+against everything else that moved recently
+"""
+
+import math
+import re
+import sqlite3
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Paths
+BASE_DIR = Path(__file__).parent
+DB_PATH = BASE_DIR / "view_history.db"
+
+# Samples closer together than this are too noisy for a rate
+MIN_SAMPLE_MINUTES = 5
+
+# Videos updated within this window form the baseline for outlier scores
+BASELINE_HOURS = 72
+MIN_BASELINE = 5
+
+# How much a speeding-up video adds on top of its views/hour score
+ACCELERATION_WEIGHT = 0.5
+
+# Score at which a video counts as breaking out
+OUTLIER_THRESHOLD = 3.0
+
+RETENTION_DAYS = 14
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS samples (
+    video_id TEXT NOT NULL,
+    ts REAL NOT NULL,
+    views INTEGER NOT NULL,
+    PRIMARY KEY (video_id, ts)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS velocity (
+    video_id TEXT PRIMARY KEY,
+    ts REAL NOT NULL,
+    views INTEGER NOT NULL,
+    views_per_hour REAL,
+    acceleration REAL
+);
+CREATE INDEX IF NOT EXISTS velocity_ts ON velocity (ts);
+"""
+
+VIEW_SUFFIXES = {"k": 1_000, "m": 1_000_000, "b": 1_000_000_000}
+
+
+def _connect():
+    conn = sqlite3.connect(DB_PATH, timeout=10)
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def parse_views(value):
+    """View count from an int or text like '12,345 views' / '1.2M views'"""
+    if isinstance(value, (int, float)):
+        return int(value)
+    match = re.search(r"([\d.,]+)\s*([kmb])?", str(value or "").lower())
+    if not match:
+        return 0
+    number = float(match.group(1).replace(",", "") or 0)
+    return int(number * VIEW_SUFFIXES.get(match.group(2), 1))
+
+
+def _published_ts(published):
+    """Epoch seconds of an ISO timestamp, None if missing or unreadable"""
+    if not published:
+        return None
+    try:
+        return datetime.fromisoformat(published.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def _update(conn, video, now):
+    """Fold one new sample into the video's velocity row"""
+    video_id = video["video_id"]
+    views = parse_views(video.get("views"))
+    last = conn.execute(
+        "SELECT ts, views, views_per_hour FROM velocity WHERE video_id = ?", (video_id,)
+    ).fetchone()
+
+    if last and now - last[0] < MIN_SAMPLE_MINUTES * 60:
+        return
+
+    views_per_hour = acceleration = None
+    if last:
+        hours = (now - last[0]) / 3600
+        views_per_hour = max(views - last[1], 0) / hours
+        if last[2] is not None:
+            acceleration = (views_per_hour - last[2]) / hours
+    else:
+        # First sighting: average rate since upload, if we know when that was
+        published = _published_ts(video.get("published"))
+        if published and now > published:
+            views_per_hour = views / max((now - published) / 3600, 1 / 6)
+
+    conn.execute("INSERT OR REPLACE INTO samples VALUES (?, ?, ?)", (video_id, now, views))
+    conn.execute("INSERT OR REPLACE INTO velocity VALUES (?, ?, ?, ?, ?)",
+                 (video_id, now, views, views_per_hour, acceleration))
+
+
+def _robust_scale(values):
+    """(median, scale) with MAD as the spread, so one viral video can't hide the next"""
+    values = sorted(values)
+    median = values[len(values) // 2]
+    deviations = [abs(v - median) for v in values]
+    mad = sorted(deviations)[len(values) // 2]
+    if mad:
+        return median, 1.4826 * mad
+    # Over half the values tie (e.g. zero acceleration): fall back to mean deviation
+    return median, (1.2533 * sum(deviations) / len(deviations)) or 1.0
+
+
+def _signed_log(value):
+    return math.copysign(math.log1p(abs(value)), value)
+
+
+def _scores(conn, now):
+    """{video_id: (views_per_hour, acceleration, outlier_score)} for the baseline window"""
+    rows = conn.execute(
+        "SELECT video_id, views_per_hour, acceleration FROM velocity "
+        "WHERE ts >= ? AND views_per_hour IS NOT NULL",
+        (now - BASELINE_HOURS * 3600,)
+    ).fetchall()
+    if len(rows) < MIN_BASELINE:
+        return {video_id: (vph, accel, 0.0) for video_id, vph, accel in rows}
+
+    # Log scale: views/hour spans several orders of magnitude across channels
+    rate_median, rate_scale = _robust_scale([math.log1p(vph) for _, vph, _ in rows])
+    accels = [_signed_log(a) for _, _, a in rows if a is not None]
+    accel_median, accel_scale = _robust_scale(accels) if accels else (0.0, 1.0)
+
+    scores = {}
+    for video_id, vph, accel in rows:
+        score = (math.log1p(vph) - rate_median) / rate_scale
+        if accel is not None:
+            score += ACCELERATION_WEIGHT * max((_signed_log(accel) - accel_median) / accel_scale, 0)
+        scores[video_id] = (vph, accel, round(score, 2))
+    return scores
+
+
+def _annotate(conn, videos, now):
+    scores = _scores(conn, now)
+    for video in videos:
+        vph, accel, score = scores.get(video.get("video_id"), (None, None, 0.0))
+        video["views_per_hour"] = round(vph) if vph is not None else None
+        video["acceleration"] = round(accel) if accel is not None else None
+        video["outlier_score"] = score
+    return videos
+
+
+def record_views(videos, now=None):
+    """Store this scan's view counts and add views_per_hour, acceleration and
+    outlier_score to each video dict (needs 'video_id' and 'views')"""
+    now = now or time.time()
+    conn = _connect()
+    try:
+        with conn:
+            for video in videos:
+                if video.get("video_id"):
+                    _update(conn, video, now)
+            conn.execute("DELETE FROM samples WHERE ts < ?", (now - RETENTION_DAYS * 86400,))
+            conn.execute("DELETE FROM velocity WHERE ts < ?", (now - RETENTION_DAYS * 86400,))
+        return _annotate(conn, videos, now)
+    finally:
+        conn.close()
+
+
+def annotate(videos, now=None):
+    """Add the stored velocity and score without recording a sample (e.g. unchanged feeds)"""
+    conn = _connect()
+    try:
+        return _annotate(conn, videos, now or time.time())
+    finally:
+        conn.close()
+
+
+def is_breaking(video):
+    return (video.get("outlier_score") or 0) >= OUTLIER_THRESHOLD
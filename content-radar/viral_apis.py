@@ -19,10 +19,13 @@ VENV_PATH = Path(__file__).parent / "venv" / "lib"
 for p in VENV_PATH.glob("python*/site-packages"):
     sys.path.insert(0, str(p))
 
-import requests
 import feedparser
 from bs4 import BeautifulSoup
 
+import feed_cache
+import fetch_engine
+import fire_clusters
+
 # Paths
 BASE_DIR = Path(__file__).parent
 STATE_FILE = BASE_DIR / "api_state.json"
@@ -56,7 +59,7 @@ def get_emsc_earthquakes(min_magnitude=5.5):
     alerts = []
     try:
         url = "https://www.seismicportal.eu/fdsnws/event/1/query?format=json&limit=20&orderby=time"
-        resp = requests.get(url, headers=HEADERS, timeout=15)
+        resp = fetch_engine.get(url, headers=HEADERS, timeout=15)
         if resp.status_code == 200:
             data = resp.json()
             
@@ -87,98 +90,77 @@ def get_emsc_earthquakes(min_magnitude=5.5):
     return sorted(alerts, key=lambda x: x.get('magnitude', 0), reverse=True)
 
 def get_nasa_fires():
-    """NASA FIRMS - Real-time wildfire hotspots"""
+    """NASA FIRMS - Real-time wildfire hotspots, clustered across the whole 24h file"""
     fires = []
     try:
-        # VIIRS active fires (last 24h)
-        url = "https://firms.modaps.eosdis.nasa.gov/data/active_fire/viirs/csv/VNP14IMGTDL_NRT_USA_contiguous_and_Hawaii_24h.csv"
-        resp = requests.get(url, headers=HEADERS, timeout=30)
-        
-        if resp.status_code == 200:
-            lines = resp.text.strip().split('\n')
-            headers = lines[0].split(',')
-            
-            fire_count = {}  # Group by state/region
-            
-            for line in lines[1:51]:  # First 50 fires
-                fields = line.split(',')
-                if len(fields) >= 10:
-                    lat = fields[0]
-                    lon = fields[1]
-                    confidence = fields[8]
-                    acq_date = fields[5]
-                    acq_time = fields[6]
-                    
-                    # Group fires by approximate location
-                    region_key = f"{lat[:4]},{lon[:5]}"  # Approximate region grouping
-                    
-                    if region_key not in fire_count:
-                        fire_count[region_key] = {
-                            "count": 0,
-                            "max_confidence": 0,
-                            "lat": lat,
-                            "lon": lon,
-                            "date": acq_date,
-                            "time": acq_time
-                        }
-                    
-                    fire_count[region_key]["count"] += 1
-                    fire_count[region_key]["max_confidence"] = max(
-                        fire_count[region_key]["max_confidence"], 
-                        float(confidence) if confidence.replace('.', '').isdigit() else 0
-                    )
-            
-            # Convert to alerts for significant fire clusters
-            for region, data in fire_count.items():
-                if data["count"] >= 5:  # 5+ hotspots in same area
-                    fires.append({
-                        "title": f"Wildfire Cluster: {data['count']} hotspots detected",
-                        "location": f"Lat {data['lat']}, Lon {data['lon']}",
-                        "confidence": data['max_confidence'],
-                        "count": data['count'],
-                        "date": data['date'],
-                        "url": f"https://firms.modaps.eosdis.nasa.gov/map/#d:24hrs;@{data['lon']},{data['lat']},12z",
-                        "source": "NASA FIRMS",
-                        "source_type": "wildfire",
-                        "priority": "HIGH" if data['count'] >= 15 else "MEDIUM"
-                    })
+        for cluster in fire_clusters.fire_clusters(headers=HEADERS, timeout=30)[:10]:
+            coords = f"Lat {cluster['lat']}, Lon {cluster['lon']}"
+            place = f"{cluster['county']}, {cluster['state']}" if cluster["county"] else coords
+            fires.append({
+                "title": f"Wildfire Cluster: {cluster['count']} hotspots near {place}",
+                "location": place,
+                "lat": cluster["lat"],
+                "lon": cluster["lon"],
+                "state": cluster["state"],
+                "county": cluster["county"],
+                "confidence": cluster["max_confidence"],
+                "count": cluster["count"],
+                "frp": cluster["frp"],
+                "date": cluster["latest"][:10],
+                "url": f"https://firms.modaps.eosdis.nasa.gov/map/#d:24hrs;@{cluster['lon']},{cluster['lat']},10z",
+                "source": "NASA FIRMS",
+                "source_type": "wildfire",
+                "priority": "HIGH" if cluster["count"] >= 15 else "MEDIUM"
+            })
                     
     except Exception as e:
         print(f"NASA FIRMS error: {e}")
     
-    return sorted(fires, key=lambda x: x.get('count', 0), reverse=True)[:10]
+    return fires
+
+def _parse_rss(resp):
+    """RSS entries as plain dicts (what feed_cache keeps between scans)"""
+    return [
+        {
+            "title": entry.get("title", ""),
+            "description": entry.get("description", ""),
+            "link": entry.get("link", ""),
+            "published": datetime(*entry.published_parsed[:6]).isoformat() if entry.get("published_parsed") else None
+        }
+        for entry in feedparser.parse(resp.content).entries
+    ]
+
 
 def get_gdacs_alerts():
     """GDACS - Global Disaster Alert and Coordination System"""
     alerts = []
     try:
         url = "https://www.gdacs.org/xml/rss.xml"
-        resp = requests.get(url, headers=HEADERS, timeout=15)
+        entries = feed_cache.get(url, _parse_rss, headers=HEADERS, timeout=15) or []
         
-        if resp.status_code == 200:
-            feed = feedparser.parse(resp.content)
-            
-            for entry in feed.entries[:15]:
-                pub_date = datetime(*entry.published_parsed[:6])
-                if pub_date > CUTOFF_24H:
-                    
-                    # Extract alert level from description
-                    desc = entry.get('description', '')
+        for entry in entries[:15]:
+            if not entry["published"]:
+                continue
+            pub_date = datetime.fromisoformat(entry["published"])
+            if pub_date > CUTOFF_24H:
+                
+                # Extract alert level from description
+                desc = entry["description"]
+                alert_level = "MEDIUM"
+                if "RED" in desc.upper() or "SEVERE" in desc.upper():
+                    alert_level = "HIGH"
+                elif "ORANGE" in desc.upper():
                     alert_level = "MEDIUM"
-                    if "RED" in desc.upper() or "SEVERE" in desc.upper():
-                        alert_level = "HIGH"
-                    elif "ORANGE" in desc.upper():
-                        alert_level = "MEDIUM"
-                    
-                    alerts.append({
-                        "title": entry.title,
-                        "description": desc[:200],
-                        "url": entry.link,
-                        "published": pub_date.strftime("%Y-%m-%d %H:%M"),
-                        "source": "GDACS",
-                        "source_type": "disaster",
-                        "priority": alert_level
-                    })
+                
+                alerts.append({
+                    "title": entry["title"],
+                    "description": desc[:200],
+                    "url": entry["link"],
+                    "published": pub_date.strftime("%Y-%m-%d %H:%M"),
+                    "source": "GDACS",
+                    "source_type": "disaster",
+                    "priority": alert_level
+                })
                     
     except Exception as e:
         print(f"GDACS error: {e}")
@@ -199,28 +181,25 @@ def get_congress_bills(keywords=["gun", "firearm", "amendment", "atf", "rifle"])
         
         # Use RSS feed instead (free)
         rss_url = "https://www.congress.gov/rss/bills-introduced.xml"
-        resp = requests.get(rss_url, headers=HEADERS, timeout=15)
+        entries = feed_cache.get(rss_url, _parse_rss, headers=HEADERS, timeout=15) or []
         
-        if resp.status_code == 200:
-            feed = feedparser.parse(resp.content)
+        for entry in entries[:20]:
+            title = entry["title"].lower()
+            description = entry["description"].lower()
             
-            for entry in feed.entries[:20]:
-                title = entry.title.lower()
-                description = entry.get('description', '').lower()
-                
-                # Check for gun-related keywords
-                if any(kw in title or kw in description for kw in keywords):
-                    pub_date = datetime(*entry.published_parsed[:6])
-                    if pub_date > CUTOFF_24H:
-                        bills.append({
-                            "title": entry.title,
-                            "description": entry.get('description', '')[:200],
-                            "url": entry.link,
-                            "published": pub_date.strftime("%Y-%m-%d %H:%M"),
-                            "source": "Congress.gov",
-                            "source_type": "legislation",
-                            "priority": "MEDIUM"
-                        })
+            # Check for gun-related keywords
+            if any(kw in title or kw in description for kw in keywords) and entry["published"]:
+                pub_date = datetime.fromisoformat(entry["published"])
+                if pub_date > CUTOFF_24H:
+                    bills.append({
+                        "title": entry["title"],
+                        "description": entry["description"][:200],
+                        "url": entry["link"],
+                        "published": pub_date.strftime("%Y-%m-%d %H:%M"),
+                        "source": "Congress.gov",
+                        "source_type": "legislation",
+                        "priority": "MEDIUM"
+                    })
                         
     except Exception as e:
         print(f"Congress API error: {e}")
@@ -239,7 +218,7 @@ def get_federal_register(keywords=["ATF", "firearm", "gun", "second amendment"])
             "fields[]": ["title", "html_url", "publication_date", "abstract", "agencies"]
         }
         
-        resp = requests.get(url, params=params, headers=HEADERS, timeout=15)
+        resp = fetch_engine.get(url, params=params, headers=HEADERS, timeout=15)
         
         if resp.status_code == 200:
             data = resp.json()
@@ -275,7 +254,7 @@ def get_supreme_court_cases():
         current_year = datetime.now().year
         url = f"https://api.oyez.org/cases?per_page=50&filter=term:{current_year-1}"
         
-        resp = requests.get(url, headers=HEADERS, timeout=15)
+        resp = fetch_engine.get(url, headers=HEADERS, timeout=15)
         if resp.status_code == 200:
             data = resp.json()
             
@@ -304,12 +283,13 @@ def get_reddit_trending(subreddits=["news", "worldnews", "legaladvice", "TaylorS
     """Enhanced Reddit API - Real-time trending posts"""
     posts = []
     
-    for subreddit in subreddits:
+    # All subreddits at once; the fetch engine spaces out requests to reddit
+    urls = [f"https://www.reddit.com/r/{subreddit}/new.json?limit={limit}" for subreddit in subreddits]
+    responses = fetch_engine.get_many(urls, headers=HEADERS, timeout=15)
+    
+    for subreddit, resp in zip(subreddits, responses):
         try:
-            url = f"https://www.reddit.com/r/{subreddit}/new.json?limit={limit}"
-            resp = requests.get(url, headers=HEADERS, timeout=15)
-            
-            if resp.status_code == 200:
+            if resp is not None and resp.status_code == 200:
                 data = resp.json()
                 
                 for child in data.get('data', {}).get('children', []):
@@ -375,26 +355,36 @@ def get_spotify_taylor_swift():
 # MAIN FUNCTIONS
 # =============================================================================
 
+# Source registry: name -> (function, seconds before the scan gives up on it)
+SOURCES = {
+    "emsc_earthquakes": (get_emsc_earthquakes, 20),
+    "nasa_fires": (get_nasa_fires, 35),
+    "gdacs_alerts": (get_gdacs_alerts, 20),
+    "congress_bills": (get_congress_bills, 20),
+    "federal_register": (get_federal_register, 20),
+    "supreme_court": (get_supreme_court_cases, 20),
+    "reddit_posts": (get_reddit_trending, 20),
+}
+
+SOURCE_GROUPS = {
+    "disasters": ["emsc_earthquakes", "nasa_fires", "gdacs_alerts"],
+    "politics_legal": ["congress_bills", "federal_register", "supreme_court"],
+    "social_trending": ["reddit_posts"],
+}
+
 def run_all_free_apis():
     """Run all free APIs and return consolidated results"""
     print("🔍 Scanning all free APIs...")
     
-    all_results = {
-        "timestamp": NOW.strftime("%Y-%m-%d %H:%M:%S"),
-        "disasters": {
-            "emsc_earthquakes": get_emsc_earthquakes(),
-            "nasa_fires": get_nasa_fires(),
-            "gdacs_alerts": get_gdacs_alerts()
-        },
-        "politics_legal": {
-            "congress_bills": get_congress_bills(),
-            "federal_register": get_federal_register(),
-            "supreme_court": get_supreme_court_cases()
-        },
-        "social_trending": {
-            "reddit_posts": get_reddit_trending()
-        }
-    }
+    # All sources run at once, each with its own deadline
+    before = feed_cache.stats()
+    results, timings = fetch_engine.run_sources(SOURCES)
+    
+    all_results = {"timestamp": NOW.strftime("%Y-%m-%d %H:%M:%S")}
+    for category, names in SOURCE_GROUPS.items():
+        all_results[category] = {name: results[name] for name in names}
+    print(fetch_engine.timing_summary(timings))
+    print(feed_cache.summary(since=before))
     
     # Count results
     total_items = 0
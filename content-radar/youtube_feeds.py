@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+YouTube Feeds - Competitor uploads from channel RSS (Atom) feeds
+Channel IDs come from channel_resolver (cached in channel_ids.json); every feed is polled
+at once with conditional GETs (feed_cache), so an unchanged channel costs a single 304
+"""
+
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add venv packages to path
+VENV_PATH = Path(__file__).parent / "venv" / "lib"
+for p in VENV_PATH.glob("python*/site-packages"):
+    sys.path.insert(0, str(p))
+
+import feedparser
+
+import channel_resolver
+import feed_cache
+import fetch_engine
+import view_velocity
+
+FEED_URL = "https://www.youtube.com/feeds/videos.xml?channel_id={}"
+
+
+# =============================================================================
+# FEEDS
+# =============================================================================
+
+def parse_feed(content, channel_id=None):
+    """Videos in a channel feed, newest first"""
+    feed = feedparser.parse(content)
+    channel_id = channel_id or feed.feed.get("yt_channelid", "")
+    videos = []
+
+    for entry in feed.entries:
+        published = entry.get("published_parsed")
+        stats = entry.get("media_statistics") or {}
+        videos.append({
+            "video_id": entry.get("yt_videoid", ""),
+            "title": entry.get("title", ""),
+            "url": entry.get("link", ""),
+            "published": datetime(*published[:6], tzinfo=timezone.utc).isoformat() if published else "",
+            "channel": feed.feed.get("title", ""),
+            "channel_id": channel_id,
+            "views": int(stats.get("views") or 0)
+        })
+
+    return videos
+
+
+def _parse_response(resp):
+    return parse_feed(resp.content)
+
+
+def fetch_feed(channel_id):
+    """(videos, status) for one channel; an unchanged feed is a 304 and the cached videos"""
+    videos, status = feed_cache.fetch(FEED_URL.format(channel_id), _parse_response, timeout=10)
+    return videos or [], status
+
+
+def poll_channels(urls):
+    """{url: videos} for competitor channel URLs, every feed fetched at once"""
+    channel_ids = channel_resolver.channel_ids_for(urls)
+    feed_ids = sorted(set(channel_ids.values()))
+
+    def poll(channel_id):
+        try:
+            return fetch_feed(channel_id)
+        except Exception as e:
+            print(f"YouTube feed error {channel_id}: {e}")
+            return [], "error"
+
+    started = time.monotonic()
+    polled = dict(zip(feed_ids, fetch_engine.map_concurrent(poll, feed_ids)))
+
+    statuses = [status for _, status in polled.values()]
+    print(f"📺 {len(feed_ids)} YouTube feeds in {time.monotonic() - started:.2f}s "
+          f"({statuses.count('updated')} updated, {statuses.count('unchanged')} unchanged, "
+          f"{len(statuses) - statuses.count('updated') - statuses.count('unchanged')} failed)")
+
+    # Fresh counts become velocity samples; unchanged feeds just get the stored figures
+    view_velocity.record_views([v for videos, status in polled.values() if status == "updated" for v in videos])
+    view_velocity.annotate([v for videos, status in polled.values() if status != "updated" for v in videos])
+
+    return {url: polled[channel_id][0] for url, channel_id in channel_ids.items()}
+
+
+def recent_uploads(urls, hours=24, max_per_channel=None):
+    """Videos published in the last `hours` across the given channels, newest first"""
+    cutoff = (datetime.now(timezone.utc) - timedelta(hours=hours)).isoformat()
+    videos = []
+
+    for channel_videos in poll_channels(urls).values():
+        recent = [v for v in channel_videos if v["published"] and v["published"] >= cutoff]
+        videos.extend(recent[:max_per_channel])
+
+    return sorted(videos, key=lambda v: v["published"], reverse=True)
+
+
+def competitor_findings(urls, max_per_competitor=2, hours=24):
+    """Recent competitor uploads as Trello radar findings"""
+    findings = []
+
+    for video in recent_uploads(urls, hours, max_per_competitor):
+        findings.append({
+            "title": video["title"][:100],
+            "url": f"https://www.youtube.com/watch?v={video['video_id']}",
+            "views": video["views"],
+            "channel": video["channel"],
+            "source": (video["channel"] or "YouTube")[:30],
+            "source_type": "youtube",
+            "upload_date": video["published"][:10].replace("-", ""),
+            "video_id": video["video_id"],
+            "views_per_hour": video.get("views_per_hour"),
+            "outlier_score": video.get("outlier_score", 0.0)
+        })
+
+    return findings
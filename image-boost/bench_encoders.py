@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+ImageBoost - Encoder benchmark
+Encode time vs output size for every encoder profile, printed as a Markdown table
+
+Usage:
+    python3 bench_encoders.py                  # synthetic samples + benchmarks/corpus/sample.png
+    python3 bench_encoders.py photo.png ...    # your own images
+"""
+
+import argparse
+import io
+import time
+from pathlib import Path
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFilter
+
+import pipeline
+
+BASE_DIR = Path(__file__).parent
+SAMPLE_PATH = BASE_DIR / 'benchmarks' / 'corpus' / 'sample.png'
+
+
+def synthetic_samples(size=2048):
+    """Upscaled-looking RGBA test images: a photo-like cutout and a flat graphic"""
+    rng = np.random.default_rng(42)
+
+    # Photo-like: smooth gradients + sensor noise, elliptical subject on transparent background
+    y, x = np.mgrid[0:size, 0:size].astype(np.float32) / size
+    rgb = np.stack([x * 200 + 30, y * 180 + 40, (x + y) * 90 + 20], axis=2)
+    rgb += rng.normal(0, 6, rgb.shape)
+    photo = Image.fromarray(np.clip(rgb, 0, 255).astype(np.uint8), 'RGB')
+    mask = Image.new('L', photo.size, 0)
+    ImageDraw.Draw(mask).ellipse((size // 8, size // 8, size * 7 // 8, size * 7 // 8), fill=255)
+    photo.putalpha(mask.filter(ImageFilter.GaussianBlur(4)))
+
+    # Flat graphic: few colors, hard edges (logos, stickers)
+    graphic = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(graphic)
+    draw.rounded_rectangle((size // 6, size // 6, size * 5 // 6, size * 5 // 6), radius=size // 12, fill=(255, 107, 107, 255))
+    draw.ellipse((size // 3, size // 3, size * 2 // 3, size * 2 // 3), fill=(255, 165, 0, 255))
+
+    return {'synthetic-photo': photo, 'synthetic-graphic': graphic}
+
+
+def bench_encoder(image, encoder, repeat):
+    """Best-of-N encode time (seconds) and output size (bytes)"""
+    best = None
+    size = 0
+    for _ in range(repeat):
+        buffer = io.BytesIO()
+        start = time.perf_counter()
+        pipeline.encode_image(image, buffer, encoder)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+        size = buffer.tell()
+    return best, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark ImageBoost output encoders')
+    parser.add_argument('images', nargs='*', help='Images to encode (default: synthetic + benchmarks/corpus/sample.png)')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per encoder (best time is reported)')
+    args = parser.parse_args()
+
+    samples = {}
+    paths = [Path(p) for p in args.images] or [SAMPLE_PATH]
+    if not args.images:
+        samples.update(synthetic_samples())
+    for path in paths:
+        with Image.open(path) as im:
+            label = path.name if len(path.name) <= 24 else f"{path.stem[:8]}…{path.suffix}"
+            samples[label] = im.convert('RGBA')
+
+    encoders = pipeline.available_encoders()
+
+    print('| Image | Size | Encoder | Time (s) | Output (KB) | vs png-max |')
+    print('|-------|------|---------|---------:|------------:|-----------:|')
+    for name, image in samples.items():
+        results = {encoder: bench_encoder(image, encoder, args.repeat) for encoder in encoders}
+        baseline = results['png-max'][1]
+        for encoder, (elapsed, size) in results.items():
+            print(f"| {name} | {image.width}x{image.height} | {encoder} | {elapsed:.2f} | "
+                  f"{size / 1024:,.0f} | {size / baseline:.0%} |")
+
+
+if __name__ == '__main__':
+    main()
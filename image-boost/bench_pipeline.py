@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+ImageBoost - Pipeline benchmark and regression check
+Runs every profile over a fixed corpus and reports per-stage time, peak RSS and output quality
+
+Each corpus image is a known high-resolution reference with a known subject mask.
+It is shrunk by the scale, run through the pipeline, and the output is compared
+with the reference (PSNR/SSIM on RGB, IoU of the alpha mask against the subject).
+Every case runs in a fresh process so peak RSS belongs to that case alone.
+
+Usage:
+    python3 bench_pipeline.py                                   # table + bench_results.json
+    python3 bench_pipeline.py --profile pillow --size 256       # subset
+    python3 bench_pipeline.py --compare benchmarks/baseline.json    # exit 1 on regressions
+    python3 bench_pipeline.py --save-baseline                   # refresh the stored baseline
+"""
+
+import argparse
+import io
+import json
+import multiprocessing
+import platform
+import resource
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFilter
+
+import pipeline
+
+BASE_DIR = Path(__file__).parent
+BASELINE_PATH = BASE_DIR / 'benchmarks' / 'baseline.json'
+# Committed real cut-out (2048px RGBA), so every machine benchmarks the same image
+SAMPLE_PATH = BASE_DIR / 'benchmarks' / 'corpus' / 'sample.png'
+
+CORPUS = ('photo', 'graphic', 'sample')
+SIZES = (128, 256, 512)          # input edge; the reference is SCALE times larger
+SCALE = 4
+
+# How much worse than the baseline counts as a regression
+TOLERANCES = {
+    'time': 1.5,         # total seconds, ratio (ignored when under 0.2 s slower)
+    'peak_rss_mb': 1.25, # ratio
+    'psnr': 0.1,         # dB drop
+    'ssim': 0.002,       # absolute drop
+    'mask_iou': 0.01,    # absolute drop
+}
+
+
+# ---------------------------------------------------------------------------
+# Corpus
+# ---------------------------------------------------------------------------
+
+def _subject_mask(size, inset):
+    mask = Image.new('L', (size, size), 0)
+    ImageDraw.Draw(mask).ellipse((inset, inset, size - inset, size - inset), fill=255)
+    return mask
+
+
+def corpus_image(name, size):
+    """Reference RGB image (size*SCALE square) and its subject mask"""
+    full = size * SCALE
+    rng = np.random.default_rng(7)
+
+    if name == 'photo':
+        # Smooth shaded subject with sensor noise on a slightly noisy studio background
+        y, x = np.mgrid[0:full, 0:full].astype(np.float32) / full
+        subject = np.stack([x * 160 + 60, y * 120 + 50, (x + y) * 60 + 40], axis=2)
+        background = np.full_like(subject, 235) + rng.normal(0, 3, subject.shape)
+        mask = _subject_mask(full, full // 6)
+        alpha = np.asarray(mask.filter(ImageFilter.GaussianBlur(full / 256)), dtype=np.float32)[..., None] / 255
+        rgb = subject * alpha + background * (1 - alpha) + rng.normal(0, 4, subject.shape)
+        return Image.fromarray(np.clip(rgb, 0, 255).astype(np.uint8), 'RGB'), mask
+
+    if name == 'graphic':
+        # Flat sticker-style artwork: hard edges, few colors, white background
+        image = Image.new('RGB', (full, full), (255, 255, 255))
+        draw = ImageDraw.Draw(image)
+        draw.rounded_rectangle((full // 5, full // 5, full * 4 // 5, full * 4 // 5), radius=full // 10, fill=(255, 107, 107))
+        draw.ellipse((full // 3, full // 3, full * 2 // 3, full * 2 // 3), fill=(255, 165, 0))
+        mask = Image.new('L', (full, full), 0)
+        ImageDraw.Draw(mask).rounded_rectangle((full // 5, full // 5, full * 4 // 5, full * 4 // 5), radius=full // 10, fill=255)
+        return image, mask
+
+    # Real cut-out from the committed corpus, composited on white and center-cropped
+    with Image.open(SAMPLE_PATH) as im:
+        im = im.convert('RGBA')
+        edge = min(im.size)
+        left, top = (im.width - edge) // 2, (im.height - edge) // 2
+        im = im.crop((left, top, left + edge, top + edge)).resize((full, full), Image.Resampling.LANCZOS)
+    image = Image.new('RGB', im.size, (255, 255, 255))
+    image.paste(im, mask=im.getchannel('A'))
+    return image, im.getchannel('A').point(lambda a: 255 if a > 127 else 0)
+
+
+# ---------------------------------------------------------------------------
+# Metrics
+# ---------------------------------------------------------------------------
+
+def psnr(reference, candidate):
+    """Peak signal-to-noise ratio in dB"""
+    mse = np.mean((reference - candidate) ** 2)
+    return float('inf') if mse == 0 else float(10 * np.log10(255 ** 2 / mse))
+
+
+def _box_mean(a, window):
+    """Mean over every window x window block (valid region only)"""
+    c = np.cumsum(np.cumsum(np.pad(a, ((1, 0), (1, 0))), axis=0), axis=1)
+    return (c[window:, window:] - c[:-window, window:] - c[window:, :-window] + c[:-window, :-window]) / window ** 2
+
+
+def ssim(reference, candidate, window=7):
+    """Mean structural similarity of the luma channel (7x7 box window)"""
+    weights = np.array([0.299, 0.587, 0.114])
+    x, y = reference @ weights, candidate @ weights
+    c1, c2 = (0.01 * 255) ** 2, (0.03 * 255) ** 2
+
+    mx, my = _box_mean(x, window), _box_mean(y, window)
+    vx = _box_mean(x * x, window) - mx * mx
+    vy = _box_mean(y * y, window) - my * my
+    cov = _box_mean(x * y, window) - mx * my
+
+    s = ((2 * mx * my + c1) * (2 * cov + c2)) / ((mx * mx + my * my + c1) * (vx + vy + c2))
+    return float(s.mean())
+
+
+def mask_iou(mask, alpha):
+    """Intersection over union of the subject mask and the output's alpha"""
+    a, b = np.asarray(mask) > 127, np.asarray(alpha) > 127
+    union = np.logical_or(a, b).sum()
+    return float(np.logical_and(a, b).sum() / union) if union else 1.0
+
+
+# ---------------------------------------------------------------------------
+# Cases
+# ---------------------------------------------------------------------------
+
+def peak_rss_mb():
+    """Peak resident memory of this process in MB"""
+    # VmHWM starts fresh in an exec'd child; ru_maxrss keeps the parent's peak on Linux
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+
+    # ru_maxrss is KB on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 / 1024 if sys.platform == 'darwin' else peak / 1024
+
+
+def _png(image):
+    buffer = io.BytesIO()
+    image.save(buffer, 'PNG')
+    return buffer.getvalue()
+
+
+def build_case(name, size):
+    """Encoded (input, reference, mask) PNGs for one corpus image"""
+    reference, mask = corpus_image(name, size)
+    low_res = reference.resize((size, size), Image.Resampling.BICUBIC)
+    return _png(low_res), _png(reference), _png(mask)
+
+
+def run_case(profile, name, size, source, reference_png, mask_png, refine=False):
+    """Run one profile on one corpus image; executed in a fresh process"""
+    options = pipeline.resolve_options(profile, SCALE, refine=refine)
+
+    # Warm up: the first open initialises Pillow's plugin registry
+    Image.open(io.BytesIO(source)).load()
+
+    timings = {}
+    start = time.perf_counter()
+    image = Image.open(io.BytesIO(source))
+    image.load()
+    timings['decode'] = time.perf_counter() - start
+
+    # run_pipeline reports each stage as it starts
+    marks = []
+    start = time.perf_counter()
+    output = pipeline.run_pipeline(image, options, lambda step, progress: marks.append((step, time.perf_counter())))
+    end = time.perf_counter()
+    stage_starts = dict(marks)
+    timings['upscale'] = stage_starts['removing_bg'] - stage_starts['upscaling']
+    timings['mask'] = end - stage_starts['removing_bg']
+
+    start = time.perf_counter()
+    encoded = io.BytesIO()
+    pipeline.encode_image(output, encoded, options['encoder'])
+    timings['encode'] = time.perf_counter() - start
+
+    peak_mb = peak_rss_mb()
+
+    # References are decoded only now, so they don't count towards peak RSS
+    reference = Image.open(io.BytesIO(reference_png)).convert('RGB')
+    mask = Image.open(io.BytesIO(mask_png))
+    ref = np.asarray(reference, dtype=np.float64)
+    out = np.asarray(output.convert('RGB'), dtype=np.float64)
+    return {
+        'profile': profile,
+        'image': name,
+        'size': size,
+        'output': f"{output.width}x{output.height}",
+        'stages': {stage: round(seconds, 4) for stage, seconds in timings.items()},
+        'time': round(sum(timings.values()), 4),
+        'peak_rss_mb': round(peak_mb, 1),
+        'output_kb': round(encoded.tell() / 1024, 1),
+        'psnr': round(psnr(ref, out), 3),
+        'ssim': round(ssim(ref, out), 4),
+        'mask_iou': round(mask_iou(mask, output.getchannel('A')), 4),
+    }
+
+
+def case_key(result):
+    return f"{result['profile']}/{result['image']}/{result['size']}"
+
+
+def run_all(profiles, images, sizes, refine=False):
+    """Run every case one after another, each in its own process"""
+    corpus = {(name, size): build_case(name, size) for name in images for size in sizes}
+
+    context = multiprocessing.get_context('spawn')
+    results = []
+    with context.Pool(1, maxtasksperchild=1) as pool:
+        for profile in profiles:
+            for (name, size), case in corpus.items():
+                results.append(pool.apply(run_case, (profile, name, size) + case + (refine,)))
+                print(f"  {case_key(results[-1])}: {results[-1]['time']:.2f}s", file=sys.stderr)
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Baseline comparison
+# ---------------------------------------------------------------------------
+
+def compare(results, baseline):
+    """Regressions of `results` against a baseline report, as readable strings"""
+    previous = {case_key(r): r for r in baseline['results']}
+    regressions = []
+
+    for result in results:
+        before = previous.get(case_key(result))
+        if not before:
+            continue
+        key = case_key(result)
+
+        if result['time'] > before['time'] * TOLERANCES['time'] and result['time'] - before['time'] > 0.2:
+            regressions.append(f"{key}: time {before['time']:.3f}s → {result['time']:.3f}s")
+        if result['peak_rss_mb'] > before['peak_rss_mb'] * TOLERANCES['peak_rss_mb']:
+            regressions.append(f"{key}: peak RSS {before['peak_rss_mb']} → {result['peak_rss_mb']} MB")
+        for metric in ('psnr', 'ssim', 'mask_iou'):
+            if before[metric] - result[metric] > TOLERANCES[metric]:
+                regressions.append(f"{key}: {metric} {before[metric]} → {result[metric]}")
+
+    return regressions
+
+
+def print_table(results):
+    print('| Profile | Image | Input | Decode | Upscale | Mask | Encode | Total (s) | Peak RSS (MB) | PSNR | SSIM | Mask IoU |')
+    print('|---------|-------|------:|-------:|--------:|-----:|-------:|----------:|--------------:|-----:|-----:|---------:|')
+    for r in results:
+        s = r['stages']
+        print(f"| {r['profile']} | {r['image']} | {r['size']} | {s['decode']:.3f} | {s['upscale']:.3f} | "
+              f"{s['mask']:.3f} | {s['encode']:.3f} | {r['time']:.3f} | {r['peak_rss_mb']:.0f} | "
+              f"{r['psnr']:.2f} | {r['ssim']:.4f} | {r['mask_iou']:.3f} |")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark ImageBoost pipeline profiles')
+    parser.add_argument('--profile', action='append', choices=list(pipeline.PROFILES), help='Profiles to run (default: all)')
+    parser.add_argument('--image', action='append', choices=CORPUS, help='Corpus images (default: all)')
+    parser.add_argument('--size', action='append', type=int, help=f'Input sizes (default: {", ".join(map(str, SIZES))})')
+    parser.add_argument('--refine', action='store_true', help='Enable matting refinement')
+    parser.add_argument('--json', default='bench_results.json', help='Where to write the JSON report')
+    parser.add_argument('--compare', metavar='BASELINE', help='Baseline JSON to compare against (exit 1 on regressions)')
+    parser.add_argument('--save-baseline', action='store_true', help=f'Also write the report to {BASELINE_PATH.relative_to(BASE_DIR)}')
+    args = parser.parse_args()
+
+    results = run_all(args.profile or list(pipeline.PROFILES), args.image or CORPUS, args.size or SIZES, args.refine)
+    report = {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'machine': {'python': platform.python_version(), 'platform': platform.platform(), 'cpus': multiprocessing.cpu_count()},
+        'backends': pipeline.available_backends(),
+        'scale': SCALE,
+        'refine': args.refine,
+        'results': results,
+    }
+
+    print_table(results)
+
+    Path(args.json).write_text(json.dumps(report, indent=2) + '\n')
+    print(f"\nReport written to {args.json}")
+    if args.save_baseline:
+        BASELINE_PATH.parent.mkdir(exist_ok=True)
+        BASELINE_PATH.write_text(json.dumps(report, indent=2) + '\n')
+        print(f"Baseline saved to {BASELINE_PATH}")
+
+    if args.compare:
+        regressions = compare(results, json.loads(Path(args.compare).read_text()))
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) against {args.compare}:")
+            for line in regressions:
+                print(f"  - {line}")
+            sys.exit(1)
+        print(f"\n✅ No regressions against {args.compare}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+ImageBoost - Upscaler benchmark
+Time and fidelity of every installed upscale backend on the same test set, printed as a Markdown table
+
+Each sample is shrunk 4x and upscaled back, and the result is compared with the
+original (PSNR, higher is better).
+
+Usage:
+    python3 bench_upscalers.py                          # synthetic sample + benchmarks/corpus/sample.png
+    python3 bench_upscalers.py photo.jpg ...            # your own images
+    IMAGEBOOST_ONNX_THREADS=4 IMAGEBOOST_ONNX_TILE=128 python3 bench_upscalers.py
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+import pipeline
+from bench_encoders import synthetic_samples
+
+BASE_DIR = Path(__file__).parent
+SAMPLE_PATH = BASE_DIR / 'benchmarks' / 'corpus' / 'sample.png'
+SCALE = 4
+
+
+def psnr(reference, candidate):
+    """Peak signal-to-noise ratio in dB between two RGB images"""
+    a = np.asarray(reference.convert('RGB'), dtype=np.float64)
+    b = np.asarray(candidate.convert('RGB'), dtype=np.float64)
+    mse = np.mean((a - b) ** 2)
+    return float('inf') if mse == 0 else 10 * np.log10(255 ** 2 / mse)
+
+
+def bench_upscaler(backend, low_res, repeat):
+    """Best-of-N upscale time (seconds) and the last output"""
+    best = None
+    output = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        output = pipeline.UPSCALE_BACKENDS[backend]['run'](low_res, SCALE)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, output
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark ImageBoost upscale backends')
+    parser.add_argument('images', nargs='*', help='Images to test (default: synthetic + benchmarks/corpus/sample.png)')
+    parser.add_argument('--size', type=int, default=1024, help='Center crop of each image used as ground truth')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per backend (best time is reported)')
+    args = parser.parse_args()
+
+    samples = {}
+    paths = [Path(p) for p in args.images] or [SAMPLE_PATH]
+    if not args.images:
+        samples['synthetic-photo'] = synthetic_samples(args.size)['synthetic-photo']
+    for path in paths:
+        with Image.open(path) as im:
+            label = path.name if len(path.name) <= 24 else f"{path.stem[:8]}…{path.suffix}"
+            samples[label] = im.convert('RGB')
+
+    backends = pipeline.available_backends()['upscalers']
+
+    print(f"Backends: {', '.join(backends)} (ONNX threads={pipeline.ONNX_THREADS or 'all'}, "
+          f"tile={pipeline.ONNX_TILE or 'off'})\n")
+    print('| Image | Input | Backend | Time (s) | PSNR (dB) | vs lanczos |')
+    print('|-------|-------|---------|---------:|----------:|-----------:|')
+    for name, image in samples.items():
+        # Ground truth: a center crop whose sides divide by the scale
+        size = min(args.size, image.width, image.height) // SCALE * SCALE
+        left, top = (image.width - size) // 2, (image.height - size) // 2
+        reference = image.convert('RGB').crop((left, top, left + size, top + size))
+        low_res = reference.resize((size // SCALE, size // SCALE), Image.Resampling.BICUBIC)
+
+        results = {backend: bench_upscaler(backend, low_res, args.repeat) for backend in backends}
+        baseline = results['lanczos'][0]
+        for backend, (elapsed, output) in results.items():
+            print(f"| {name} | {low_res.width}x{low_res.height} | {backend} | {elapsed:.2f} | "
+                  f"{psnr(reference, output):.2f} | {elapsed / baseline:.1f}x |")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+ImageBoost - Batch event stream
+Workers publish per-file step transitions; /batch-events pushes them as Server-Sent Events
+"""
+
+import json
+import threading
+
+KEEPALIVE_SECONDS = 15
+# Events kept per batch; the oldest are dropped beyond this (a reconnect past them resumes at the oldest kept)
+MAX_EVENTS_PER_BATCH = 2000
+
+# batch_id -> list of kept events; an event's id is its index plus _dropped[batch_id]
+_events = {}
+_dropped = {}
+_condition = threading.Condition()
+
+
+def open_batch(batch_id):
+    """Start an empty event log so listeners can subscribe before the first step"""
+    with _condition:
+        _events.setdefault(batch_id, [])
+
+
+def publish(batch_id, event):
+    """Append an event to a batch's log and wake up listeners
+
+    Late events for a batch that was never opened or already discarded are dropped.
+    """
+    with _condition:
+        log = _events.get(batch_id)
+        if log is None:
+            return
+        log.append(event)
+        if len(log) > MAX_EVENTS_PER_BATCH:
+            excess = len(log) - MAX_EVENTS_PER_BATCH
+            del log[:excess]
+            _dropped[batch_id] = _dropped.get(batch_id, 0) + excess
+        _condition.notify_all()
+
+
+def discard(batch_id):
+    """Forget a batch's events (listeners get a final 'gone' event)"""
+    with _condition:
+        _events.pop(batch_id, None)
+        _dropped.pop(batch_id, None)
+        _condition.notify_all()
+
+
+def wait_for_events(batch_id, cursor, timeout=KEEPALIVE_SECONDS):
+    """(id of the first event, events) from `cursor` on, blocking up to `timeout`; None if the batch is gone"""
+    with _condition:
+        _condition.wait_for(
+            lambda: batch_id not in _events or _dropped.get(batch_id, 0) + len(_events[batch_id]) > cursor,
+            timeout=timeout
+        )
+        if batch_id not in _events:
+            return None
+        dropped = _dropped.get(batch_id, 0)
+        start = max(cursor, dropped)
+        return start, _events[batch_id][start - dropped:]
+
+
+def is_final(event):
+    """True for the event that ends a batch stream"""
+    return event.get('type') == 'batch' and event.get('step') in ('complete', 'error')
+
+
+def format_sse(event, event_id=None):
+    """Encode one event in text/event-stream format"""
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event.get('type', 'file')}")
+    lines.append(f"data: {json.dumps(event)}")
+    return "\n".join(lines) + "\n\n"
+
+
+def parse_event_id(value):
+    """Last-Event-ID header as an int, None if missing or malformed"""
+    try:
+        event_id = int(value)
+    except (TypeError, ValueError):
+        return None
+    return event_id if event_id >= 0 else None
+
+
+def stream(batch_id, last_event_id=None):
+    """Yield SSE text for a batch until it finishes, resuming after `last_event_id`"""
+    event_id = parse_event_id(last_event_id)
+    cursor = event_id + 1 if event_id is not None else 0
+
+    # Tell EventSource to wait a bit before reconnecting after a drop
+    yield "retry: 2000\n\n"
+
+    while True:
+        pending = wait_for_events(batch_id, cursor)
+
+        if pending is None:
+            yield format_sse({'type': 'batch', 'step': 'not_found'})
+            return
+
+        cursor, events = pending
+        if not events:
+            yield ": keepalive\n\n"
+            continue
+
+        for event in events:
+            yield format_sse(event, cursor)
+            cursor += 1
+            if is_final(event):
+                return
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+ImageBoost - Upload ingestion
+Streams uploads straight to disk under byte caps and vets each image from its header before queuing
+"""
+
+import logging
+import os
+import tempfile
+
+from flask import Request
+from PIL import Image, UnidentifiedImageError
+from werkzeug.exceptions import RequestEntityTooLarge
+
+import pipeline
+
+logger = logging.getLogger(__name__)
+
+# Decoders we accept, whatever the file extension claims
+ACCEPTED_FORMATS = {'JPEG', 'PNG', 'WEBP', 'AVIF'}
+
+# What to do with inputs whose output would exceed pipeline.MAX_OUTPUT_PIXELS
+OVERSIZE_POLICIES = ('downscale', 'reject')
+
+
+class IngestError(ValueError):
+    """An upload that must not be queued"""
+
+
+class UploadSpool:
+    """Disk file a multipart upload streams into, refusing to grow past `max_bytes`"""
+
+    def __init__(self, directory, max_bytes):
+        fd, self.name = tempfile.mkstemp(dir=directory, prefix='.upload-')
+        self._file = os.fdopen(fd, 'w+b')
+        self.max_bytes = max_bytes
+        self.size = 0
+
+    def write(self, data):
+        self.size += len(data)
+        if self.size > self.max_bytes:
+            self.discard()
+            raise RequestEntityTooLarge(f"File too large (max {self.max_bytes // 1024 // 1024}MB)")
+        return self._file.write(data)
+
+    def discard(self):
+        """Close and delete the spool unless it was already moved into place"""
+        self._file.close()
+        try:
+            os.unlink(self.name)
+        except FileNotFoundError:
+            pass
+
+    def __getattr__(self, name):
+        return getattr(self._file, name)
+
+
+def make_request_class(spool_dir, max_file_bytes):
+    """Flask request class whose file uploads stream into capped spools in `spool_dir`"""
+
+    class UploadRequest(Request):
+        def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+            spool = UploadSpool(spool_dir, max_file_bytes)
+            self.__dict__.setdefault('_upload_spools', []).append(spool)
+            return spool
+
+        def discard_spools(self):
+            """Delete spools that were never accepted (rejected or aborted uploads)"""
+            for spool in self.__dict__.pop('_upload_spools', []):
+                spool.discard()
+
+    return UploadRequest
+
+
+def accept(file, dest):
+    """Move an uploaded file to `dest` (a rename when it was spooled to the same disk)"""
+    stream = file.stream
+    if isinstance(stream, UploadSpool):
+        stream.flush()
+        os.replace(stream.name, dest)
+    else:
+        file.save(dest)
+
+
+def probe(path):
+    """Format and dimensions from the image header, without decoding pixels"""
+    try:
+        with Image.open(path) as image:
+            return {'format': image.format, 'width': image.width, 'height': image.height}
+    except Image.DecompressionBombError:
+        raise IngestError(f"Image larger than {pipeline.MAX_DECODE_PIXELS // 1_000_000} megapixels")
+    except (UnidentifiedImageError, OSError):
+        raise IngestError("Not a readable image")
+
+
+def inspect(path, options, policy='downscale'):
+    """Vet a saved upload; returns its dimensions, downscale target and estimated cost"""
+    info = probe(path)
+
+    if info['format'] not in ACCEPTED_FORMATS:
+        raise IngestError(f"Unsupported image format: {info['format']}")
+
+    pixels = info['width'] * info['height']
+    if pixels > pipeline.MAX_DECODE_PIXELS:
+        raise IngestError(
+            f"Image is {info['width']}x{info['height']} "
+            f"(max {pipeline.MAX_DECODE_PIXELS // 1_000_000} megapixels)"
+        )
+
+    target = pipeline.downscale_target((info['width'], info['height']), options)
+    if target and policy == 'reject':
+        raise IngestError(
+            f"Image is {info['width']}x{info['height']}; at {options['scale']}x the output would exceed "
+            f"{options['max_output_pixels'] // 1_000_000} megapixels"
+        )
+
+    # Work is dominated by the upscaled pixel count
+    width, height = target or (info['width'], info['height'])
+    info['downscale_to'] = target
+    info['cost'] = width * height * options['scale'] ** 2
+    return info
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+ImageBoost - Job registry
+Thread-safe file/batch status with TTL eviction, plus a sweeper for orphaned files
+"""
+
+import copy
+import logging
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+FINAL_STEPS = ('complete', 'error')
+
+# Files the server writes: <file uuid>_input.*, <file uuid>_processed*.*, and ingest's .upload-* temp files
+JOB_FILE_PATTERN = re.compile(r'^(?:[0-9a-f]{8}(?:-[0-9a-f]{4}){3}-[0-9a-f]{12}_|\.upload-)')
+
+
+class JobRegistry:
+    """File and batch statuses behind one lock
+
+    Finished batches are evicted `ttl_seconds` after their last update, and the
+    oldest finished batches go first once there are more than `max_batches`.
+    Readers always get copies, so callers never see a half-applied update.
+    """
+
+    def __init__(self, ttl_seconds, max_batches):
+        self.ttl_seconds = ttl_seconds
+        self.max_batches = max_batches
+
+        self._lock = threading.RLock()
+        self._files = {}        # file_id -> status dict
+        self._batches = {}      # batch_id -> batch dict
+        self._touched = {}      # batch_id -> last update (epoch seconds)
+        self._file_paths = {}   # file_id -> (input_path, output_path, *other output sizes)
+
+    # Files
+
+    def set_file(self, batch_id, file_id, status):
+        with self._lock:
+            # Ignore late updates for files whose batch was already removed
+            if file_id not in self._file_paths:
+                return
+            self._files[file_id] = status
+            if batch_id in self._batches:
+                self._touched[batch_id] = time.time()
+
+    def set_queue_positions(self, positions):
+        """Update queue_position of files still queued (file_id -> position)"""
+        with self._lock:
+            for file_id, position in positions.items():
+                status = self._files.get(file_id)
+                if status and status.get("step") == "queued":
+                    self._files[file_id] = dict(status, queue_position=position)
+
+    def get_file(self, file_id):
+        with self._lock:
+            status = self._files.get(file_id)
+            return dict(status) if status is not None else None
+
+    def remove_file(self, file_id):
+        """Forget a file; returns its last status (or {})"""
+        with self._lock:
+            self._file_paths.pop(file_id, None)
+            return self._files.pop(file_id, {})
+
+    # Batches
+
+    def add_batch(self, batch_id, batch, files_info):
+        with self._lock:
+            self._batches[batch_id] = batch
+            self._touched[batch_id] = time.time()
+            for file_info in files_info:
+                self._file_paths[file_info['id']] = (
+                    str(file_info['input_path']),
+                    str(file_info['output_path']),
+                    *(str(path) for path in file_info.get('variant_paths', ()))
+                )
+
+    @contextmanager
+    def edit_batch(self, batch_id):
+        """Mutate a batch dict in place while holding the lock"""
+        with self._lock:
+            yield self._batches[batch_id]
+            self._touched[batch_id] = time.time()
+
+    def get_batch(self, batch_id, with_files=False):
+        """Copy of a batch, optionally with every file's status attached"""
+        with self._lock:
+            batch = self._batches.get(batch_id)
+            if batch is None:
+                return None
+
+            snapshot = copy.deepcopy(batch)
+            if with_files:
+                snapshot["file_statuses"] = {
+                    file_id: dict(self._files.get(file_id, {"step": "waiting", "progress": 0}))
+                    for file_id in batch.get("files", {})
+                }
+            return snapshot
+
+    def remove_batch(self, batch_id):
+        """Forget a batch and its files; returns their last statuses"""
+        with self._lock:
+            batch = self._batches.pop(batch_id, None)
+            self._touched.pop(batch_id, None)
+            if batch is None:
+                return []
+            return [self.remove_file(file_id) for file_id in batch.get("files", {})]
+
+    # Eviction
+
+    def expired_batches(self, now=None):
+        """Finished batches past their TTL, then the oldest beyond max_batches"""
+        now = now or time.time()
+        with self._lock:
+            finished = sorted(
+                (self._touched[batch_id], batch_id)
+                for batch_id, batch in self._batches.items()
+                if batch.get("step") in FINAL_STEPS
+            )
+            expired = [batch_id for touched, batch_id in finished if now - touched > self.ttl_seconds]
+
+            overflow = len(self._batches) - len(expired) - self.max_batches
+            if overflow > 0:
+                remaining = [batch_id for _, batch_id in finished if batch_id not in expired]
+                expired += remaining[:overflow]
+
+            return expired
+
+    def oldest_finished_batch(self):
+        with self._lock:
+            finished = [
+                (self._touched[batch_id], batch_id)
+                for batch_id, batch in self._batches.items()
+                if batch.get("step") in FINAL_STEPS
+            ]
+            return min(finished)[1] if finished else None
+
+    def live_paths(self):
+        """Upload/output paths that still belong to a known file"""
+        with self._lock:
+            paths = set()
+            for file_paths in self._file_paths.values():
+                paths.update(file_paths)
+            return paths
+
+    def stats(self):
+        with self._lock:
+            return {
+                'batches': len(self._batches),
+                'files': len(self._files),
+                'running': sum(1 for b in self._batches.values() if b.get("step") not in FINAL_STEPS),
+            }
+
+
+def directory_size(path):
+    return sum(p.stat().st_size for p in Path(path).iterdir() if p.is_file())
+
+
+class Sweeper(threading.Thread):
+    """Background thread that evicts expired jobs and deletes orphaned files"""
+
+    def __init__(self, registry, evict_batch, directories, max_output_bytes, output_dir, interval=60):
+        super().__init__(daemon=True, name="imageboost-sweeper")
+        self.registry = registry
+        self.evict_batch = evict_batch
+        self.directories = [Path(d) for d in directories]
+        self.max_output_bytes = max_output_bytes
+        self.output_dir = Path(output_dir)
+        self.interval = interval
+
+    def run(self):
+        while True:
+            time.sleep(self.interval)
+            try:
+                self.sweep()
+            except Exception as e:
+                logger.error(f"❌ Sweeper error: {e}")
+
+    def sweep(self):
+        """One eviction pass; returns what was removed"""
+        expired = self.registry.expired_batches()
+        for batch_id in expired:
+            self.evict_batch(batch_id)
+
+        orphans = self.remove_orphans()
+
+        # Disk cap: drop the oldest finished batches until outputs fit
+        capped = 0
+        while directory_size(self.output_dir) > self.max_output_bytes:
+            batch_id = self.registry.oldest_finished_batch()
+            if batch_id is None:
+                break
+            self.evict_batch(batch_id)
+            capped += 1
+
+        if expired or orphans or capped:
+            logger.info(f"🧹 Swept {len(expired)} expired batches, {capped} over disk cap, {orphans} orphaned files")
+
+        return {'expired': len(expired), 'over_cap': capped, 'orphans': orphans}
+
+    def remove_orphans(self):
+        """Delete uploads/outputs no job references, once older than the TTL
+
+        Only files named like the server's job files are touched, including ones left
+        over from before a restart; anything else in the directories is left alone.
+        """
+        live = self.registry.live_paths()
+        cutoff = time.time() - self.registry.ttl_seconds
+        removed = 0
+
+        for directory in self.directories:
+            for path in directory.iterdir():
+                if not path.is_file() or str(path) in live or not JOB_FILE_PATTERN.match(path.name):
+                    continue
+                try:
+                    if path.stat().st_mtime < cutoff:
+                        os.unlink(path)
+                        removed += 1
+                except FileNotFoundError:
+                    pass
+
+        return removed
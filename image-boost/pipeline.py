@@ -0,0 +1,977 @@
+#!/usr/bin/env python3
+"""
+ImageBoost - Processing pipeline
+enhance → upscale → background removal → encode, shared by every server mode
+"""
+
+import logging
+import math
+import os
+from pathlib import Path
+
+import numpy as np
+from PIL import Image, ImageChops, ImageFilter
+
+logger = logging.getLogger(__name__)
+
+# Enhancement presets (one per tuning the old server variants shipped with)
+ENHANCE_PRESETS = {
+    # server_pillow_only.py / server_bulk.py
+    'pillow': {
+        'denoise': False,
+        'sharpness': 1.3,
+        'contrast': 1.2,
+        'unsharp': (1, 120, 3),
+        'post_sharpness': 1.1,
+    },
+    # server_improved.py (color-preserving)
+    'gentle': {
+        'denoise': False,
+        'sharpness': 1.15,
+        'contrast': 1.05,
+        'unsharp': (0.8, 100, 5),
+        'post_sharpness': 1.05,
+    },
+    # server_fallback.py (OpenCV bilateral filter)
+    'denoise': {
+        'denoise': True,
+        'sharpness': 1.2,
+        'contrast': 1.1,
+        'unsharp': None,
+        'post_sharpness': None,
+    },
+}
+
+# Pipeline profiles: which stages and backends each mode uses
+PROFILES = {
+    'ai': {
+        'label': 'AI (Real-ESRGAN + REMBG)',
+        'enhance': None,
+        'upscaler': 'auto',
+        'mask': 'auto',
+        'tolerance': 35,
+    },
+    'simple': {
+        'label': 'Simple (Lanczos + REMBG)',
+        'enhance': None,
+        'upscaler': 'lanczos',
+        'mask': 'rembg',
+        'tolerance': 35,
+    },
+    'pillow': {
+        'label': 'Smart (pure Pillow)',
+        'enhance': 'pillow',
+        'upscaler': 'lanczos',
+        'mask': 'edge',
+        'tolerance': 35,
+    },
+    'gentle': {
+        'label': 'Pro (color-preserving)',
+        'enhance': 'gentle',
+        'upscaler': 'lanczos',
+        'mask': 'corner',
+        'tolerance': 60,
+    },
+    'denoise': {
+        'label': 'Denoise (OpenCV)',
+        'enhance': 'denoise',
+        'upscaler': 'lanczos',
+        'mask': 'box',
+        'tolerance': 30,
+    },
+}
+
+DEFAULT_PROFILE = 'pillow'
+
+# Lazily loaded models (None = not tried yet, False = unavailable)
+_models = {}
+
+
+def _load_model(name, loader):
+    """Load a model once and remember failures"""
+    if name not in _models:
+        try:
+            logger.info(f"🔄 Loading {name} model...")
+            _models[name] = loader()
+            logger.info(f"✅ {name} model loaded")
+        except Exception as e:
+            logger.warning(f"{name} not available: {e}")
+            _models[name] = False
+    return _models[name] or None
+
+
+def _load_realesrgan():
+    from basicsr.archs.rrdbnet_arch import RRDBNet
+    from realesrgan import RealESRGANer
+
+    model = RRDBNet(num_in_ch=3, num_out_ch=3, num_feat=64, num_block=23, num_grow_ch=32, scale=4)
+    return RealESRGANer(
+        scale=4,
+        model_path='https://github.com/xinntao/Real-ESRGAN/releases/download/v0.1.0/RealESRGAN_x4plus.pth',
+        model=model,
+        tile=0,
+        tile_pad=10,
+        pre_pad=0,
+        half=False
+    )
+
+
+# ONNX Runtime upscaler: a compact ESRGAN-family model (e.g. realesr-general-x4v3)
+# exported to ONNX, run on CPU without the torch/basicsr stack
+ONNX_MODEL_PATH = os.environ.get(
+    'IMAGEBOOST_ONNX_MODEL', str(Path(__file__).parent / 'models' / 'realesr-general-x4v3.onnx')
+)
+ONNX_THREADS = int(os.environ.get('IMAGEBOOST_ONNX_THREADS', 0))   # intra-op threads, 0 = all cores
+ONNX_TILE = int(os.environ.get('IMAGEBOOST_ONNX_TILE', 256))       # tile edge in input pixels, 0 = whole image
+ONNX_TILE_PAD = 10                                                  # context around each tile, hides seams
+
+
+def _load_onnx():
+    import onnxruntime as ort
+
+    if not os.path.exists(ONNX_MODEL_PATH):
+        raise FileNotFoundError(f"no model at {ONNX_MODEL_PATH}")
+
+    session_options = ort.SessionOptions()
+    session_options.intra_op_num_threads = ONNX_THREADS
+    session_options.inter_op_num_threads = 1
+    session_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    return ort.InferenceSession(ONNX_MODEL_PATH, session_options, providers=['CPUExecutionProvider'])
+
+
+def _load_rembg():
+    import rembg
+    return rembg.new_session('u2net')
+
+
+def _has_cv2():
+    try:
+        import cv2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+# ---------------------------------------------------------------------------
+# Enhance stage
+# ---------------------------------------------------------------------------
+
+# ImageFilter.SMOOTH, the blur ImageEnhance.Sharpness blends against
+SMOOTH_KERNEL = np.array([[1, 1, 1], [1, 5, 1], [1, 1, 1]], dtype=np.float64) / 13
+IDENTITY_KERNEL = np.array([[0, 0, 0], [0, 1, 0], [0, 0, 0]], dtype=np.float64)
+
+
+def enhancement_kernel(sharpness=1.0, contrast=1.0, mean=0):
+    """One 3x3 filter equal to ImageEnhance.Sharpness then ImageEnhance.Contrast
+
+    Sharpness is f*x + (1-f)*smooth(x) and Contrast is c*x + (1-c)*mean, both
+    linear, so they collapse into a single convolution with an offset: one pass
+    and one output image instead of two blurred/blended copies per step.
+    """
+    kernel = contrast * (sharpness * IDENTITY_KERNEL + (1 - sharpness) * SMOOTH_KERNEL)
+    return ImageFilter.Kernel((3, 3), kernel.flatten().tolist(), scale=1, offset=(1 - contrast) * mean)
+
+
+def _contrast_border(image, contrast, mean):
+    """Apply contrast to the 1px frame a 3x3 filter copies through unchanged (in place)"""
+    lut = [min(255, max(0, round(mean + contrast * (v - mean)))) for v in range(256)] * len(image.getbands())
+    width, height = image.size
+    for box in ((0, 0, width, 1), (0, height - 1, width, height), (0, 0, 1, height), (width - 1, 0, width, height)):
+        image.paste(image.crop(box).point(lut), box)
+
+
+def enhance_image(image, preset):
+    """Pre-upscale enhancement (denoise, then sharpen + contrast in one pass, unsharp mask)"""
+    settings = ENHANCE_PRESETS[preset]
+    alpha = image.getchannel('A') if image.mode == 'RGBA' else None
+    enhanced = image.convert('RGB') if alpha is not None else image
+
+    if settings['denoise'] and _has_cv2():
+        import cv2
+        # Bilateral filter for noise reduction while preserving edges (not linear, so not fused)
+        enhanced = Image.fromarray(cv2.bilateralFilter(np.asarray(enhanced), 9, 75, 75))
+
+    # Contrast pivots on the mean luminance, as ImageEnhance.Contrast does
+    contrast = settings['contrast']
+    mean = sum(i * n for i, n in enumerate(enhanced.convert('L').histogram())) / (enhanced.width * enhanced.height)
+    enhanced = enhanced.filter(enhancement_kernel(settings['sharpness'], contrast, mean))
+    _contrast_border(enhanced, contrast, mean)
+
+    if settings['unsharp']:
+        radius, percent, threshold = settings['unsharp']
+        enhanced = enhanced.filter(ImageFilter.UnsharpMask(radius=radius, percent=percent, threshold=threshold))
+
+    # Alpha is passed through untouched (the mask stage replaces it anyway)
+    if alpha is not None:
+        enhanced.putalpha(alpha)
+    return enhanced
+
+
+def post_sharpen(image, preset):
+    """Post-upscale sharpening pass (one filter pass over the large image)"""
+    amount = ENHANCE_PRESETS[preset]['post_sharpness']
+    if not amount:
+        return image
+    return image.filter(enhancement_kernel(sharpness=amount))
+
+
+# ---------------------------------------------------------------------------
+# Upscale backends
+# ---------------------------------------------------------------------------
+
+def upscale_lanczos(image, scale):
+    """High quality LANCZOS resampling"""
+    width, height = image.size
+    return image.resize((width * scale, height * scale), Image.Resampling.LANCZOS)
+
+
+def upscale_realesrgan(image, scale):
+    """Real-ESRGAN x4 model (torch)"""
+    upscaler = _load_model('Real-ESRGAN', _load_realesrgan)
+    alpha = image.getchannel('A') if image.mode == 'RGBA' else None
+
+    # RealESRGANer works on BGR arrays like cv2.imread returns
+    bgr = np.asarray(image.convert('RGB'))[:, :, ::-1]
+    output, _ = upscaler.enhance(np.ascontiguousarray(bgr), outscale=scale)
+    upscaled = Image.fromarray(output[:, :, ::-1])
+
+    if alpha is not None:
+        upscaled.putalpha(alpha.resize(upscaled.size, Image.Resampling.LANCZOS))
+    return upscaled
+
+
+def _onnx_infer(session, rgb):
+    """Run the model on a float32 HWC RGB array in [0, 1]; returns uint8 HWC"""
+    feed = {session.get_inputs()[0].name: rgb.transpose(2, 0, 1)[np.newaxis]}
+    output = session.run(None, feed)[0][0].transpose(1, 2, 0)
+    return (np.clip(output, 0, 1) * 255).round().astype(np.uint8)
+
+
+def upscale_onnx(image, scale):
+    """ESRGAN-family model through ONNX Runtime (CPU), tiled to bound memory"""
+    session = _load_model('ONNX', _load_onnx)
+    alpha = image.getchannel('A') if image.mode == 'RGBA' else None
+
+    rgb = np.asarray(image.convert('RGB'), dtype=np.float32) / 255
+    height, width = rgb.shape[:2]
+    tile = ONNX_TILE or max(height, width)
+    pad = ONNX_TILE_PAD if ONNX_TILE else 0
+
+    output = None
+    for y in range(0, height, tile):
+        for x in range(0, width, tile):
+            # Infer on the tile plus some context, keep only the tile's own pixels
+            y0, y1 = max(y - pad, 0), min(y + tile + pad, height)
+            x0, x1 = max(x - pad, 0), min(x + tile + pad, width)
+            result = _onnx_infer(session, np.ascontiguousarray(rgb[y0:y1, x0:x1]))
+
+            factor = result.shape[0] // (y1 - y0)
+            if output is None:
+                output = np.empty((height * factor, width * factor, 3), dtype=np.uint8)
+
+            tile_h, tile_w = min(tile, height - y), min(tile, width - x)
+            top, left = (y - y0) * factor, (x - x0) * factor
+            output[y * factor:(y + tile_h) * factor, x * factor:(x + tile_w) * factor] = \
+                result[top:top + tile_h * factor, left:left + tile_w * factor]
+
+    upscaled = Image.fromarray(output)
+
+    # The model has a fixed factor (usually 4x); resample to the requested scale
+    target = (width * scale, height * scale)
+    if upscaled.size != target:
+        upscaled = upscaled.resize(target, Image.Resampling.LANCZOS)
+
+    if alpha is not None:
+        upscaled.putalpha(alpha.resize(upscaled.size, Image.Resampling.LANCZOS))
+    return upscaled
+
+
+UPSCALE_BACKENDS = {
+    'onnx': {
+        'label': 'ESRGAN (ONNX Runtime, CPU)',
+        'run': upscale_onnx,
+        'available': lambda: _load_model('ONNX', _load_onnx) is not None,
+    },
+    'realesrgan': {
+        'label': 'Real-ESRGAN (torch)',
+        'run': upscale_realesrgan,
+        'available': lambda: _load_model('Real-ESRGAN', _load_realesrgan) is not None,
+    },
+    'lanczos': {
+        'label': 'Lanczos',
+        'run': upscale_lanczos,
+        'available': lambda: True,
+    },
+}
+
+# Preference order for 'auto': ONNX Runtime is much faster than torch on CPU
+UPSCALE_PREFERENCE = ['onnx', 'realesrgan', 'lanczos']
+
+
+# ---------------------------------------------------------------------------
+# Mask backends - each returns an 'L' alpha mask the size of the image
+# ---------------------------------------------------------------------------
+
+# Border sampling: thin strips cropped from the image, never the whole frame
+EDGE_BAND = 2
+CORNER_SIZE = 15
+MAX_BORDER_SAMPLES = 2048
+
+# Colors are binned to 16 levels per channel so JPEG noise lands in one bin
+QUANT_SHIFT = 4
+# Samples within this RGB distance of the dominant bin's mean count as background
+INLIER_DISTANCE = 24.0
+
+
+def sample_border(image, region='edge'):
+    """Border pixels as an (N, 3) int array ('edge' strips or 'corner' squares)"""
+    width, height = image.size
+
+    if region == 'corner':
+        s = min(CORNER_SIZE, width, height)
+        boxes = [(0, 0, s, s), (width - s, 0, width, s),
+                 (0, height - s, s, height), (width - s, height - s, width, height)]
+    else:
+        b = min(EDGE_BAND, width, height)
+        boxes = [(0, 0, width, b), (0, height - b, width, height),
+                 (0, 0, b, height), (width - b, 0, width, height)]
+
+    samples = np.concatenate([
+        np.asarray(image.crop(box).convert('RGB')).reshape(-1, 3) for box in boxes
+    ]).astype(np.int32)
+
+    if len(samples) > MAX_BORDER_SAMPLES:
+        samples = samples[::-(-len(samples) // MAX_BORDER_SAMPLES)]
+    return samples
+
+
+def detect_background(image, region='edge'):
+    """Dominant border color via histogram binning, with a confidence score
+
+    Returns {'color': (r, g, b), 'confidence': share of border samples that match
+    it, 'noise': per-channel std of the matching samples}.
+    """
+    samples = sample_border(image, region)
+    if len(samples) == 0:
+        return {'color': (255, 255, 255), 'confidence': 0.0, 'noise': (0.0, 0.0, 0.0)}
+
+    levels = 256 >> QUANT_SHIFT
+    quantized = samples >> QUANT_SHIFT
+    bins = (quantized[:, 0] * levels + quantized[:, 1]) * levels + quantized[:, 2]
+    top_bin = np.bincount(bins, minlength=levels ** 3).argmax()
+
+    # Re-center on the top bin's mean, then pull in neighbours split across bin edges
+    samples = samples.astype(np.float32)
+    center = samples[bins == top_bin].mean(axis=0)
+    distance_sq = ((samples - center) ** 2).sum(axis=1)
+    inliers = samples[distance_sq <= INLIER_DISTANCE ** 2]
+
+    return {
+        'color': tuple(int(round(c)) for c in inliers.mean(axis=0)),
+        'confidence': round(len(inliers) / len(samples), 3),
+        'noise': tuple(round(float(n), 2) for n in inliers.std(axis=0)),
+    }
+
+
+def adaptive_tolerance(tolerance, background, weights=(1.0, 1.0, 1.0)):
+    """Widen tolerance to cover background noise, narrow it for unclear backgrounds
+
+    `weights` matches the distance metric the mask uses. Stays within 0.5x-2x of the
+    requested tolerance.
+    """
+    noise = np.asarray(background['noise']) * np.asarray(weights)
+    adjusted = max(tolerance, 2.5 * float(np.sqrt((noise ** 2).sum())))
+
+    # A busy border probably isn't background: be conservative
+    if background['confidence'] < 0.5:
+        adjusted *= max(0.5, background['confidence'] * 2)
+
+    return min(adjusted, tolerance * 2)
+
+
+def _background_and_tolerance(image, tolerance, region, adaptive, weights=(1.0, 1.0, 1.0)):
+    background = detect_background(image, region)
+    if adaptive:
+        tolerance = adaptive_tolerance(tolerance, background, weights)
+
+    logger.info(
+        f"Detected background color: {background['color']} "
+        f"(confidence {background['confidence']:.0%}, tolerance {tolerance:.1f})"
+    )
+    return background['color'], tolerance
+
+
+# Color-distance masks are split in two: a distance map against the background
+# color (expensive, tolerance-independent) and a threshold step that turns it into
+# alpha, so previews can re-threshold without recomputing distances
+
+def distance_edge(image, bg_color):
+    """Euclidean RGB distance to the background color"""
+    rgb = np.asarray(image.convert('RGB'), dtype=np.float32)
+    return np.sqrt(((rgb - bg_color) ** 2).sum(axis=2))
+
+
+def threshold_edge(distance, tolerance):
+    """Transparent within tolerance, ramping to opaque beyond it"""
+    alpha = np.clip((distance - tolerance) * 2, 0, 255)
+    alpha[distance <= tolerance] = 0
+
+    mask = Image.fromarray(alpha.astype(np.uint8), 'L')
+    return mask.filter(ImageFilter.GaussianBlur(radius=1))
+
+
+def mask_edge(image, tolerance, adaptive=True):
+    """Color-distance mask against the dominant edge color"""
+    bg_color, tolerance = _background_and_tolerance(image, tolerance, 'edge', adaptive)
+    return threshold_edge(distance_edge(image, bg_color), tolerance)
+
+
+CORNER_WEIGHTS = (0.3, 0.59, 0.11)
+
+
+def distance_corner(image, bg_color):
+    """Perceptually weighted RGB distance to the background color"""
+    rgb = np.asarray(image.convert('RGB'), dtype=np.float32)
+    weights = np.array(CORNER_WEIGHTS, dtype=np.float32)
+    return np.sqrt((((rgb - bg_color) * weights) ** 2).sum(axis=2))
+
+
+def threshold_corner(distance, tolerance):
+    """Transparent when very similar, gentle falloff when somewhat similar"""
+    alpha = np.full(distance.shape, 255, dtype=np.float32)
+    falloff = distance <= tolerance
+    alpha[falloff] = np.clip((distance[falloff] - tolerance * 0.6) * 3, 30, 255)
+    alpha[distance <= tolerance * 0.6] = 0
+
+    mask = Image.fromarray(alpha.astype(np.uint8), 'L')
+    return mask.filter(ImageFilter.GaussianBlur(radius=0.5))
+
+
+def mask_corner(image, tolerance, adaptive=True):
+    """Gentle perceptually-weighted mask against the dominant corner color"""
+    bg_color, tolerance = _background_and_tolerance(image, tolerance, 'corner', adaptive, CORNER_WEIGHTS)
+    return threshold_corner(distance_corner(image, bg_color), tolerance)
+
+
+def distance_box(image, bg_color):
+    """Largest per-channel difference from the background color"""
+    pixels = np.asarray(image.convert('RGB'))
+    return np.abs(pixels.astype(np.int16) - bg_color).max(axis=2)
+
+
+def threshold_box(distance, tolerance):
+    """Hard cut: background wherever every channel is within tolerance"""
+    return Image.fromarray(np.where(distance <= tolerance, 0, 255).astype(np.uint8), 'L')
+
+
+def mask_box(image, tolerance, adaptive=True):
+    """Hard per-channel tolerance box around the dominant edge color"""
+    bg_color, tolerance = _background_and_tolerance(image, tolerance, 'edge', adaptive)
+    mask = threshold_box(distance_box(image, bg_color), tolerance)
+
+    if image.mode == 'RGBA':
+        mask = ImageChops.darker(mask, image.getchannel('A'))
+    return mask
+
+
+def mask_rembg(image, tolerance, adaptive=True):
+    """U2-Net salient object mask via REMBG"""
+    import rembg
+    session = _load_model('REMBG', _load_rembg)
+    return rembg.remove(image, session=session, only_mask=True).convert('L')
+
+
+MASK_BACKENDS = {
+    'rembg': {
+        'run': mask_rembg,
+        'available': lambda: _load_model('REMBG', _load_rembg) is not None,
+    },
+    'edge': {
+        'run': mask_edge,
+        'available': lambda: True,
+        'region': 'edge',
+        'weights': (1.0, 1.0, 1.0),
+        'distance': distance_edge,
+        'threshold': threshold_edge,
+    },
+    'corner': {
+        'run': mask_corner,
+        'available': lambda: True,
+        'region': 'corner',
+        'weights': CORNER_WEIGHTS,
+        'distance': distance_corner,
+        'threshold': threshold_corner,
+    },
+    'box': {
+        'run': mask_box,
+        'available': lambda: True,
+        'region': 'edge',
+        'weights': (1.0, 1.0, 1.0),
+        'distance': distance_box,
+        'threshold': threshold_box,
+    },
+}
+
+# Preference order for 'auto' and for falling back from a missing backend
+MASK_PREFERENCE = ['rembg', 'edge']
+
+
+def select_backend(backends, preference, requested):
+    """Pick the requested backend, or the best installed one"""
+    if requested != 'auto':
+        if requested not in backends:
+            raise ValueError(f"Unknown backend: {requested}")
+        if backends[requested]['available']():
+            return requested
+        logger.warning(f"Backend {requested} not available, falling back")
+
+    for name in preference:
+        if backends[name]['available']():
+            return name
+
+    raise RuntimeError("No backend available")
+
+
+def available_backends():
+    """Report which upscale and mask backends are installed"""
+    return {
+        'upscalers': [name for name, b in UPSCALE_BACKENDS.items() if b['available']()],
+        'masks': [name for name, b in MASK_BACKENDS.items() if b['available']()],
+        'encoders': available_encoders(),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Matting refinement - trimap + fast guided filter
+# ---------------------------------------------------------------------------
+
+TRIMAP_BAND = 2                 # unknown band half-width, source pixels
+GUIDED_RADIUS = 8               # guided filter window radius, source pixels
+GUIDED_EPS = 1e-3               # regularisation: lower follows image edges more tightly
+REFINE_MAX_PIXELS = 4_000_000   # larger sources are refined on a downscaled copy
+
+
+def _box_mean(a, radius):
+    """Mean over a (2r+1)-square window, normalised by how much of it is inside the image"""
+    k = 2 * radius + 1
+    c = np.pad(a, ((radius + 1, radius), (radius + 1, radius))).cumsum(axis=0, dtype=np.float64).cumsum(axis=1)
+    total = c[k:, k:] - c[:-k, k:] - c[k:, :-k] + c[:-k, :-k]
+
+    height, width = a.shape
+    rows = np.minimum(np.arange(height) + radius, height - 1) - np.maximum(np.arange(height) - radius, 0) + 1
+    cols = np.minimum(np.arange(width) + radius, width - 1) - np.maximum(np.arange(width) - radius, 0) + 1
+    return (total / np.outer(rows, cols)).astype(np.float32)
+
+
+def _erode(binary, radius):
+    """Square erosion of a boolean array"""
+    return _box_mean(binary.astype(np.float32), radius) > 0.999
+
+
+def build_trimap(mask, band=TRIMAP_BAND):
+    """0 = background, 255 = foreground, 128 = unknown band around the coarse mask's edge"""
+    alpha = np.asarray(mask)
+    foreground = _erode(alpha > 127, band)
+    background = _erode(alpha <= 127, band)
+
+    trimap = np.full(alpha.shape, 128, dtype=np.uint8)
+    trimap[foreground] = 255
+    trimap[background] = 0
+    return trimap
+
+
+def guided_coefficients(guide, p, radius=GUIDED_RADIUS, eps=GUIDED_EPS):
+    """Color guided filter (He et al.) coefficients: alpha ~ a . I + b around each pixel
+
+    guide is HxWx3 float32 in [0, 1], p is HxW float32. Each window fits the
+    linear model by least squares; the per-pixel 3x3 systems are solved with an
+    explicit inverse so everything stays vectorised. Returns the window-averaged
+    (a_r, a_g, a_b, b), which can be applied to a higher-resolution guide.
+    """
+    channels = [guide[:, :, c] for c in range(3)]
+    mean_i = [_box_mean(ch, radius) for ch in channels]
+    mean_p = _box_mean(p, radius)
+    cov_ip = [_box_mean(ch * p, radius) - m * mean_p for ch, m in zip(channels, mean_i)]
+
+    def var(x, y):
+        return _box_mean(channels[x] * channels[y], radius) - mean_i[x] * mean_i[y]
+
+    rr, rg, rb = var(0, 0) + eps, var(0, 1), var(0, 2)
+    gg, gb = var(1, 1) + eps, var(1, 2)
+    bb = var(2, 2) + eps
+
+    # Inverse of the symmetric covariance matrix via cofactors
+    inv_rr = gg * bb - gb * gb
+    inv_rg = gb * rb - rg * bb
+    inv_rb = rg * gb - gg * rb
+    inv_gg = rr * bb - rb * rb
+    inv_gb = rb * rg - rr * gb
+    inv_bb = rr * gg - rg * rg
+    det = rr * inv_rr + rg * inv_rg + rb * inv_rb
+
+    a_r = (inv_rr * cov_ip[0] + inv_rg * cov_ip[1] + inv_rb * cov_ip[2]) / det
+    a_g = (inv_rg * cov_ip[0] + inv_gg * cov_ip[1] + inv_gb * cov_ip[2]) / det
+    a_b = (inv_rb * cov_ip[0] + inv_gb * cov_ip[1] + inv_bb * cov_ip[2]) / det
+    b = mean_p - a_r * mean_i[0] - a_g * mean_i[1] - a_b * mean_i[2]
+
+    return [_box_mean(c, radius) for c in (a_r, a_g, a_b, b)]
+
+
+def _sample_bilinear(a, ys, xs):
+    """Bilinear samples of a 2D array at float coordinates"""
+    height, width = a.shape
+    y0 = np.clip(np.floor(ys).astype(np.int64), 0, height - 1)
+    x0 = np.clip(np.floor(xs).astype(np.int64), 0, width - 1)
+    y1, x1 = np.minimum(y0 + 1, height - 1), np.minimum(x0 + 1, width - 1)
+    wy, wx = np.clip(ys - y0, 0, 1), np.clip(xs - x0, 0, 1)
+    top = a[y0, x0] * (1 - wx) + a[y0, x1] * wx
+    bottom = a[y1, x0] * (1 - wx) + a[y1, x1] * wx
+    return top * (1 - wy) + bottom * wy
+
+
+def refine_mask(source, image, mask):
+    """Snap a coarse mask's edges to the image (fast guided filter); returns a refined mask
+
+    The filter is solved at source resolution (before upscaling), where it is
+    cheap, then applied with the full-resolution `image` as guide, and only inside
+    the trimap's unknown band. Definite background/foreground are set to 0/255,
+    which removes the faint halo color-distance masks leave around the subject.
+    """
+    work = source.convert('RGB')
+    if work.width * work.height > REFINE_MAX_PIXELS:
+        ratio = (REFINE_MAX_PIXELS / (work.width * work.height)) ** 0.5
+        work = work.resize((max(1, int(work.width * ratio)), max(1, int(work.height * ratio))), Image.Resampling.BOX)
+
+    coarse = mask.resize(work.size, Image.Resampling.BOX)
+    trimap = build_trimap(coarse)
+    if not (trimap == 128).any():
+        return mask
+
+    coefficients = guided_coefficients(
+        np.asarray(work, dtype=np.float32) / 255,
+        np.asarray(coarse, dtype=np.float32) / 255
+    )
+
+    # Trimap at full size; only unknown pixels are evaluated
+    full_trimap = np.asarray(Image.fromarray(trimap, 'L').resize(mask.size, Image.Resampling.NEAREST))
+    alpha = full_trimap.copy()
+    ys, xs = np.nonzero(full_trimap == 128)
+
+    # Full-res pixel centers in work coordinates
+    sy, sx = work.height / mask.height, work.width / mask.width
+    wy, wx = (ys + 0.5) * sy - 0.5, (xs + 0.5) * sx - 0.5
+    a_r, a_g, a_b, b = (_sample_bilinear(c, wy, wx) for c in coefficients)
+
+    rgb = np.asarray(image.convert('RGB'))[ys, xs].astype(np.float32) / 255
+    values = a_r * rgb[:, 0] + a_g * rgb[:, 1] + a_b * rgb[:, 2] + b
+    alpha[ys, xs] = (np.clip(values, 0, 1) * 255).round().astype(np.uint8)
+
+    return Image.fromarray(alpha, 'L')
+
+
+# ---------------------------------------------------------------------------
+# Encoder stage
+# ---------------------------------------------------------------------------
+
+def _has_avif():
+    try:
+        from PIL import features
+        if features.check('avif'):
+            return True
+    except Exception:
+        pass
+
+    try:
+        import pillow_avif  # noqa: F401  (registers the AVIF plugin)
+        return True
+    except ImportError:
+        return False
+
+
+# Output encoders: Pillow save() arguments per profile
+ENCODERS = {
+    'png-fast': {
+        'label': 'PNG (fast)',
+        'format': 'PNG',
+        'extension': '.png',
+        'mimetype': 'image/png',
+        'params': {'compress_level': 1},
+        'available': lambda: True,
+    },
+    'png': {
+        'label': 'PNG (balanced)',
+        'format': 'PNG',
+        'extension': '.png',
+        'mimetype': 'image/png',
+        'params': {'compress_level': 6},
+        'available': lambda: True,
+    },
+    'png-max': {
+        'label': 'PNG (smallest)',
+        'format': 'PNG',
+        'extension': '.png',
+        'mimetype': 'image/png',
+        'params': {'optimize': True},
+        'available': lambda: True,
+    },
+    'webp': {
+        'label': 'WebP (lossless)',
+        'format': 'WEBP',
+        'extension': '.webp',
+        'mimetype': 'image/webp',
+        'params': {'lossless': True, 'quality': 80, 'method': 4, 'exact': True},
+        'available': lambda: True,
+    },
+    'avif': {
+        'label': 'AVIF (lossy, q90)',
+        'format': 'AVIF',
+        'extension': '.avif',
+        'mimetype': 'image/avif',
+        'params': {'quality': 90, 'speed': 6},
+        'available': _has_avif,
+    },
+}
+
+DEFAULT_ENCODER = 'png'
+
+# What to use when the requested encoder is not installed
+ENCODER_FALLBACKS = {
+    'avif': 'webp',
+}
+
+
+def negotiate_encoder(requested=None):
+    """Pick the requested encoder, falling back when it is not installed"""
+    name = requested or DEFAULT_ENCODER
+    if name not in ENCODERS:
+        raise ValueError(f"Unknown output format: {name}")
+
+    while not ENCODERS[name]['available']():
+        fallback = ENCODER_FALLBACKS.get(name, DEFAULT_ENCODER)
+        logger.warning(f"Encoder {name} not available, using {fallback}")
+        name = fallback
+
+    return name
+
+
+def available_encoders():
+    """Encoders that can be used on this machine"""
+    return [name for name, e in ENCODERS.items() if e['available']()]
+
+
+def encode_image(image, output_path, encoder=DEFAULT_ENCODER):
+    """Save the final image with the chosen encoder profile"""
+    spec = ENCODERS[encoder]
+    params = dict(spec['params'])
+
+    icc_profile = image.info.get('icc_profile')
+    if icc_profile:
+        params['icc_profile'] = icc_profile
+
+    image.save(output_path, format=spec['format'], **params)
+
+
+# ---------------------------------------------------------------------------
+# Decode-size policy
+# ---------------------------------------------------------------------------
+
+# Inputs above MAX_DECODE_PIXELS are never decoded; inputs whose upscaled output
+# would exceed MAX_OUTPUT_PIXELS are shrunk before upscaling
+MAX_DECODE_PIXELS = int(os.environ.get('IMAGEBOOST_MAX_DECODE_MP', 100)) * 1_000_000
+MAX_OUTPUT_PIXELS = int(os.environ.get('IMAGEBOOST_MAX_OUTPUT_MP', 100)) * 1_000_000
+
+# Pillow warns past this and refuses past twice this (decompression bomb guard)
+Image.MAX_IMAGE_PIXELS = MAX_DECODE_PIXELS
+
+
+def downscale_target(size, options):
+    """Input size that keeps the output under max_output_pixels, or None if it already fits"""
+    width, height = size
+    budget = options.get('max_output_pixels', MAX_OUTPUT_PIXELS) / options['scale'] ** 2
+    if width * height <= budget:
+        return None
+
+    ratio = (budget / (width * height)) ** 0.5
+    return max(1, int(width * ratio)), max(1, int(height * ratio))
+
+
+def decode_image(input_path, options):
+    """Open an input, shrinking it to the output budget while decoding"""
+    with Image.open(input_path) as source:
+        target = downscale_target(source.size, options)
+        if target:
+            logger.info(f"📉 Downscaling {source.width}x{source.height} → {target[0]}x{target[1]} to fit the output budget")
+            # JPEG decodes straight at 1/2, 1/4 or 1/8 size; other formats ignore this
+            source.draft(source.mode, target)
+
+        source.load()
+        if target and source.size != target:
+            return source.resize(target, Image.LANCZOS, reducing_gap=2.0)
+        return source.copy()
+
+
+# ---------------------------------------------------------------------------
+# Output sizes - several sizes from one pass
+# ---------------------------------------------------------------------------
+
+MAX_OUTPUT_SIZES = 6
+
+
+def parse_sizes(value):
+    """'4x,2x,512' → ['4x', '2x', '512px']: scales of the source or longest edges in pixels"""
+    sizes = []
+    for item in str(value).lower().replace(' ', '').split(','):
+        if not item:
+            continue
+        try:
+            if item.endswith('x') and not item.endswith('px'):
+                factor = float(item[:-1])
+                name, valid = f"{factor:g}x", 0 < factor <= 8
+            else:
+                edge = int(item.removesuffix('px'))
+                name, valid = f"{edge}px", edge >= 16
+        except ValueError:
+            raise ValueError(f"Invalid output size: {item}")
+        if not valid:
+            raise ValueError(f"Output size out of range: {item} (scales up to 8x, edges from 16px)")
+        if name not in sizes:
+            sizes.append(name)
+
+    if len(sizes) > MAX_OUTPUT_SIZES:
+        raise ValueError(f"At most {MAX_OUTPUT_SIZES} output sizes")
+    return sizes
+
+
+def output_variants(image, options):
+    """The full-size result resized to every requested size: {name: image}
+
+    Sizes are relative to the decoded source; pixel sizes never exceed the full-size result.
+    """
+    variants = {}
+    for name in options['sizes']:
+        if name.endswith('px'):
+            ratio = min(1.0, int(name[:-2]) / max(image.size))
+        else:
+            ratio = float(name[:-1]) / options['scale']
+
+        size = max(1, round(image.width * ratio)), max(1, round(image.height * ratio))
+        if size == image.size:
+            variants[name] = image
+        else:
+            # RGBA is resampled premultiplied, so cut-out edges don't pick up background color
+            variants[name] = image.resize(size, Image.LANCZOS, reducing_gap=2.0)
+    return variants
+
+
+def variant_paths(output_path, options):
+    """Where each output size is written; the full-size one is output_path itself"""
+    output_path = Path(output_path)
+    full_size = f"{options['scale']}x"
+    return {
+        name: output_path if name == full_size else output_path.with_name(f"{output_path.stem}@{name}{output_path.suffix}")
+        for name in options['sizes']
+    }
+
+
+# ---------------------------------------------------------------------------
+# Pipeline
+# ---------------------------------------------------------------------------
+
+def resolve_options(profile=None, scale=None, tolerance=None, encoder=None, adaptive=None, upscaler=None,
+                    refine=None, sizes=None):
+    """Merge request options over the profile defaults"""
+    profile = profile or DEFAULT_PROFILE
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown profile: {profile}")
+    if upscaler and upscaler != 'auto' and upscaler not in UPSCALE_BACKENDS:
+        raise ValueError(f"Unknown upscaler: {upscaler}")
+
+    options = dict(PROFILES[profile], profile=profile)
+    options['scale'] = int(scale) if scale else 4
+    if upscaler:
+        options['upscaler'] = upscaler
+    if tolerance is not None:
+        options['tolerance'] = float(tolerance)
+    options['encoder'] = negotiate_encoder(encoder)
+    options['adaptive'] = str(adaptive).lower() not in ('0', 'false', 'no', 'off') if adaptive is not None else True
+    options['refine'] = str(refine).lower() in ('1', 'true', 'yes', 'on') if refine is not None else False
+
+    # Several output sizes: upscale once to the largest, always one of the outputs
+    options['sizes'] = parse_sizes(sizes) if sizes else []
+    if options['sizes']:
+        scales = [float(name[:-1]) for name in options['sizes'] if not name.endswith('px')]
+        if scales:
+            options['scale'] = math.ceil(max(scales))
+        full_size = f"{options['scale']}x"
+        if full_size not in options['sizes']:
+            options['sizes'].insert(0, full_size)
+
+    if not 1 <= options['scale'] <= 8:
+        raise ValueError("Scale must be between 1 and 8")
+
+    options['max_output_pixels'] = MAX_OUTPUT_PIXELS
+
+    return options
+
+
+def output_extension(options):
+    """File extension for the options' encoder"""
+    return ENCODERS[options['encoder']]['extension']
+
+
+def run_pipeline(image, options, on_step=None):
+    """Run enhance → upscale → background removal on a PIL image"""
+    def step(name, progress):
+        if on_step:
+            on_step(name, progress)
+
+    if image.mode not in ('RGB', 'RGBA'):
+        image = image.convert('RGBA' if 'A' in image.getbands() else 'RGB')
+
+    icc_profile = image.info.get('icc_profile')
+
+    step('upscaling', 20)
+    preset = options['enhance']
+    if preset:
+        image = enhance_image(image, preset)
+
+    upscaler = select_backend(UPSCALE_BACKENDS, UPSCALE_PREFERENCE, options['upscaler'])
+    logger.info(f"🔍 Upscaling {options['scale']}x with {upscaler}...")
+    upscaled = UPSCALE_BACKENDS[upscaler]['run'](image, options['scale'])
+
+    if preset:
+        upscaled = post_sharpen(upscaled, preset)
+
+    step('removing_bg', 70)
+    masker = select_backend(MASK_BACKENDS, MASK_PREFERENCE, options['mask'])
+    logger.info(f"🎭 Removing background with {masker}...")
+    mask = MASK_BACKENDS[masker]['run'](upscaled, options['tolerance'], options['adaptive'])
+    if options['refine']:
+        logger.info("✨ Refining mask edges...")
+        mask = refine_mask(image, upscaled, mask)
+
+    final_image = upscaled.convert('RGBA')
+    final_image.putalpha(mask)
+
+    # Keep the source color profile
+    if icc_profile:
+        final_image.info['icc_profile'] = icc_profile
+
+    return final_image
+
+
+def process_file(input_path, output_path, options, on_step=None):
+    """Decode, process and encode one image file (and its other sizes); returns {size: path}"""
+    source = decode_image(input_path, options)
+    final_image = run_pipeline(source, options, on_step)
+
+    if on_step:
+        on_step('saving', 90)
+    encode_image(final_image, output_path, options['encoder'])
+
+    paths = variant_paths(output_path, options)
+    for name, variant in output_variants(final_image, options).items():
+        if paths[name] != Path(output_path):
+            encode_image(variant, paths[name], options['encoder'])
+
+    return paths
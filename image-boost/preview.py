@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+ImageBoost - Tolerance preview
+Background removal on a small proxy of an upload, with per-image stats cached so a tolerance change only re-thresholds
+"""
+
+import io
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from PIL import Image, ImageChops
+
+import pipeline
+
+PROXY_MAX_EDGE = 512
+MAX_PREVIEWS = 32
+
+
+def decode_proxy(stream, max_edge=PROXY_MAX_EDGE):
+    """Decode an upload straight to a proxy no larger than max_edge on either side"""
+    with Image.open(stream) as source:
+        if source.width * source.height > pipeline.MAX_DECODE_PIXELS:
+            raise ValueError(f"Image larger than {pipeline.MAX_DECODE_PIXELS // 1_000_000} megapixels")
+
+        # JPEG decodes straight at 1/2, 1/4 or 1/8 size
+        source.draft('RGB', (max_edge, max_edge))
+        source.load()
+        proxy = source.convert('RGBA' if 'A' in source.getbands() else 'RGB')
+
+    proxy.thumbnail((max_edge, max_edge), Image.Resampling.LANCZOS)
+    return proxy
+
+
+class PreviewCache:
+    """LRU of decoded proxies and their background stats, keyed by preview id"""
+
+    def __init__(self, max_entries=MAX_PREVIEWS):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()   # preview_id -> {'proxy': Image, 'stats': {(enhance, mask): stats}}
+
+    def add(self, proxy):
+        preview_id = str(uuid.uuid4())
+        with self._lock:
+            self._entries[preview_id] = {'proxy': proxy, 'stats': {}}
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return preview_id
+
+    def __contains__(self, preview_id):
+        with self._lock:
+            return preview_id in self._entries
+
+    def _stats(self, preview_id, options, masker):
+        """Enhanced proxy, detected background and distance map for a preset/mask pair"""
+        with self._lock:
+            entry = self._entries[preview_id]
+            self._entries.move_to_end(preview_id)
+
+        key = (options['enhance'], masker)
+        stats = entry['stats'].get(key)
+        if stats is None:
+            image = entry['proxy']
+            if options['enhance']:
+                image = pipeline.enhance_image(image, options['enhance'])
+
+            spec = pipeline.MASK_BACKENDS[masker]
+            stats = {'image': image}
+            if 'distance' in spec:
+                background = pipeline.detect_background(image, spec['region'])
+                stats['background'] = background
+                stats['distance'] = spec['distance'](image, background['color'])
+            else:
+                # Learned masks have no tolerance: cache the mask itself
+                stats['mask'] = spec['run'](image, options['tolerance'], options['adaptive'])
+            entry['stats'][key] = stats
+        return stats
+
+    def render(self, preview_id, options):
+        """PNG of the cut-out proxy and what was used; KeyError if the preview expired"""
+        start = time.perf_counter()
+        masker = pipeline.select_backend(pipeline.MASK_BACKENDS, pipeline.MASK_PREFERENCE, options['mask'])
+        stats = self._stats(preview_id, options, masker)
+        spec = pipeline.MASK_BACKENDS[masker]
+        image = stats['image']
+
+        info = {'mask': masker, 'requested_tolerance': options['tolerance']}
+        if 'distance' in stats:
+            background = stats['background']
+            tolerance = options['tolerance']
+            if options['adaptive']:
+                tolerance = pipeline.adaptive_tolerance(tolerance, background, spec['weights'])
+
+            mask = spec['threshold'](stats['distance'], tolerance)
+            if masker == 'box' and image.mode == 'RGBA':
+                mask = ImageChops.darker(mask, image.getchannel('A'))
+            info.update(
+                tolerance=round(tolerance, 1),
+                background=background['color'],
+                confidence=background['confidence']
+            )
+        else:
+            mask = stats['mask']
+
+        if options['refine']:
+            mask = pipeline.refine_mask(image, image, mask)
+
+        cutout = image.convert('RGBA')
+        cutout.putalpha(mask)
+
+        buffer = io.BytesIO()
+        cutout.save(buffer, 'PNG', compress_level=1)
+
+        info['transparent'] = round(mask.histogram()[0] / (mask.width * mask.height), 3)
+        info['elapsed_ms'] = round((time.perf_counter() - start) * 1000, 1)
+        return buffer.getvalue(), info
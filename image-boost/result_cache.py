@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+ImageBoost - Result cache
+Processed outputs keyed by input content + pipeline options, LRU-evicted to a disk budget
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Options that change the output bytes
+KEY_OPTIONS = ('profile', 'upscaler', 'scale', 'tolerance', 'adaptive', 'refine', 'encoder', 'max_output_pixels')
+
+
+def file_digest(path, chunk_size=1024 * 1024):
+    """SHA-256 of a file's bytes"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cache_key(input_path, options, extension):
+    """Cache file name for an input file processed with `options`"""
+    settings = json.dumps({name: options.get(name) for name in KEY_OPTIONS}, sort_keys=True)
+    options_digest = hashlib.sha256(settings.encode()).hexdigest()[:16]
+    return f"{file_digest(input_path)}-{options_digest}{extension}"
+
+
+def variant_key(key, name):
+    """Cache file name for another output size of the result cached under `key`"""
+    path = Path(key)
+    return f"{path.stem}@{name}{path.suffix}"
+
+
+def link_or_copy(src, dest):
+    """Hard link when possible (instant, no extra disk), copy otherwise"""
+    try:
+        if os.path.exists(dest):
+            os.unlink(dest)
+        os.link(src, dest)
+    except OSError:
+        shutil.copyfile(src, dest)
+
+
+class ResultCache:
+    """Thread-safe LRU cache of processed outputs on disk"""
+
+    def __init__(self, cache_dir, max_bytes):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(exist_ok=True)
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> size in bytes, least recently used first
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+        self._load()
+
+    def _load(self):
+        """Index existing cache files, oldest use first"""
+        files = [p for p in self.cache_dir.iterdir() if p.is_file() and not p.name.startswith('.')]
+        for path in sorted(files, key=lambda p: p.stat().st_mtime):
+            size = path.stat().st_size
+            self._entries[path.name] = size
+            self._total_bytes += size
+
+        with self._lock:
+            self._evict()
+
+        if self._entries:
+            logger.info(f"🗄️  Result cache: {len(self._entries)} entries, {self._total_bytes / 1024 / 1024:.1f} MB")
+
+    def fetch(self, key, dest):
+        """Copy a cached result to `dest`; False on a miss"""
+        return self.fetch_all([(key, dest)])
+
+    def fetch_all(self, entries):
+        """Copy several cached results, e.g. every size of one output; False unless all are cached"""
+        with self._lock:
+            if not all(key in self._entries for key, _ in entries):
+                self.misses += 1
+                return False
+
+            for key, dest in entries:
+                path = self.cache_dir / key
+                try:
+                    link_or_copy(path, dest)
+                    os.utime(path)
+                except OSError as e:
+                    logger.warning(f"Cache entry {key} unreadable: {e}")
+                    self._drop(key)
+                    self.misses += 1
+                    return False
+                self._entries.move_to_end(key)
+
+            self.hits += 1
+            return True
+
+    def store(self, key, src):
+        """Add a freshly processed output"""
+        size = os.path.getsize(src)
+        if size > self.max_bytes:
+            return
+
+        path = self.cache_dir / key
+        tmp_path = self.cache_dir / f".{key}.tmp"
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return
+
+            try:
+                link_or_copy(src, tmp_path)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                logger.warning(f"Could not cache {key}: {e}")
+                return
+
+            self._entries[key] = size
+            self._total_bytes += size
+            self._evict()
+
+    def _drop(self, key):
+        size = self._entries.pop(key, 0)
+        self._total_bytes -= size
+        try:
+            os.unlink(self.cache_dir / key)
+        except FileNotFoundError:
+            pass
+
+    def _evict(self):
+        """Remove least recently used entries until under budget"""
+        while self._total_bytes > self.max_bytes and self._entries:
+            key = next(iter(self._entries))
+            self._drop(key)
+
+    def stats(self):
+        """Entry count, disk usage and lifetime hit rate"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self._total_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+            }
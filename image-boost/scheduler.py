@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+ImageBoost - Job scheduler
+Bounded worker pool shared by every batch, with per-client round robin and a priority lane for quick jobs
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+
+logger = logging.getLogger(__name__)
+
+LANES = ('quick', 'bulk')
+
+# Queue position updates are coalesced to at most one per this many seconds
+POSITION_UPDATE_INTERVAL = 0.5
+
+
+class Scheduler:
+    """Runs queued files on a fixed number of worker threads
+
+    Batches whose estimated cost is at most `quick_cost` go to the quick lane,
+    which is served first; after `quick_burst` quick files in a row one bulk file
+    runs, so large batches still make progress. Within a lane, clients take turns
+    one file at a time, so one client's 200-image batch can't starve another's.
+    """
+
+    def __init__(self, run, workers, quick_cost, quick_burst=4, on_change=None):
+        self.run = run                  # run(batch_id, payload) on a worker thread
+        self.workers = workers
+        self.quick_cost = quick_cost
+        self.quick_burst = quick_burst
+        self.on_change = on_change      # on_change(changed positions) after the queue moves
+
+        self._condition = threading.Condition()
+        # lane -> client_id -> deque of (batch_id, task_id, payload), clients in turn order
+        self._lanes = {lane: OrderedDict() for lane in LANES}
+        self._burst = 0
+        self._running = 0
+        self._threads = []
+
+        self._update_lock = threading.Lock()
+        self._publish_lock = threading.Lock()
+        self._update_pending = False
+        self._last_update = 0.0
+        self._published = {}            # batch_id -> {task_id: position} last sent
+
+    def start(self):
+        """Start the worker threads (once)"""
+        with self._condition:
+            if self._threads:
+                return
+            for n in range(self.workers):
+                thread = threading.Thread(target=self._work, daemon=True, name=f"imageboost-worker-{n}")
+                thread.start()
+                self._threads.append(thread)
+
+    def is_alive(self):
+        return any(thread.is_alive() for thread in self._threads)
+
+    # Queue
+
+    def submit(self, client_id, batch_id, tasks, cost):
+        """Queue a batch's (task_id, payload) pairs, in order, for one client"""
+        lane = 'quick' if cost <= self.quick_cost else 'bulk'
+        with self._condition:
+            queue = self._lanes[lane].setdefault(client_id, deque())
+            queue.extend((batch_id, task_id, payload) for task_id, payload in tasks)
+            self._condition.notify(len(tasks))
+        self._changed()
+        return lane
+
+    def cancel(self, batch_id):
+        """Drop a batch's queued tasks; returns their payloads"""
+        cancelled = []
+        with self._condition:
+            for clients in self._lanes.values():
+                for client_id in list(clients):
+                    kept = deque()
+                    for task in clients[client_id]:
+                        (cancelled if task[0] == batch_id else kept).append(task)
+                    if kept:
+                        clients[client_id] = kept
+                    else:
+                        del clients[client_id]
+
+        if cancelled:
+            self._changed()
+        return [payload for _, _, payload in cancelled]
+
+    def _next_lane(self, lanes, burst):
+        """Lane to take the next task from, given lane contents and the quick streak"""
+        if lanes['quick'] and (burst < self.quick_burst or not lanes['bulk']):
+            return 'quick'
+        return 'bulk' if lanes['bulk'] else None
+
+    @staticmethod
+    def _pop(clients):
+        """Take the first client's next task and send the client to the back"""
+        client_id, queue = next(iter(clients.items()))
+        task = queue.popleft()
+        if queue:
+            clients.move_to_end(client_id)
+        else:
+            del clients[client_id]
+        return task
+
+    def _take(self):
+        """Next task under the lock, or None if nothing is queued"""
+        lane = self._next_lane(self._lanes, self._burst)
+        if lane is None:
+            return None
+        self._burst = self._burst + 1 if lane == 'quick' else 0
+        return self._pop(self._lanes[lane])
+
+    def positions(self):
+        """Queue position (0 = next to run) of every waiting task, grouped by batch"""
+        with self._condition:
+            lanes = {lane: OrderedDict((c, deque(q)) for c, q in clients.items())
+                     for lane, clients in self._lanes.items()}
+            burst = self._burst
+
+        # Replay the dispatch order on a copy of the queue
+        positions = {}
+        position = 0
+        while True:
+            lane = self._next_lane(lanes, burst)
+            if lane is None:
+                return positions
+            burst = burst + 1 if lane == 'quick' else 0
+            batch_id, task_id, _ = self._pop(lanes[lane])
+            positions.setdefault(batch_id, {})[task_id] = position
+            position += 1
+
+    # Workers
+
+    def _work(self):
+        while True:
+            with self._condition:
+                task = self._take()
+                while task is None:
+                    self._condition.wait()
+                    task = self._take()
+                self._running += 1
+
+            self._changed()
+            batch_id, task_id, payload = task
+            try:
+                self.run(batch_id, payload)
+            except Exception as e:
+                logger.error(f"❌ Task {task_id} failed: {e}")
+            finally:
+                with self._condition:
+                    self._running -= 1
+
+    def _changed(self):
+        """Schedule a position update; moves within POSITION_UPDATE_INTERVAL share one"""
+        if not self.on_change:
+            return
+        with self._update_lock:
+            if self._update_pending:
+                return
+            self._update_pending = True
+            delay = self._last_update + POSITION_UPDATE_INTERVAL - time.monotonic()
+
+        if delay > 0:
+            timer = threading.Timer(delay, self._publish_positions)
+            timer.daemon = True
+            timer.start()
+        else:
+            self._publish_positions()
+
+    def _publish_positions(self):
+        """Send on_change only the positions that differ from the last update, per batch"""
+        with self._update_lock:
+            self._update_pending = False
+            self._last_update = time.monotonic()
+
+        with self._publish_lock:
+            positions = self.positions()
+            changed = {}
+            for batch_id, batch_positions in positions.items():
+                previous = self._published.get(batch_id, {})
+                delta = {task_id: position for task_id, position in batch_positions.items()
+                         if previous.get(task_id) != position}
+                if delta:
+                    changed[batch_id] = delta
+            self._published = positions
+
+            if changed:
+                try:
+                    self.on_change(changed)
+                except Exception as e:
+                    logger.error(f"❌ Queue update failed: {e}")
+
+    def stats(self):
+        with self._condition:
+            return {
+                'workers': self.workers,
+                'running': self._running,
+                'queued': {lane: sum(len(q) for q in clients.values()) for lane, clients in self._lanes.items()},
+                'clients': len(set().union(*(clients.keys() for clients in self._lanes.values()))),
+            }
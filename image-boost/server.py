@@ -1,24 +1,29 @@
 #!/usr/bin/env python3
 """
 ImageBoost - 4x Upscale + Background Removal Tool
-Drag & drop interface for image processing
+Unified server: single and batch uploads through one processing pipeline
 """
 
+import json
 import os
 import uuid
 import time
-from datetime import datetime
 from pathlib import Path
 import threading
-import json
 import logging
-import shutil
 
-from flask import Flask, request, jsonify, send_file, render_template_string
+from flask import Flask, Response, request, jsonify, send_file, render_template_string, stream_with_context
 from flask_cors import CORS
 from PIL import Image
-import cv2
-import numpy as np
+
+import events
+import ingest
+import jobs
+import pipeline
+import preview
+import result_cache
+import scheduler
+import zipstream
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -27,208 +32,586 @@ logger = logging.getLogger(__name__)
 app = Flask(__name__)
 CORS(app)
 
+app.config['DEFAULT_PROFILE'] = pipeline.DEFAULT_PROFILE
+app.config['MODE_LABEL'] = 'Unified Mode'
+
 # Directories
 BASE_DIR = Path(__file__).parent
 UPLOAD_DIR = BASE_DIR / "uploads"
 OUTPUT_DIR = BASE_DIR / "outputs"
-MODELS_DIR = BASE_DIR / "models"
+CACHE_DIR = BASE_DIR / "cache"
 
 # Create directories
-for dir_path in [UPLOAD_DIR, OUTPUT_DIR, MODELS_DIR]:
+for dir_path in [UPLOAD_DIR, OUTPUT_DIR]:
     dir_path.mkdir(exist_ok=True)
 
-# Global processing status
-processing_status = {}
+ALLOWED_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.webp', '.avif'}
+MAX_FILE_SIZE = 50 * 1024 * 1024
+MAX_BATCH_SIZE = int(os.environ.get('IMAGEBOOST_BATCH_MB', 500)) * 1024 * 1024
 
-def load_models():
-    """Load AI models on startup"""
-    global upscaler, bg_remover
-    
-    try:
-        logger.info("🔄 Loading Real-ESRGAN model...")
-        from basicsr.archs.rrdbnet_arch import RRDBNet
-        from realesrgan import RealESRGANer
-        
-        model = RRDBNet(num_in_ch=3, num_out_ch=3, num_feat=64, num_block=23, num_grow_ch=32, scale=4)
-        upscaler = RealESRGANer(
-            scale=4,
-            model_path='https://github.com/xinntao/Real-ESRGAN/releases/download/v0.1.0/RealESRGAN_x4plus.pth',
-            model=model,
-            tile=0,
-            tile_pad=10,
-            pre_pad=0,
-            half=False
-        )
-        logger.info("✅ Real-ESRGAN model loaded")
-        
-        logger.info("🔄 Loading REMBG model...")
-        import rembg
-        bg_remover = rembg.new_session('u2net')
-        logger.info("✅ REMBG model loaded")
-        
-    except Exception as e:
-        logger.error(f"❌ Model loading error: {e}")
-        upscaler, bg_remover = None, None
+# Uploads stream straight into UPLOAD_DIR; a request over MAX_BATCH_SIZE or a
+# file over MAX_FILE_SIZE is cut off with 413 while it is still arriving
+app.request_class = ingest.make_request_class(UPLOAD_DIR, MAX_FILE_SIZE)
+app.config['MAX_CONTENT_LENGTH'] = MAX_BATCH_SIZE
+
+# Inputs too large for the output budget: 'downscale' (default) or 'reject'
+app.config['OVERSIZE_POLICY'] = os.environ.get('IMAGEBOOST_OVERSIZE', 'downscale')
+OUTPUT_MIMETYPES = {e['extension']: e['mimetype'] for e in pipeline.ENCODERS.values()}
+
+# Processed results keyed by input hash + options (IMAGEBOOST_CACHE_MB, default 2 GB)
+CACHE_MAX_BYTES = int(os.environ.get('IMAGEBOOST_CACHE_MB', 2048)) * 1024 * 1024
+results = result_cache.ResultCache(CACHE_DIR, CACHE_MAX_BYTES)
+
+# Finished batches are forgotten (and their files deleted) after IMAGEBOOST_JOB_TTL_MIN;
+# outputs are also capped at IMAGEBOOST_OUTPUT_MB
+JOB_TTL_SECONDS = int(os.environ.get('IMAGEBOOST_JOB_TTL_MIN', 60)) * 60
+MAX_BATCHES = 500
+OUTPUT_MAX_BYTES = int(os.environ.get('IMAGEBOOST_OUTPUT_MB', 4096)) * 1024 * 1024
+SWEEP_INTERVAL = 60
+
+# Processing status for every file and batch
+registry = jobs.JobRegistry(JOB_TTL_SECONDS, MAX_BATCHES)
+
+# Every batch shares IMAGEBOOST_WORKERS worker threads. Batches whose total output
+# is at most IMAGEBOOST_QUICK_MP megapixels jump ahead of bulk batches
+WORKERS = int(os.environ.get('IMAGEBOOST_WORKERS', 2))
+QUICK_JOB_PIXELS = int(os.environ.get('IMAGEBOOST_QUICK_MP', 32)) * 1_000_000
+
+def set_file_status(batch_id, file_id, status):
+    """Record a file's step and push it to the batch event stream"""
+    registry.set_file(batch_id, file_id, status)
+
+    event = {key: value for key, value in status.items() if key not in ("output_path", "outputs")}
+    events.publish(batch_id, dict(event, type="file", file_id=file_id))
+
+def process_single_image(file_info, batch_id, options):
+    """Process a single image through the pipeline"""
+    file_id = file_info['id']
+    input_path = file_info['input_path']
+    output_path = file_info['output_path']
+    filename = file_info['filename']
+
+    def on_step(step, progress):
+        set_file_status(batch_id, file_id, {"step": step, "progress": progress, "filename": filename})
 
-def process_image_background(task_id, input_path, output_path):
-    """Background processing function"""
-    global processing_status
-    
     try:
-        processing_status[task_id] = {"step": "starting", "progress": 0}
-        
-        # Load image
-        logger.info(f"📂 Loading image: {input_path}")
-        img = cv2.imread(str(input_path), cv2.IMREAD_COLOR)
-        if img is None:
-            raise ValueError("Could not load image")
-            
-        processing_status[task_id] = {"step": "upscaling", "progress": 20}
-        
-        # Upscale 4x
-        logger.info("🔍 Upscaling image 4x...")
-        if upscaler:
-            output, _ = upscaler.enhance(img, outscale=4)
-        else:
-            # Fallback: simple resize
-            height, width = img.shape[:2]
-            output = cv2.resize(img, (width * 4, height * 4), interpolation=cv2.INTER_CUBIC)
-        
-        processing_status[task_id] = {"step": "removing_bg", "progress": 70}
-        
-        # Convert to PIL for background removal
-        logger.info("🎭 Removing background...")
-        output_pil = Image.fromarray(cv2.cvtColor(output, cv2.COLOR_BGR2RGB))
-        
-        if bg_remover:
-            import rembg
-            output_pil = rembg.remove(output_pil, session=bg_remover)
+        on_step("starting", 0)
+
+        # Identical upload with identical options: reuse the earlier result (every size of it)
+        key = result_cache.cache_key(input_path, options, pipeline.output_extension(options))
+        outputs = pipeline.variant_paths(output_path, options)
+        entries = [(key, output_path)] + [
+            (result_cache.variant_key(key, name), path) for name, path in outputs.items() if path != output_path
+        ]
+        cached = results.fetch_all(entries)
+
+        if cached:
+            logger.info(f"♻️  Cache hit: {filename}")
         else:
-            logger.warning("Background remover not available, skipping...")
-        
-        processing_status[task_id] = {"step": "saving", "progress": 90}
-        
-        # Save final image
-        logger.info(f"💾 Saving processed image: {output_path}")
-        output_pil.save(output_path, format='PNG', optimize=True)
-        
-        processing_status[task_id] = {"step": "complete", "progress": 100, "output_path": str(output_path)}
-        
+            logger.info(f"📂 Processing: {filename} ({options['profile']})")
+            pipeline.process_file(input_path, output_path, options, on_step)
+            for entry_key, path in entries:
+                results.store(entry_key, path)
+
+        status = {
+            "step": "complete",
+            "progress": 100,
+            "filename": filename,
+            "cached": cached,
+            "output_path": str(output_path)
+        }
+        if outputs:
+            status["sizes"] = list(outputs)
+            status["outputs"] = {name: str(path) for name, path in outputs.items()}
+        set_file_status(batch_id, file_id, status)
+
         # Clean up input file
         os.unlink(input_path)
-        
-        logger.info(f"✅ Processing complete: {task_id}")
-        
+
+        logger.info(f"✅ Completed: {filename}")
+
     except Exception as e:
-        logger.error(f"❌ Processing error: {e}")
-        processing_status[task_id] = {"step": "error", "progress": 0, "error": str(e)}
+        logger.error(f"❌ Error processing {filename}: {e}")
+        set_file_status(batch_id, file_id, {
+            "step": "error",
+            "progress": 0,
+            "filename": filename,
+            "error": str(e)
+        })
+
+def process_queued_file(batch_id, payload):
+    """Scheduler task: process one file and update its batch"""
+    file_info, options = payload
+    file_id = file_info['id']
+
+    try:
+        with registry.edit_batch(batch_id) as batch:
+            batch["files"][file_id] = {"status": "processing"}
+    except KeyError:
+        # Batch was cleaned up while the file was waiting
+        return
+
+    process_single_image(file_info, batch_id, options)
+
+    # Update batch progress
+    file_state = registry.get_file(file_id) or {}
+    try:
+        with registry.edit_batch(batch_id) as batch:
+            if file_state.get("step") == "complete":
+                batch["completed"] += 1
+                batch["files"][file_id] = {"status": "complete"}
+
+                cache_stats = batch["cache"]
+                cache_stats["hits" if file_state.get("cached") else "misses"] += 1
+                cache_stats["hit_rate"] = round(cache_stats["hits"] / (cache_stats["hits"] + cache_stats["misses"]), 3)
+            else:
+                batch["failed"] += 1
+                batch["files"][file_id] = {"status": "error"}
+
+            # Last file of the batch: mark it complete
+            done = batch["completed"] + batch["failed"] == batch["total_files"]
+            if done:
+                batch["step"] = "complete"
+                summary = {
+                    "completed": batch["completed"],
+                    "total_files": batch["total_files"],
+                    "cache": dict(batch["cache"])
+                }
+    except KeyError:
+        logger.info(f"Batch {batch_id} removed before it finished")
+        return
+
+    if done:
+        events.publish(batch_id, dict(summary, type="batch", step="complete"))
+        logger.info(f"✅ Batch {batch_id} complete: {summary['completed']}/{summary['total_files']}")
+
+def publish_queue_positions(positions):
+    """Tell waiting files (and their batch streams) where they are in the queue"""
+    for batch_id, batch_positions in positions.items():
+        registry.set_queue_positions(batch_positions)
+        events.publish(batch_id, {"type": "queue", "positions": batch_positions})
+
+# Small proxies of uploads being tuned in the UI, with their background stats
+previews = preview.PreviewCache()
+
+queue = scheduler.Scheduler(
+    process_queued_file,
+    workers=WORKERS,
+    quick_cost=QUICK_JOB_PIXELS,
+    on_change=publish_queue_positions
+)
+
+@app.teardown_request
+def discard_upload_spools(exc):
+    """Delete uploads that were received but never accepted"""
+    request.discard_spools()
+
+@app.errorhandler(413)
+def upload_too_large(e):
+    return jsonify({'error': e.description or f'Upload too large (max {MAX_BATCH_SIZE // 1024 // 1024}MB per batch)'}), 413
 
 @app.route('/')
 def index():
     """Main interface"""
-    return render_template_string(HTML_TEMPLATE)
+    return render_template_string(
+        HTML_TEMPLATE,
+        profiles=pipeline.PROFILES,
+        encoders={name: pipeline.ENCODERS[name] for name in pipeline.available_encoders()},
+        upscalers={name: b['label'] for name, b in pipeline.UPSCALE_BACKENDS.items() if b['available']()},
+        default_encoder=pipeline.DEFAULT_ENCODER,
+        default_profile=app.config['DEFAULT_PROFILE'],
+        mode_label=app.config['MODE_LABEL']
+    )
 
-@app.route('/upload', methods=['POST'])
-def upload_file():
-    """Handle file upload and start processing"""
-    
-    if 'file' not in request.files:
+@app.route('/backends')
+def get_backends():
+    """List pipeline profiles and installed backends"""
+    return jsonify({
+        'profiles': {name: p['label'] for name, p in pipeline.PROFILES.items()},
+        'default_profile': app.config['DEFAULT_PROFILE'],
+        'formats': {name: e['label'] for name, e in pipeline.ENCODERS.items()},
+        'default_format': pipeline.DEFAULT_ENCODER,
+        'cache': results.stats(),
+        'jobs': registry.stats(),
+        'queue': queue.stats(),
+        **pipeline.available_backends()
+    })
+
+def preview_options(values):
+    return pipeline.resolve_options(
+        values.get('profile') or app.config['DEFAULT_PROFILE'],
+        tolerance=values.get('tolerance') or None,
+        adaptive=values.get('adaptive'),
+        refine=values.get('refine')
+    )
+
+@app.route('/preview', methods=['POST'])
+def create_preview():
+    """Decode an upload to a small proxy and render it with the request's options"""
+    file = request.files.get('file')
+    if file is None or file.filename == '':
         return jsonify({'error': 'No file uploaded'}), 400
-    
-    file = request.files['file']
-    if file.filename == '':
-        return jsonify({'error': 'No file selected'}), 400
-    
-    # Validate file type
-    allowed_extensions = {'.jpg', '.jpeg', '.png', '.webp', '.avif'}
-    file_ext = Path(file.filename).suffix.lower()
-    
-    if file_ext not in allowed_extensions:
-        return jsonify({'error': f'Unsupported file type: {file_ext}'}), 400
-    
+
     try:
-        # Generate unique task ID
-        task_id = str(uuid.uuid4())
-        
-        # Save uploaded file
-        input_filename = f"{task_id}_input{file_ext}"
-        output_filename = f"{task_id}_processed.png"
-        
-        input_path = UPLOAD_DIR / input_filename
-        output_path = OUTPUT_DIR / output_filename
-        
-        file.save(input_path)
-        
-        # Start background processing
-        thread = threading.Thread(
-            target=process_image_background,
-            args=(task_id, input_path, output_path)
+        options = preview_options(request.form)
+        proxy = preview.decode_proxy(file.stream)
+    except Image.UnidentifiedImageError:
+        return jsonify({'error': f'{file.filename}: Not a readable image'}), 400
+    except (ValueError, OSError, Image.DecompressionBombError) as e:
+        return jsonify({'error': f'{file.filename}: {e}'}), 400
+
+    preview_id = previews.add(proxy)
+    _, info = previews.render(preview_id, options)
+    return jsonify({
+        'preview_id': preview_id,
+        'width': proxy.width,
+        'height': proxy.height,
+        'profile': options['profile'],
+        **info
+    })
+
+@app.route('/preview/<preview_id>')
+def render_preview(preview_id):
+    """Cut-out PNG of a preview proxy; only thresholding reruns as the tolerance changes"""
+    if preview_id not in previews:
+        return jsonify({'error': 'Preview expired'}), 404
+
+    try:
+        options = preview_options(request.args)
+        png, info = previews.render(preview_id, options)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except KeyError:
+        return jsonify({'error': 'Preview expired'}), 404
+
+    response = Response(png, mimetype='image/png')
+    response.headers['Cache-Control'] = 'no-store'
+    response.headers['X-Preview-Info'] = json.dumps(info)
+    return response
+
+@app.route('/upload', methods=['POST'])
+def upload_files():
+    """Handle single ('file') or multiple ('files') upload and start processing"""
+
+    single = 'file' in request.files
+    files = request.files.getlist('file' if single else 'files')
+    if not files or all(file.filename == '' for file in files):
+        return jsonify({'error': 'No files uploaded'}), 400
+
+    try:
+        options = pipeline.resolve_options(
+            request.form.get('profile') or app.config['DEFAULT_PROFILE'],
+            request.form.get('scale'),
+            request.form.get('tolerance'),
+            request.form.get('format'),
+            request.form.get('adaptive'),
+            request.form.get('upscaler'),
+            request.form.get('refine'),
+            request.form.get('sizes')
         )
-        thread.daemon = True
-        thread.start()
-        
-        return jsonify({
-            'task_id': task_id,
-            'status': 'processing_started'
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    # Validate files
+    valid_files = []
+
+    for file in files:
+        if file.filename == '':
+            continue
+
+        file_ext = Path(file.filename).suffix.lower()
+        if file_ext not in ALLOWED_EXTENSIONS:
+            return jsonify({'error': f'Unsupported file type: {file_ext}'}), 400
+
+        valid_files.append(file)
+
+    if not valid_files:
+        return jsonify({'error': 'No valid files found'}), 400
+
+    oversize = request.form.get('oversize') or app.config['OVERSIZE_POLICY']
+    if oversize not in ingest.OVERSIZE_POLICIES:
+        return jsonify({'error': f'Unknown oversize policy: {oversize}'}), 400
+
+    # Accept and vet every file before anything is queued
+    files_info = []
+
+    for file in valid_files:
+        file_id = str(uuid.uuid4())
+        file_ext = Path(file.filename).suffix.lower()
+
+        input_path = UPLOAD_DIR / f"{file_id}_input{file_ext}"
+        output_path = OUTPUT_DIR / f"{file_id}_processed{pipeline.output_extension(options)}"
+
+        ingest.accept(file, input_path)
+        files_info.append({
+            'id': file_id,
+            'filename': file.filename,
+            'input_path': input_path,
+            'output_path': output_path,
+            'variant_paths': list(pipeline.variant_paths(output_path, options).values())
         })
-        
+
+        try:
+            files_info[-1].update(ingest.inspect(input_path, options, oversize))
+        except ingest.IngestError as e:
+            for file_info in files_info:
+                os.unlink(file_info['input_path'])
+            return jsonify({'error': f'{file.filename}: {e}'}), 400
+
+    # Fair queuing is per client: the UI sends a per-browser id, API callers fall back to their address
+    client_id = request.form.get('client_id') or request.headers.get('X-Client-Id') or request.remote_addr
+
+    try:
+        # Generate batch ID
+        batch_id = str(uuid.uuid4())
+
+        # Register the batch before the worker starts so status/ZIP requests can't race it
+        registry.add_batch(batch_id, {
+            "step": "processing",
+            "profile": options['profile'],
+            "total_files": len(files_info),
+            "completed": 0,
+            "failed": 0,
+            "cache": {"hits": 0, "misses": 0, "hit_rate": 0.0},
+            "files": {f['id']: {"status": "queued"} for f in files_info}
+        }, files_info)
+        for f in files_info:
+            registry.set_file(batch_id, f['id'], {"step": "queued", "progress": 0, "filename": f['filename']})
+        events.open_batch(batch_id)
+
+        # Cheapest first, so small images are not stuck behind a huge one
+        ordered = sorted(files_info, key=lambda f: f['cost'])
+        lane = queue.submit(
+            client_id,
+            batch_id,
+            [(f['id'], (f, options)) for f in ordered],
+            cost=sum(f['cost'] for f in files_info)
+        )
+
+        response = {
+            'batch_id': batch_id,
+            'file_count': len(files_info),
+            'file_ids': [f['id'] for f in files_info],
+            'downscaled': [f['id'] for f in files_info if f['downscale_to']],
+            'profile': options['profile'],
+            'upscaler': options['upscaler'],
+            'format': options['encoder'],
+            'sizes': options['sizes'],
+            'lane': lane,
+            'status': 'queued'
+        }
+        if single:
+            response['task_id'] = files_info[0]['id']
+
+        return jsonify(response)
+
     except Exception as e:
         logger.error(f"Upload error: {e}")
         return jsonify({'error': str(e)}), 500
 
 @app.route('/status/<task_id>')
 def get_status(task_id):
-    """Get processing status"""
-    status = processing_status.get(task_id, {"step": "not_found", "progress": 0})
+    """Get single file processing status"""
+    status = registry.get_file(task_id) or {"step": "not_found", "progress": 0}
     return jsonify(status)
 
-@app.route('/download/<task_id>')
-def download_file(task_id):
-    """Download processed file"""
-    
-    status = processing_status.get(task_id, {})
-    
+@app.route('/batch-status/<batch_id>')
+def get_batch_status(batch_id):
+    """Get batch processing status"""
+    batch = registry.get_batch(batch_id, with_files=True) or {"step": "not_found"}
+    return jsonify(batch)
+
+def iter_batch_outputs(batch_id, poll_interval=0.25):
+    """Yield (output_path, zip entry name) as each batch file completes"""
+    sent = set()
+
+    while True:
+        batch = registry.get_batch(batch_id)
+        if not batch:
+            return
+
+        # Read the step first: once it is final, the file list is too
+        done = batch.get("step") != "processing"
+
+        for file_id, file_state in list(batch.get("files", {}).items()):
+            if file_id in sent or file_state["status"] in ("queued", "processing"):
+                continue
+            sent.add(file_id)
+
+            if file_state["status"] == "complete":
+                file_info = registry.get_file(file_id) or {}
+                output_path = file_info.get("output_path")
+                original_filename = file_info.get("filename", f"processed_{file_id}")
+                # Several sizes go in one folder per size
+                outputs = file_info.get("outputs") or {None: output_path}
+
+                for size, path in outputs.items():
+                    if path and os.path.exists(path):
+                        # Swap original extension for the output's
+                        entry_name = f"{Path(original_filename).stem}_processed{Path(path).suffix}"
+                        yield path, f"{size}/{entry_name}" if size else entry_name
+
+        if done:
+            return
+        time.sleep(poll_interval)
+
+@app.route('/batch-events/<batch_id>')
+def batch_events(batch_id):
+    """Server-Sent Events stream of per-file step transitions"""
+    return Response(
+        stream_with_context(events.stream(batch_id, request.headers.get('Last-Event-ID'))),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+@app.route('/download-batch/<batch_id>')
+def download_batch(batch_id):
+    """Stream processed files as a ZIP, including files still being processed"""
+
+    batch = registry.get_batch(batch_id)
+
+    if not batch:
+        return jsonify({'error': 'Batch not found'}), 404
+
+    if batch.get("step") == "error":
+        return jsonify({'error': 'Batch processing failed'}), 400
+
+    if batch.get("step") == "complete" and batch.get("completed", 0) == 0:
+        return jsonify({'error': 'No completed files found'}), 404
+
+    return Response(
+        stream_with_context(zipstream.stream_zip(iter_batch_outputs(batch_id))),
+        mimetype='application/zip',
+        headers={'Content-Disposition': f'attachment; filename="imageBoost_batch_{batch_id[:8]}.zip"'}
+    )
+
+@app.route('/download/<file_id>')
+def download_single_file(file_id):
+    """Download single processed file"""
+
+    status = registry.get_file(file_id) or {}
+
     if status.get("step") != "complete":
         return jsonify({'error': 'Processing not complete'}), 400
-    
+
     output_path = status.get("output_path")
+    filename = status.get("filename", "processed")
+
+    # ?size=2x picks one of the output sizes
+    size = request.args.get('size')
+    if size:
+        output_path = status.get("outputs", {}).get(size)
+        if not output_path:
+            return jsonify({'error': f'No {size} output'}), 404
+
     if not output_path or not os.path.exists(output_path):
         return jsonify({'error': 'File not found'}), 404
-    
+
+    # Create download name
+    base_name = Path(filename).stem
+    suffix = Path(output_path).suffix
+    download_name = f"{base_name}_processed@{size}{suffix}" if size else f"{base_name}_processed{suffix}"
+
     return send_file(
         output_path,
         as_attachment=True,
-        download_name=f"processed_{task_id}.png",
-        mimetype='image/png'
+        download_name=download_name,
+        mimetype=OUTPUT_MIMETYPES.get(suffix, 'application/octet-stream')
     )
 
+def delete_output(status):
+    """Delete the output file(s) a status points at"""
+    output_path = status.get("output_path")
+
+    for path in status.get("outputs", {}).values():
+        if path != output_path and os.path.exists(path):
+            os.unlink(path)
+
+    if output_path and os.path.exists(output_path):
+        os.unlink(output_path)
+        return True
+    return False
+
+def remove_file_outputs(file_id):
+    """Delete a file's output and forget its status"""
+    return delete_output(registry.remove_file(file_id))
+
+def evict_batch(batch_id):
+    """Forget a batch, its queued work, its events and its output files"""
+    for file_info, _ in queue.cancel(batch_id):
+        if os.path.exists(file_info['input_path']):
+            os.unlink(file_info['input_path'])
+    events.discard(batch_id)
+    return sum(delete_output(status) for status in registry.remove_batch(batch_id))
+
 @app.route('/cleanup/<task_id>', methods=['POST'])
 def cleanup_task(task_id):
-    """Clean up processed files"""
+    """Clean up a single file"""
     try:
-        status = processing_status.get(task_id, {})
-        output_path = status.get("output_path")
-        
-        if output_path and os.path.exists(output_path):
-            os.unlink(output_path)
-        
-        # Remove from status dict
-        if task_id in processing_status:
-            del processing_status[task_id]
-        
-        return jsonify({'status': 'cleaned'})
-        
+        cleaned = remove_file_outputs(task_id)
+        return jsonify({'status': 'cleaned', 'files_cleaned': int(cleaned)})
+
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-# HTML Template
+@app.route('/cleanup-batch/<batch_id>', methods=['POST'])
+def cleanup_batch(batch_id):
+    """Clean up batch files"""
+    try:
+        cleaned_count = evict_batch(batch_id)
+        return jsonify({'status': 'cleaned', 'files_cleaned': cleaned_count})
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+sweeper = jobs.Sweeper(
+    registry,
+    evict_batch,
+    directories=[UPLOAD_DIR, OUTPUT_DIR],
+    max_output_bytes=OUTPUT_MAX_BYTES,
+    output_dir=OUTPUT_DIR,
+    interval=SWEEP_INTERVAL
+)
+_sweeper_lock = threading.Lock()
+
+@app.before_request
+def ensure_background_threads():
+    """Start the sweeper and workers with the first request (works under any WSGI server)"""
+    if not sweeper.is_alive():
+        with _sweeper_lock:
+            if not sweeper.is_alive() and not sweeper.ident:
+                sweeper.start()
+    queue.start()
+
+def run_server(profile=None, label=None, debug=False):
+    """Start the server with a default pipeline profile"""
+    if profile:
+        app.config['DEFAULT_PROFILE'] = profile
+    if label:
+        app.config['MODE_LABEL'] = label
+
+    logger.info(f"🚀 Starting ImageBoost server ({app.config['MODE_LABEL']})...")
+
+    backends = pipeline.available_backends()
+    logger.info(f"🧩 Default profile: {app.config['DEFAULT_PROFILE']}")
+    logger.info(f"🔍 Upscalers: {', '.join(backends['upscalers'])}")
+    logger.info(f"🎭 Background removal: {', '.join(backends['masks'])}")
+    logger.info(f"💾 Output formats: {', '.join(backends['encoders'])}")
+
+    logger.info("🌐 Server running at http://localhost:8587")
+    logger.info("📁 Upload dir: " + str(UPLOAD_DIR))
+    logger.info("📁 Output dir: " + str(OUTPUT_DIR))
+
+    app.run(host='0.0.0.0', port=8587, debug=debug, threaded=True)
+
+# HTML Template (single + batch)
 HTML_TEMPLATE = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>🚀 ImageBoost - 4x Upscale + BG Removal</title>
+    <title>🚀 ImageBoost - Smart Upscale & Background Removal</title>
     <style>
         * {
             margin: 0;
@@ -244,7 +627,7 @@ HTML_TEMPLATE = """
         }
         
         .container {
-            max-width: 800px;
+            max-width: 900px;
             margin: 0 auto;
             background: white;
             border-radius: 16px;
@@ -318,55 +701,139 @@ HTML_TEMPLATE = """
             display: none;
         }
         
-        .processing-card {
-            background: #f8f9ff;
-            border-radius: 12px;
-            padding: 30px;
+        .batch-info {
+            background: #e8f5e8;
+            border-radius: 8px;
+            padding: 15px;
+            margin: 20px 0;
+            display: none;
+        }
+        
+        .file-list {
             margin-top: 20px;
             display: none;
         }
         
-        .progress-container {
+        .file-item {
+            background: #f8f9ff;
+            border-radius: 8px;
+            padding: 15px;
+            margin-bottom: 10px;
+            border-left: 4px solid #667eea;
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+        }
+        
+        .file-item.complete {
+            border-left-color: #4caf50;
+            background: #f1f8e9;
+        }
+        
+        .file-item.error {
+            border-left-color: #f44336;
+            background: #ffebee;
+        }
+        
+        .file-details {
+            flex-grow: 1;
+        }
+        
+        .file-name {
+            font-weight: 600;
+            margin-bottom: 5px;
+        }
+        
+        .file-progress {
             background: #e1e5fe;
-            border-radius: 20px;
-            height: 8px;
-            margin: 20px 0;
+            border-radius: 10px;
+            height: 6px;
+            margin: 10px 0;
             overflow: hidden;
+            width: 300px;
         }
         
-        .progress-bar {
+        .file-progress-bar {
             background: linear-gradient(90deg, #667eea, #764ba2);
             height: 100%;
             width: 0%;
-            border-radius: 20px;
+            border-radius: 10px;
             transition: width 0.5s ease;
         }
         
-        .status-text {
-            text-align: center;
-            color: #667eea;
-            font-weight: 600;
-            margin-bottom: 10px;
+        .file-status {
+            font-size: 0.9em;
+            color: #666;
+        }
+        
+        .file-actions {
+            margin-left: 20px;
         }
         
         .download-btn {
             background: linear-gradient(135deg, #4caf50, #45a049);
             color: white;
             border: none;
-            padding: 15px 30px;
-            border-radius: 8px;
-            font-size: 1.1em;
+            padding: 8px 16px;
+            border-radius: 6px;
+            font-size: 0.9em;
             font-weight: 600;
             cursor: pointer;
-            display: none;
-            margin: 20px auto 0;
             transition: transform 0.2s ease;
+            display: none;
         }
         
         .download-btn:hover {
+            transform: translateY(-1px);
+        }
+        
+        .download-btn.visible {
+            display: inline-block;
+        }
+        
+        .cleanup-section {
+            background: #f5f5f5;
+            border-radius: 8px;
+            padding: 20px;
+            margin-top: 20px;
+            text-align: center;
+            display: none;
+        }
+        
+        .cleanup-btn {
+            background: linear-gradient(135deg, #757575, #616161);
+            color: white;
+            border: none;
+            padding: 12px 24px;
+            border-radius: 8px;
+            font-size: 1em;
+            font-weight: 600;
+            cursor: pointer;
+            transition: transform 0.2s ease;
+        }
+        
+        .cleanup-btn:hover {
             transform: translateY(-2px);
         }
         
+        .cleanup-btn.zip-btn {
+            background: linear-gradient(135deg, #4caf50, #45a049);
+        }
+        
+        .options {
+            margin-top: 15px;
+            text-align: center;
+            color: #444;
+        }
+        
+        .options select,
+        .options input[type=text] {
+            padding: 6px 10px;
+            border-radius: 6px;
+            border: 1px solid #ccc;
+            margin: 0 15px 0 5px;
+        }
+        
         .error-card {
             background: #ffebee;
             border: 1px solid #f44336;
@@ -392,23 +859,66 @@ HTML_TEMPLATE = """
             margin: 0 2px;
             font-weight: 500;
         }
+        
+        .features {
+            background: #e8f5e8;
+            border-radius: 8px;
+            padding: 15px;
+            margin-top: 15px;
+            font-size: 0.9em;
+            color: #2e7d32;
+        }
+        
+        .preview-panel {
+            margin-top: 15px;
+            text-align: center;
+            display: none;
+        }
+        
+        .preview-panel img {
+            max-width: 100%;
+            max-height: 360px;
+            border-radius: 8px;
+            background: repeating-conic-gradient(#ddd 0% 25%, #fff 0% 50%) 50% / 20px 20px;
+        }
+        
+        .preview-panel input[type=range] {
+            width: 60%;
+            vertical-align: middle;
+        }
+        
+        .preview-stats {
+            color: #666;
+            font-size: 0.9em;
+            margin-top: 5px;
+        }
+        
+        .mode-badge {
+            background: #ff9800;
+            color: white;
+            padding: 4px 12px;
+            border-radius: 20px;
+            font-size: 0.8em;
+            font-weight: bold;
+            margin-left: 10px;
+        }
     </style>
 </head>
 <body>
     <div class="container">
         <div class="header">
-            <h1>🚀 ImageBoost</h1>
-            <p>4x Upscale + Background Removal</p>
+            <h1>🚀 ImageBoost <span class="mode-badge">{{ mode_label }}</span></h1>
+            <p>Smart Upscale + AI Background Removal</p>
         </div>
         
         <div class="content">
             <div class="drop-zone" id="dropZone">
                 <div class="drop-icon">📁</div>
-                <div class="drop-text">Drop your image here</div>
-                <div class="drop-hint">or click to select</div>
+                <div class="drop-text">Drop one or more images here</div>
+                <div class="drop-hint">or click to select files</div>
             </div>
             
-            <input type="file" id="fileInput" class="file-input" accept=".jpg,.jpeg,.png,.webp,.avif" />
+            <input type="file" id="fileInput" class="file-input" accept=".jpg,.jpeg,.png,.webp,.avif" multiple />
             
             <div class="supported-formats">
                 <strong>Supported formats:</strong>
@@ -419,12 +929,66 @@ HTML_TEMPLATE = """
                 <span class="format-tag">AVIF</span>
             </div>
             
-            <div class="processing-card" id="processingCard">
-                <div class="status-text" id="statusText">Preparing...</div>
-                <div class="progress-container">
-                    <div class="progress-bar" id="progressBar"></div>
-                </div>
-                <button class="download-btn" id="downloadBtn">📥 Download Processed Image</button>
+            <div class="features">
+                <strong>✨ Features:</strong> 
+                • One image or a whole batch through the same pipeline
+                • Pick a processing profile per upload
+                • Individual download for each processed image
+                • Download all as ZIP
+            </div>
+            
+            <div class="options">
+                <label for="profileSelect"><strong>Profile:</strong></label>
+                <select id="profileSelect">
+                    {% for name, profile in profiles.items() %}
+                    <option value="{{ name }}" data-tolerance="{{ profile.tolerance }}" {% if name == default_profile %}selected{% endif %}>{{ profile.label }}</option>
+                    {% endfor %}
+                </select>
+                <label for="scaleSelect"><strong>Scale:</strong></label>
+                <select id="scaleSelect">
+                    <option value="2">2x</option>
+                    <option value="4" selected>4x</option>
+                </select>
+                <label for="upscalerSelect"><strong>Upscaler:</strong></label>
+                <select id="upscalerSelect">
+                    <option value="" selected>Profile default</option>
+                    {% for name, label in upscalers.items() %}
+                    <option value="{{ name }}">{{ label }}</option>
+                    {% endfor %}
+                </select>
+                <label for="refineCheck"><strong>Refine edges:</strong></label>
+                <input type="checkbox" id="refineCheck">
+                <label for="sizesInput"><strong>Sizes:</strong></label>
+                <input type="text" id="sizesInput" placeholder="e.g. 4x,2x,512" size="12">
+                <label for="formatSelect"><strong>Output:</strong></label>
+                <select id="formatSelect">
+                    {% for name, encoder in encoders.items() %}
+                    <option value="{{ name }}" {% if name == default_encoder %}selected{% endif %}>{{ encoder.label }}</option>
+                    {% endfor %}
+                </select>
+                <button class="cleanup-btn" id="previewBtn" type="button">🔍 Preview tolerance</button>
+                <input type="file" id="previewInput" class="file-input" accept=".jpg,.jpeg,.png,.webp,.avif" />
+            </div>
+            
+            <div class="preview-panel" id="previewPanel">
+                <label for="toleranceRange"><strong>Tolerance:</strong></label>
+                <input type="range" id="toleranceRange" min="0" max="150" step="1">
+                <span id="toleranceValue"></span>
+                <button class="cleanup-btn" id="previewResetBtn" type="button">↺ Profile default</button>
+                <div><img id="previewImage" alt="Preview"></div>
+                <div class="preview-stats" id="previewStats"></div>
+            </div>
+            
+            <div class="batch-info" id="batchInfo">
+                <strong>📦 Processing Status:</strong> <span id="batchText"></span>
+            </div>
+            
+            <div class="file-list" id="fileList"></div>
+            
+            <div class="cleanup-section" id="cleanupSection">
+                <button class="cleanup-btn zip-btn" id="downloadAllBtn">📦 Download All as ZIP</button>
+                <button class="cleanup-btn" id="cleanupBtn">🗑️ Clean Up All Files</button>
+                <p style="margin-top: 10px; color: #666; font-size: 0.9em;">Remove all processed files from server</p>
             </div>
             
             <div class="error-card" id="errorCard">
@@ -436,15 +1000,40 @@ HTML_TEMPLATE = """
     <script>
         const dropZone = document.getElementById('dropZone');
         const fileInput = document.getElementById('fileInput');
-        const processingCard = document.getElementById('processingCard');
-        const statusText = document.getElementById('statusText');
-        const progressBar = document.getElementById('progressBar');
-        const downloadBtn = document.getElementById('downloadBtn');
+        const batchInfo = document.getElementById('batchInfo');
+        const batchText = document.getElementById('batchText');
+        const fileList = document.getElementById('fileList');
+        const cleanupSection = document.getElementById('cleanupSection');
+        const cleanupBtn = document.getElementById('cleanupBtn');
+        const downloadAllBtn = document.getElementById('downloadAllBtn');
+        const profileSelect = document.getElementById('profileSelect');
+        const scaleSelect = document.getElementById('scaleSelect');
+        const formatSelect = document.getElementById('formatSelect');
+        const upscalerSelect = document.getElementById('upscalerSelect');
+        const refineCheck = document.getElementById('refineCheck');
+        const sizesInput = document.getElementById('sizesInput');
+        
+        // Per-browser id so the server can queue fairly between users
+        let clientId = localStorage.getItem('imageboostClientId');
+        if (!clientId) {
+            clientId = Math.random().toString(36).slice(2) + Date.now().toString(36);
+            localStorage.setItem('imageboostClientId', clientId);
+        }
+        const previewBtn = document.getElementById('previewBtn');
+        const previewInput = document.getElementById('previewInput');
+        const previewPanel = document.getElementById('previewPanel');
+        const previewImage = document.getElementById('previewImage');
+        const previewStats = document.getElementById('previewStats');
+        const previewResetBtn = document.getElementById('previewResetBtn');
+        const toleranceRange = document.getElementById('toleranceRange');
+        const toleranceValue = document.getElementById('toleranceValue');
         const errorCard = document.getElementById('errorCard');
         const errorText = document.getElementById('errorText');
         
-        let currentTaskId = null;
+        let currentBatchId = null;
         let statusInterval = null;
+        let eventSource = null;
+        let fileStatuses = {};
         
         // Drag and drop handlers
         dropZone.addEventListener('click', () => fileInput.click());
@@ -452,7 +1041,90 @@ HTML_TEMPLATE = """
         dropZone.addEventListener('dragleave', handleDragLeave);
         dropZone.addEventListener('drop', handleDrop);
         fileInput.addEventListener('change', handleFileSelect);
-        downloadBtn.addEventListener('click', handleDownload);
+        cleanupBtn.addEventListener('click', handleCleanup);
+        downloadAllBtn.addEventListener('click', handleDownloadAll);
+        
+        // Tolerance preview: the proxy is decoded once, each slider move only re-thresholds it
+        let previewId = null;
+        let previewTimer = null;
+        let chosenTolerance = null;
+        
+        previewBtn.addEventListener('click', () => previewInput.click());
+        previewInput.addEventListener('change', handlePreviewSelect);
+        profileSelect.addEventListener('change', () => { resetTolerance(); refreshPreview(); });
+        refineCheck.addEventListener('change', refreshPreview);
+        previewResetBtn.addEventListener('click', () => { resetTolerance(); refreshPreview(); });
+        toleranceRange.addEventListener('input', () => {
+            chosenTolerance = toleranceRange.value;
+            toleranceValue.textContent = chosenTolerance;
+            clearTimeout(previewTimer);
+            previewTimer = setTimeout(refreshPreview, 120);
+        });
+        
+        function resetTolerance() {
+            chosenTolerance = null;
+            toleranceRange.value = profileSelect.selectedOptions[0].dataset.tolerance;
+            toleranceValue.textContent = `${toleranceRange.value} (profile)`;
+        }
+        
+        function previewParams() {
+            const params = new URLSearchParams({
+                profile: profileSelect.value,
+                refine: refineCheck.checked ? '1' : '0'
+            });
+            if (chosenTolerance !== null) params.set('tolerance', chosenTolerance);
+            return params;
+        }
+        
+        function showPreviewStats(info) {
+            const parts = [`Mask: ${info.mask}`, `${Math.round(info.transparent * 100)}% transparent`];
+            if (info.background) {
+                parts.push(`Background rgb(${info.background.join(', ')}), confidence ${info.confidence}`);
+                parts.push(`Effective tolerance ${info.tolerance}`);
+            }
+            parts.push(`${info.elapsed_ms} ms`);
+            previewStats.textContent = parts.join(' • ');
+        }
+        
+        async function handlePreviewSelect(e) {
+            const file = e.target.files[0];
+            if (!file) return;
+            hideError();
+            resetTolerance();
+            
+            const formData = new FormData();
+            formData.append('file', file);
+            previewParams().forEach((value, key) => formData.append(key, value));
+            
+            try {
+                const response = await fetch('/preview', { method: 'POST', body: formData });
+                const result = await response.json();
+                if (!response.ok) {
+                    throw new Error(result.error || 'Preview failed');
+                }
+                previewId = result.preview_id;
+                previewPanel.style.display = 'block';
+                refreshPreview();
+            } catch (error) {
+                showError('Preview failed: ' + error.message);
+            }
+            previewInput.value = '';
+        }
+        
+        async function refreshPreview() {
+            if (!previewId) return;
+            const requestedId = previewId;
+            const response = await fetch(`/preview/${previewId}?${previewParams()}`);
+            if (requestedId !== previewId) return;
+            if (!response.ok) {
+                const result = await response.json();
+                showError('Preview failed: ' + (result.error || response.status));
+                return;
+            }
+            URL.revokeObjectURL(previewImage.src);
+            previewImage.src = URL.createObjectURL(await response.blob());
+            showPreviewStats(JSON.parse(response.headers.get('X-Preview-Info')));
+        }
         
         function handleDragOver(e) {
             e.preventDefault();
@@ -468,56 +1140,91 @@ HTML_TEMPLATE = """
             e.preventDefault();
             dropZone.classList.remove('dragover');
             
-            const files = e.dataTransfer.files;
+            const files = Array.from(e.dataTransfer.files);
             if (files.length > 0) {
-                processFile(files[0]);
+                processFiles(files);
             }
         }
         
         function handleFileSelect(e) {
-            if (e.target.files.length > 0) {
-                processFile(e.target.files[0]);
+            const files = Array.from(e.target.files);
+            if (files.length > 0) {
+                processFiles(files);
             }
         }
         
         function showError(message) {
             errorText.textContent = message;
             errorCard.style.display = 'block';
-            processingCard.style.display = 'none';
         }
         
         function hideError() {
             errorCard.style.display = 'none';
         }
         
-        async function processFile(file) {
+        function createFileItem(fileId, filename) {
+            const item = document.createElement('div');
+            item.className = 'file-item';
+            item.id = `file-${fileId}`;
+            
+            item.innerHTML = `
+                <div class="file-details">
+                    <div class="file-name">${filename}</div>
+                    <div class="file-progress">
+                        <div class="file-progress-bar" id="progress-${fileId}"></div>
+                    </div>
+                    <div class="file-status" id="status-${fileId}">Waiting...</div>
+                </div>
+                <div class="file-actions">
+                    <button class="download-btn" id="download-${fileId}" onclick="downloadFile('${fileId}')">
+                        📥 Download
+                    </button>
+                </div>
+            `;
+            
+            return item;
+        }
+        
+        async function processFiles(files) {
             hideError();
             
-            // Validate file type
+            // Validate files
             const validTypes = ['image/jpeg', 'image/jpg', 'image/png', 'image/webp'];
-            if (!validTypes.includes(file.type) && !file.name.toLowerCase().endsWith('.avif')) {
-                showError('Please select a valid image file (JPG, PNG, WEBP, AVIF)');
-                return;
-            }
+            const validFiles = files.filter(file => 
+                validTypes.includes(file.type) || file.name.toLowerCase().endsWith('.avif')
+            );
             
-            // Validate file size (max 50MB)
-            if (file.size > 50 * 1024 * 1024) {
-                showError('File too large. Please select an image under 50MB.');
+            if (validFiles.length === 0) {
+                showError('No valid image files selected');
                 return;
             }
             
-            // Show processing card
-            processingCard.style.display = 'block';
-            downloadBtn.style.display = 'none';
+            // Show batch info
+            batchInfo.style.display = 'block';
+            batchText.textContent = `Processing ${validFiles.length} images...`;
+            
+            // Create file list
+            fileList.innerHTML = '';
+            fileList.style.display = 'block';
+            cleanupSection.style.display = 'none';
             
-            // Upload file
+            // Upload files
             const formData = new FormData();
-            formData.append('file', file);
+            validFiles.forEach(file => {
+                formData.append('files', file);
+            });
+            formData.append('profile', profileSelect.value);
+            formData.append('scale', scaleSelect.value);
+            formData.append('format', formatSelect.value);
+            formData.append('upscaler', upscalerSelect.value);
+            formData.append('refine', refineCheck.checked ? '1' : '0');
+            formData.append('sizes', sizesInput.value);
+            if (chosenTolerance !== null) {
+                formData.append('tolerance', chosenTolerance);
+            }
+            formData.append('client_id', clientId);
             
             try {
-                statusText.textContent = 'Uploading...';
-                progressBar.style.width = '10%';
-                
                 const response = await fetch('/upload', {
                     method: 'POST',
                     body: formData
@@ -529,95 +1236,228 @@ HTML_TEMPLATE = """
                     throw new Error(result.error || 'Upload failed');
                 }
                 
-                currentTaskId = result.task_id;
+                currentBatchId = result.batch_id;
+                const fileIds = result.file_ids;
                 
-                // Start polling for status
-                statusInterval = setInterval(checkStatus, 1000);
+                // Create file items
+                validFiles.forEach((file, index) => {
+                    const fileId = fileIds[index];
+                    const item = createFileItem(fileId, file.name);
+                    fileList.appendChild(item);
+                    fileStatuses[fileId] = { filename: file.name };
+                });
+                
+                // Listen for status updates
+                startStatusUpdates();
                 
             } catch (error) {
                 showError('Upload failed: ' + error.message);
             }
         }
         
-        async function checkStatus() {
-            if (!currentTaskId) return;
+        function updateFileStatus(fileId, fileStatus) {
+            const progressBar = document.getElementById(`progress-${fileId}`);
+            const statusText = document.getElementById(`status-${fileId}`);
+            const fileItem = document.getElementById(`file-${fileId}`);
+            const downloadBtn = document.getElementById(`download-${fileId}`);
+            
+            if (!progressBar || !statusText || !fileItem) return;
+            
+            progressBar.style.width = fileStatus.progress + '%';
+            
+            fileStatuses[fileId] = Object.assign(fileStatuses[fileId] || {}, { step: fileStatus.step });
+            
+            switch (fileStatus.step) {
+                case 'queued':
+                    statusText.textContent = fileStatus.queue_position > 0
+                        ? `⏳ Queued (${fileStatus.queue_position} ahead)`
+                        : '⏳ Next in queue';
+                    break;
+                case 'starting':
+                    statusText.textContent = 'Starting...';
+                    break;
+                case 'upscaling':
+                    statusText.textContent = `🔍 Upscaling ${scaleSelect.value}x...`;
+                    break;
+                case 'removing_bg':
+                    statusText.textContent = '🎭 Removing background...';
+                    break;
+                case 'saving':
+                    statusText.textContent = '💾 Saving...';
+                    break;
+                case 'complete':
+                    statusText.textContent = fileStatus.cached ? '♻️ Ready to download (cached)' : '✅ Ready to download';
+                    (fileStatus.sizes || []).forEach(size => {
+                        const link = document.createElement('a');
+                        link.href = `/download/${fileId}?size=${encodeURIComponent(size)}`;
+                        link.textContent = size;
+                        link.style.marginLeft = '8px';
+                        statusText.appendChild(link);
+                    });
+                    fileItem.className = 'file-item complete';
+                    downloadBtn.classList.add('visible');
+                    break;
+                case 'error':
+                    statusText.textContent = '❌ Error: ' + fileStatus.error;
+                    fileItem.className = 'file-item error';
+                    break;
+                default:
+                    statusText.textContent = 'Waiting...';
+            }
+        }
+        
+        function stopStatusUpdates() {
+            if (eventSource) {
+                eventSource.close();
+                eventSource = null;
+            }
+            clearInterval(statusInterval);
+            statusInterval = null;
+        }
+        
+        function handleBatchDone(status) {
+            stopStatusUpdates();
+            
+            if (status.step === 'error') {
+                showError('Batch processing failed: ' + status.error);
+                return;
+            }
+            
+            batchText.textContent = `✅ Batch complete: ${status.completed}/${status.total_files} images processed`;
+            if (status.cache && status.cache.hits > 0) {
+                batchText.textContent += ` (${status.cache.hits} reused from cache)`;
+            }
+            cleanupSection.style.display = 'block';
+        }
+        
+        function startStatusUpdates() {
+            stopStatusUpdates();
+            
+            // Push updates via Server-Sent Events, fall back to polling if unavailable
+            if (!window.EventSource) {
+                startPolling();
+                return;
+            }
+            
+            let received = false;
+            eventSource = new EventSource(`/batch-events/${currentBatchId}`);
+            
+            eventSource.addEventListener('file', (e) => {
+                received = true;
+                const event = JSON.parse(e.data);
+                updateFileStatus(event.file_id, event);
+            });
+            
+            eventSource.addEventListener('queue', (e) => {
+                received = true;
+                const event = JSON.parse(e.data);
+                Object.entries(event.positions).forEach(([fileId, position]) => {
+                    // Ignore stale positions for files that already started
+                    const known = fileStatuses[fileId];
+                    if (known && known.step && known.step !== 'queued') return;
+                    updateFileStatus(fileId, { step: 'queued', progress: 0, queue_position: position });
+                });
+            });
+            
+            eventSource.addEventListener('batch', (e) => {
+                const event = JSON.parse(e.data);
+                if (event.step === 'not_found') {
+                    startPolling();
+                } else {
+                    handleBatchDone(event);
+                }
+            });
+            
+            eventSource.onerror = () => {
+                // EventSource reconnects on its own; poll if it never got going
+                if (!received) {
+                    startPolling();
+                }
+            };
+        }
+        
+        function startPolling() {
+            stopStatusUpdates();
+            statusInterval = setInterval(checkBatchStatus, 1000);
+        }
+        
+        async function checkBatchStatus() {
+            if (!currentBatchId) return;
             
             try {
-                const response = await fetch(`/status/${currentTaskId}`);
+                const response = await fetch(`/batch-status/${currentBatchId}`);
                 const status = await response.json();
                 
-                progressBar.style.width = status.progress + '%';
+                // Update individual file statuses
+                if (status.file_statuses) {
+                    Object.entries(status.file_statuses).forEach(([fileId, fileStatus]) => {
+                        updateFileStatus(fileId, fileStatus);
+                    });
+                }
                 
-                switch (status.step) {
-                    case 'starting':
-                        statusText.textContent = 'Starting processing...';
-                        break;
-                    case 'upscaling':
-                        statusText.textContent = '🔍 Upscaling image 4x...';
-                        break;
-                    case 'removing_bg':
-                        statusText.textContent = '🎭 Removing background...';
-                        break;
-                    case 'saving':
-                        statusText.textContent = '💾 Saving processed image...';
-                        break;
-                    case 'complete':
-                        statusText.textContent = '✅ Processing complete!';
-                        downloadBtn.style.display = 'block';
-                        clearInterval(statusInterval);
-                        break;
-                    case 'error':
-                        showError('Processing failed: ' + status.error);
-                        clearInterval(statusInterval);
-                        break;
-                    default:
-                        statusText.textContent = 'Processing...';
+                if (status.step === 'complete' || status.step === 'error') {
+                    handleBatchDone(status);
                 }
                 
             } catch (error) {
                 showError('Status check failed: ' + error.message);
-                clearInterval(statusInterval);
+                stopStatusUpdates();
             }
         }
         
-        async function handleDownload() {
-            if (!currentTaskId) return;
-            
+        async function downloadFile(fileId) {
             try {
-                // Create download link
                 const link = document.createElement('a');
-                link.href = `/download/${currentTaskId}`;
-                link.download = `processed_image.png`;
+                link.href = `/download/${fileId}`;
+                link.download = '';
                 document.body.appendChild(link);
                 link.click();
                 document.body.removeChild(link);
                 
-                // Clean up after a delay
-                setTimeout(async () => {
-                    try {
-                        await fetch(`/cleanup/${currentTaskId}`, { method: 'POST' });
-                    } catch (e) {
-                        console.log('Cleanup failed:', e);
-                    }
-                }, 5000);
+            } catch (error) {
+                showError('Download failed: ' + error.message);
+            }
+        }
+        
+        async function handleDownloadAll() {
+            if (!currentBatchId) return;
+            
+            try {
+                const link = document.createElement('a');
+                link.href = `/download-batch/${currentBatchId}`;
+                link.download = `imageBoost_batch.zip`;
+                document.body.appendChild(link);
+                link.click();
+                document.body.removeChild(link);
                 
             } catch (error) {
                 showError('Download failed: ' + error.message);
             }
         }
+        
+        async function handleCleanup() {
+            if (!currentBatchId) return;
+            
+            try {
+                stopStatusUpdates();
+                await fetch(`/cleanup-batch/${currentBatchId}`, { method: 'POST' });
+                
+                // Reset UI
+                fileList.innerHTML = '';
+                fileList.style.display = 'none';
+                batchInfo.style.display = 'none';
+                cleanupSection.style.display = 'none';
+                currentBatchId = null;
+                fileStatuses = {};
+                
+            } catch (error) {
+                showError('Cleanup failed: ' + error.message);
+            }
+        }
     </script>
 </body>
 </html>
 """
 
 if __name__ == '__main__':
-    logger.info("🚀 Starting ImageBoost server...")
-    
-    # Load models on startup
-    load_models()
-    
-    logger.info("🌐 Server running at http://localhost:8587")
-    logger.info("📁 Upload dir: " + str(UPLOAD_DIR))
-    logger.info("📁 Output dir: " + str(OUTPUT_DIR))
-    
-    app.run(host='0.0.0.0', port=8587, debug=True, threaded=True)
\ No newline at end of file
+    run_server(profile='ai', label='AI Mode')
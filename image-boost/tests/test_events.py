@@ -0,0 +1,35 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import events
+
+
+def test_malformed_last_event_id_starts_from_the_beginning():
+    events.open_batch("b-malformed")
+    events.publish("b-malformed", {"type": "batch", "step": "complete"})
+
+    chunks = list(events.stream("b-malformed", "not-a-number"))
+
+    assert chunks[1].startswith("id: 0\n")
+
+
+def test_event_log_is_capped_and_ids_keep_counting(monkeypatch):
+    monkeypatch.setattr(events, "MAX_EVENTS_PER_BATCH", 3)
+    events.open_batch("b-capped")
+    for n in range(5):
+        events.publish("b-capped", {"type": "file", "n": n})
+
+    assert events.wait_for_events("b-capped", 0, timeout=0) == (2, [{"type": "file", "n": n} for n in (2, 3, 4)])
+    assert events.wait_for_events("b-capped", 4, timeout=0) == (4, [{"type": "file", "n": 4}])
+    events.discard("b-capped")
+
+
+def test_publish_after_discard_does_not_recreate_the_log():
+    events.open_batch("b-discarded")
+    events.discard("b-discarded")
+    events.publish("b-discarded", {"type": "file", "step": "complete"})
+
+    assert "b-discarded" not in events._events
+    assert events.wait_for_events("b-discarded", 0, timeout=0) is None
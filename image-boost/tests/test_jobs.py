@@ -0,0 +1,30 @@
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import jobs
+
+
+def test_remove_orphans_only_touches_job_files(tmp_path):
+    registry = jobs.JobRegistry(ttl_seconds=60, max_batches=10)
+    sweeper = jobs.Sweeper(registry, lambda batch_id: None, [tmp_path], 1 << 30, tmp_path)
+
+    def make(name, age):
+        path = tmp_path / name
+        path.write_bytes(b"x")
+        mtime = time.time() - age
+        os.utime(path, (mtime, mtime))
+        return path
+
+    orphan = make("0f8c6a2e-1111-4222-8333-944445555666_processed.png", 600)
+    upload_temp = make(".upload-abc123", 600)
+    fresh = make("0f8c6a2e-1111-4222-8333-944445555667_input.png", 5)
+    sample = make("sample.png", 600)
+    before_restart = make("6e865bd2-7ec0-47fb-a8a3-f9f9c2b510ca_processed.png", 7200)
+
+    assert sweeper.remove_orphans() == 3
+    assert not orphan.exists() and not upload_temp.exists() and not before_restart.exists()
+    assert fresh.exists() and sample.exists()
@@ -0,0 +1,31 @@
+import io
+import sys
+import zipfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import zipstream
+
+
+def test_duplicate_names_keep_their_size_folder(tmp_path):
+    entries = []
+    for upload in ("first", "second"):
+        source = tmp_path / f"{upload}.png"
+        source.write_bytes(upload.encode())
+        for folder in ("4x", "2x", "32px"):
+            entries.append((source, f"{folder}/a_processed.png"))
+
+    archive = zipfile.ZipFile(io.BytesIO(b"".join(zipstream.stream_zip(entries))))
+
+    assert archive.namelist() == [
+        "4x/a_processed.png", "2x/a_processed.png", "32px/a_processed.png",
+        "4x/a_processed_2.png", "2x/a_processed_2.png", "32px/a_processed_2.png",
+    ]
+    assert archive.read("2x/a_processed_2.png") == b"second"
+
+
+def test_duplicate_names_at_root():
+    used = set()
+    names = [zipstream._unique_name("a.png", used) for _ in range(3)]
+    assert names == ["a.png", "a_2.png", "a_3.png"]
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+ImageBoost - Streaming ZIP writer
+Builds a ZIP archive on the fly as a chunked response body, no temp file
+"""
+
+import zipfile
+from pathlib import Path, PurePosixPath
+
+CHUNK_SIZE = 1024 * 1024
+
+# Already-compressed formats are stored, deflating them again only burns CPU
+STORED_EXTENSIONS = {'.png', '.webp', '.avif', '.jpg', '.jpeg'}
+
+
+class _ChunkBuffer:
+    """Write-only file object that hands written bytes to the generator"""
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b''.join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def _unique_name(name, used):
+    """Append _2, _3, ... to repeated entry names"""
+    if name not in used:
+        used.add(name)
+        return name
+
+    # Keep the folder (e.g. "2x/") so every size of a repeated upload stays in its own directory
+    path = PurePosixPath(name)
+    n = 2
+    while str(path.parent / f"{path.stem}_{n}{path.suffix}") in used:
+        n += 1
+    name = str(path.parent / f"{path.stem}_{n}{path.suffix}")
+    used.add(name)
+    return name
+
+
+def stream_zip(entries):
+    """Yield ZIP bytes for an iterable of (file_path, entry_name) pairs
+
+    `entries` may be a generator that blocks until the next file is ready,
+    so a batch can be streamed while it is still processing.
+    """
+    buffer = _ChunkBuffer()
+    used_names = set()
+
+    # zipfile falls back to data descriptors when the output can't seek
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        for file_path, entry_name in entries:
+            entry_name = _unique_name(entry_name, used_names)
+            compression = zipfile.ZIP_STORED
+            if Path(entry_name).suffix.lower() not in STORED_EXTENSIONS:
+                compression = zipfile.ZIP_DEFLATED
+
+            info = zipfile.ZipInfo.from_file(file_path, entry_name)
+            info.compress_type = compression
+
+            with open(file_path, 'rb') as source, archive.open(info, 'w') as target:
+                while True:
+                    chunk = source.read(CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    target.write(chunk)
+                    data = buffer.drain()
+                    if data:
+                        yield data
+
+            data = buffer.drain()
+            if data:
+                yield data
+
+    # Central directory
+    yield buffer.drain()